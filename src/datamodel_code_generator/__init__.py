@@ -10,7 +10,7 @@ import contextlib
 import os
 import sys
 from collections import defaultdict
-from collections.abc import Callable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from datetime import datetime, timezone
 from functools import lru_cache as _lru_cache
 from pathlib import Path
@@ -24,6 +24,7 @@ from typing import (
     cast,
 )
 from urllib.parse import ParseResult
+from warnings import warn
 
 from typing_extensions import TypeAliasType, Unpack
 
@@ -61,6 +62,8 @@ from datamodel_code_generator.format import (
     Formatter,
     PythonVersion,
     PythonVersionMin,
+    get_code_formatter,
+    use_code_formatters,
 )
 from datamodel_code_generator.parser import DefaultPutDict, LiteralType
 
@@ -72,7 +75,10 @@ if TYPE_CHECKING:
         ParserConfigDict,
     )
     from datamodel_code_generator._types.generate_config_dict import GenerateConfigDict
+    from datamodel_code_generator.cache import Fingerprint, GenerationCache
     from datamodel_code_generator.config import GenerateConfig, ParserConfig
+    from datamodel_code_generator.model import DataModelSet
+    from datamodel_code_generator.parser.base import Parser, Result
 
     YamlScalar: TypeAlias = str | int | float | bool | None
     YamlValue = TypeAliasType("YamlValue", "dict[str, YamlValue] | list[YamlValue] | YamlScalar")
@@ -153,37 +159,54 @@ def _is_json_text(text: str) -> bool:
     return False
 
 
-def load_data(text: str) -> dict[str, YamlValue]:
+def load_data(text: str, *, lazy: bool = False) -> dict[str, YamlValue]:
     """Load text as JSON or YAML based on content.
 
     For stdin/string input: tries JSON first if content looks like JSON,
-    falls back to YAML on failure.
+    falls back to YAML on failure. With lazy=True, JSON definition containers
+    are indexed and their entries decoded on access; YAML is always loaded eagerly.
     """
     import json  # noqa: PLC0415
 
-    if _is_json_text(text):
-        with contextlib.suppress(json.JSONDecodeError):
-            result = json.loads(text)
-            if isinstance(result, dict):
-                return result
-    return load_yaml_dict(text)
+    from datamodel_code_generator.timings import timed_phase  # noqa: PLC0415
 
+    with timed_phase("load input"):
+        if _is_json_text(text):
+            with contextlib.suppress(json.JSONDecodeError):
+                if lazy:
+                    from datamodel_code_generator.parser._lazy_json import load_json_lazily  # noqa: PLC0415
 
-def load_data_from_path(path: Path, encoding: str) -> dict[str, YamlValue]:
+                    return load_json_lazily(text)
+                result = json.loads(text)
+                if isinstance(result, dict):
+                    return result
+        return load_yaml_dict(text)
+
+
+def load_data_from_path(path: Path, encoding: str, *, lazy: bool = False) -> dict[str, YamlValue]:
     """Load file as JSON or YAML based on file extension.
 
     For file input: tries json.load() for .json files (more efficient than
     read_text + json.loads), falls back to YAML if JSON parsing fails
     (e.g., trailing commas) or if content is not a dict. Uses YAML for all other extensions.
+    With lazy=True, .json files are loaded as in load_data(text, lazy=True).
     """
     import json  # noqa: PLC0415
 
-    if path.suffix.lower() == ".json":
-        with contextlib.suppress(json.JSONDecodeError), path.open(encoding=encoding) as f:
-            result = json.load(f)
-            if isinstance(result, dict):
-                return result
-    return load_yaml_dict_from_path(path, encoding)
+    from datamodel_code_generator.timings import timed_phase  # noqa: PLC0415
+
+    with timed_phase("load input"):
+        if lazy and path.suffix.lower() == ".json":
+            from datamodel_code_generator.parser._lazy_json import load_json_lazily  # noqa: PLC0415
+
+            with contextlib.suppress(json.JSONDecodeError):
+                return load_json_lazily(path.read_text(encoding=encoding))
+        elif path.suffix.lower() == ".json":
+            with contextlib.suppress(json.JSONDecodeError), path.open(encoding=encoding) as f:
+                result = json.load(f)
+                if isinstance(result, dict):
+                    return result
+        return load_yaml_dict_from_path(path, encoding)
 
 
 @_lru_cache(maxsize=256)
@@ -486,6 +509,86 @@ def _create_parser_config(
     return config_class.parse_obj(all_options)
 
 
+def _create_parser(  # noqa: PLR0913
+    config: GenerateConfig,
+    input_file_type: InputFileType,
+    source: str | Path | ParseResult | dict[str, Any],
+    additional_options: ParserConfigDict,
+    data_model_types: DataModelSet,
+    *,
+    jsonschema_version: JsonSchemaVersion | None,
+    openapi_version: OpenAPIVersion | None,
+    remote_object_cache: DefaultPutDict[str, dict[str, Any]] | None = None,
+) -> Parser[Any, Any]:
+    """Create the parser matching the input file type."""
+    from datamodel_code_generator.config import (  # noqa: PLC0415
+        GraphQLParserConfig,
+        JSONSchemaParserConfig,
+        OpenAPIParserConfig,
+    )
+
+    parser: Parser[Any, Any]
+    if input_file_type == InputFileType.OpenAPI:
+        from datamodel_code_generator.parser.openapi import OpenAPIParser  # noqa: PLC0415
+
+        openapi_additional_options: OpenAPIParserConfigDict = {
+            "openapi_scopes": config.openapi_scopes,
+            "include_path_parameters": config.include_path_parameters,
+            "use_status_code_in_response_name": config.use_status_code_in_response_name,
+            "openapi_include_paths": config.openapi_include_paths,
+            "openapi_reachable_from": config.openapi_reachable_from,
+            "openapi_version": openapi_version,
+            "remote_object_cache": remote_object_cache,
+            **additional_options,
+        }
+        parser_config = _create_parser_config(OpenAPIParserConfig, config, openapi_additional_options)
+        parser = OpenAPIParser(source=source, config=parser_config)  # ty: ignore
+    elif input_file_type == InputFileType.GraphQL:
+        from datamodel_code_generator.parser.graphql import GraphQLParser  # noqa: PLC0415
+
+        graphql_additional_options: GraphQLParserConfigDict = {
+            "data_model_scalar_type": data_model_types.scalar_model,
+            "data_model_union_type": data_model_types.union_model,
+            **additional_options,
+        }
+        parser_config = _create_parser_config(GraphQLParserConfig, config, graphql_additional_options)
+        parser = GraphQLParser(source=source, config=parser_config)  # ty: ignore
+    else:
+        from datamodel_code_generator.parser.jsonschema import JsonSchemaParser  # noqa: PLC0415
+
+        jsonschema_additional_options: JSONSchemaParserConfigDict = {
+            "jsonschema_version": jsonschema_version,
+            "remote_object_cache": remote_object_cache,
+            **additional_options,
+        }
+        parser_config = _create_parser_config(JSONSchemaParserConfig, config, jsonschema_additional_options)
+        parser = JsonSchemaParser(source=source, config=parser_config)  # ty: ignore
+    return parser
+
+
+def _resolve_generate_config(config: GenerateConfig | None, options: GenerateConfigDict) -> GenerateConfig:
+    """Return config, or a GenerateConfig validated from options when config is None."""
+    from datamodel_code_generator.config import GenerateConfig  # noqa: PLC0415
+
+    if config is not None and options:
+        msg = "Cannot specify both 'config' and keyword arguments. Use one or the other."
+        raise ValueError(msg)
+
+    if config is not None:
+        return config
+    if is_pydantic_v2():
+        from datamodel_code_generator.model.pydantic_v2 import UnionMode  # noqa: PLC0415
+        from datamodel_code_generator.types import StrictTypes  # noqa: PLC0415
+
+        GenerateConfig.model_rebuild(_types_namespace={"StrictTypes": StrictTypes, "UnionMode": UnionMode})
+        return GenerateConfig.model_validate(options)
+    from datamodel_code_generator.enums import UnionMode  # noqa: PLC0415
+    from datamodel_code_generator.types import StrictTypes  # noqa: PLC0415
+
+    GenerateConfig.update_forward_refs(StrictTypes=StrictTypes, UnionMode=UnionMode)
+    return GenerateConfig(**options)
+
+
 def generate(  # noqa: PLR0912, PLR0914, PLR0915
     input_: Path | str | ParseResult | Mapping[str, Any],
     *,
@@ -510,26 +613,22 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
 
     Raises:
         ValueError: If both config and **options are provided.
+        Error: If http_offline is set without http_cache_dir.
     """
-    from datamodel_code_generator.config import GenerateConfig  # noqa: PLC0415
-
-    if config is not None and options:
-        msg = "Cannot specify both 'config' and keyword arguments. Use one or the other."
-        raise ValueError(msg)
-
-    if config is None:
-        if is_pydantic_v2():
-            from datamodel_code_generator.model.pydantic_v2 import UnionMode  # noqa: PLC0415
-            from datamodel_code_generator.types import StrictTypes  # noqa: PLC0415
+    config = _resolve_generate_config(config, options)
+    if config.http_offline and config.http_cache_dir is None:
+        msg = "http_offline can not be used without http_cache_dir."
+        raise Error(msg)
 
-            GenerateConfig.model_rebuild(_types_namespace={"StrictTypes": StrictTypes, "UnionMode": UnionMode})
-            config = GenerateConfig.model_validate(options)
-        else:
-            from datamodel_code_generator.enums import UnionMode  # noqa: PLC0415
-            from datamodel_code_generator.types import StrictTypes  # noqa: PLC0415
+    if config.timings is not None:
+        from datamodel_code_generator.timings import Timings, get_timings, record_timings  # noqa: PLC0415
 
-            GenerateConfig.update_forward_refs(StrictTypes=StrictTypes, UnionMode=UnionMode)
-            config = GenerateConfig(**options)
+        if get_timings() is None:
+            timings = Timings()
+            with record_timings(timings), timings.phase("generate"):
+                generated_code = generate(input_, config=config)
+            timings.write_report(config.timings)
+            return generated_code
 
     # Variables that may be modified during processing
     input_filename = config.input_filename
@@ -540,14 +639,24 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
     dataclass_arguments = config.dataclass_arguments
     custom_file_header = config.custom_file_header
 
-    remote_text_cache: DefaultPutDict[str, str] = DefaultPutDict()
+    from datamodel_code_generator.cache import get_document_cache  # noqa: PLC0415
+
+    document_cache = get_document_cache()
+    remote_text_cache: DefaultPutDict[str, str] = (
+        document_cache.remote_text_cache if document_cache is not None else DefaultPutDict()
+    )
     match input_:
         case str():
             input_text: str | None = input_
         case ParseResult():
-            from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, get_body  # noqa: PLC0415
+            from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, HTTPCache, get_body  # noqa: PLC0415
 
             timeout = config.http_timeout if config.http_timeout is not None else DEFAULT_HTTP_TIMEOUT
+            http_cache = (
+                HTTPCache(config.http_cache_dir, offline=config.http_offline)
+                if config.http_cache_dir is not None
+                else None
+            )
             input_text = remote_text_cache.get_or_put(
                 input_.geturl(),
                 default_factory=lambda url: get_body(
@@ -556,6 +665,7 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
                     config.http_ignore_tls,
                     config.http_query_parameters,
                     timeout,
+                    cache=http_cache,
                 ),
             )
         case _:
@@ -704,12 +814,6 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
 
     defer_formatting = config.output is not None and not config.output.suffix
 
-    from datamodel_code_generator.config import (  # noqa: PLC0415
-        GraphQLParserConfig,
-        JSONSchemaParserConfig,
-        OpenAPIParserConfig,
-    )
-
     additional_options: ParserConfigDict = {
         "data_model_type": data_model_types.data_model,
         "data_model_root_type": data_model_types.root_model,
@@ -765,47 +869,48 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
                 msg = f"Invalid JSON Schema version: {config.schema_version}. Valid values: {valid}"
                 raise Error(msg) from None
 
-    if input_file_type == InputFileType.OpenAPI:
-        from datamodel_code_generator.parser.openapi import OpenAPIParser  # noqa: PLC0415
-
-        openapi_additional_options: OpenAPIParserConfigDict = {
-            "openapi_scopes": config.openapi_scopes,
-            "include_path_parameters": config.include_path_parameters,
-            "use_status_code_in_response_name": config.use_status_code_in_response_name,
-            "openapi_include_paths": config.openapi_include_paths,
-            "openapi_version": openapi_version,
-            **additional_options,
-        }
-        parser_config = _create_parser_config(OpenAPIParserConfig, config, openapi_additional_options)
-        parser = OpenAPIParser(source=source, config=parser_config)  # ty: ignore
-    elif input_file_type == InputFileType.GraphQL:
-        from datamodel_code_generator.parser.graphql import GraphQLParser  # noqa: PLC0415
-
-        graphql_additional_options: GraphQLParserConfigDict = {
-            "data_model_scalar_type": data_model_types.scalar_model,
-            "data_model_union_type": data_model_types.union_model,
-            **additional_options,
-        }
-        parser_config = _create_parser_config(GraphQLParserConfig, config, graphql_additional_options)
-        parser = GraphQLParser(source=source, config=parser_config)  # ty: ignore
-    else:
-        from datamodel_code_generator.parser.jsonschema import JsonSchemaParser  # noqa: PLC0415
-
-        jsonschema_additional_options: JSONSchemaParserConfigDict = {
-            "jsonschema_version": jsonschema_version,
-            **additional_options,
-        }
-        parser_config = _create_parser_config(JSONSchemaParserConfig, config, jsonschema_additional_options)
-        parser = JsonSchemaParser(source=source, config=parser_config)  # ty: ignore
+    generation_cache: GenerationCache | None = None
+    cache_key: str | None = None
+    results: str | dict[tuple[str, ...], Result] | None = None
+    parser: Parser[Any, Any] | None = None
+    template_cache_dir: Path | None = None
+    if config.cache_dir is not None:
+        from datamodel_code_generator.cache import (  # noqa: PLC0415
+            TEMPLATE_CACHE_DIRNAME,
+            GenerationCache,
+            input_location,
+        )
 
-    with chdir(config.output):
-        results = parser.parse(
-            settings_path=config.settings_path,
-            disable_future_imports=config.disable_future_imports,
-            all_exports_scope=config.all_exports_scope,
-            all_exports_collision_strategy=config.all_exports_collision_strategy,
-            module_split_mode=config.module_split_mode,
+        template_cache_dir = config.cache_dir / TEMPLATE_CACHE_DIRNAME
+
+        generation_cache = GenerationCache(config.cache_dir, config)
+        cache_key = generation_cache.make_key(source, remote_text_cache, input_location(input_, config.output))
+        if cache_key is not None:
+            results = generation_cache.load(cache_key)
+
+    if results is None:
+        parser = _create_parser(
+            config,
+            input_file_type,
+            source,
+            additional_options,
+            data_model_types,
+            jsonschema_version=jsonschema_version,
+            openapi_version=openapi_version,
+            remote_object_cache=document_cache.object_cache() if document_cache is not None else None,
         )
+        from datamodel_code_generator.model.base import use_template_bytecode_cache_dir  # noqa: PLC0415
+
+        with chdir(config.output), use_template_bytecode_cache_dir(template_cache_dir):
+            results = parser.parse(
+                settings_path=config.settings_path,
+                disable_future_imports=config.disable_future_imports,
+                all_exports_scope=config.all_exports_scope,
+                all_exports_collision_strategy=config.all_exports_collision_strategy,
+                module_split_mode=config.module_split_mode,
+            )
+        if results and generation_cache is not None and cache_key is not None:
+            generation_cache.store(cache_key, results, parser)
     if not input_filename:  # pragma: no cover
         match input_:
             case str():
@@ -824,6 +929,12 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
 
     if custom_file_header is None and config.custom_file_header_path:
         custom_file_header = config.custom_file_header_path.read_text(encoding=config.encoding)
+    if config.enable_fingerprint_header and custom_file_header:
+        warn(
+            "--enable-fingerprint-header is ignored when a custom file header is used",
+            UserWarning,
+            stacklevel=2,
+        )
 
     header = """\
 # generated by datamodel-codegen:
@@ -872,6 +983,24 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
             for name, result in sorted(results.items())
         }
 
+    fingerprint: Fingerprint | None = None
+    if config.enable_fingerprint_header and not custom_file_header:
+        from datamodel_code_generator.cache import Fingerprint, dependency_locations  # noqa: PLC0415
+
+        if parser is not None:
+            locations = dependency_locations(parser)
+        else:
+            assert generation_cache is not None
+            assert cache_key is not None
+            locations = generation_cache.load_dependencies(cache_key)
+        fingerprint = Fingerprint.create(
+            config,
+            input_,
+            remote_text_cache,
+            locations,
+            [] if isinstance(results, str) else [path.relative_to(output).as_posix() for path in modules],
+        )
+
     file: IO[Any] | None
     for path, (body, future_imports, filename) in modules.items():
         if not path.parent.exists():
@@ -880,6 +1009,8 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
 
         safe_filename = filename.replace("\n", " ").replace("\r", " ") if filename else ""
         effective_header = custom_file_header or header.format(safe_filename)
+        if fingerprint is not None:
+            effective_header += fingerprint.dependency_header()
 
         if custom_file_header and body:
             # Extract future imports from body for correct placement after custom_file_header
@@ -923,10 +1054,10 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
         and config.formatters
         and (Formatter.RUFF_CHECK in config.formatters or Formatter.RUFF_FORMAT in config.formatters)
     ):
-        code_formatter = CodeFormatter(
-            config.target_python_version,
-            config.settings_path,
-            config.wrap_string_literal,
+        code_formatter = get_code_formatter(
+            python_version=config.target_python_version,
+            settings_path=config.settings_path,
+            wrap_string_literal=config.wrap_string_literal,
             skip_string_normalization=not config.use_double_quotes,
             known_third_party=data_model_types.known_third_party,
             custom_formatters=config.custom_formatters,
@@ -936,9 +1067,67 @@ def generate(  # noqa: PLR0912, PLR0914, PLR0915
         )
         code_formatter.format_directory(output)
 
+    if fingerprint is not None:
+        for path in modules:
+            fingerprint.stamp(path, config.encoding)
+
     return None
 
 
+class Generator:
+    """Generate models from many inputs with one set of options.
+
+    The options are validated once, and the code formatters, which read the black and
+    isort settings from disk, are built once and reused by every input. Nothing else
+    is kept: each input still gets a new parser with its own ModelResolver and field
+    name resolvers, because they hold the naming state of that input, and Jinja
+    template environments are already cached process-wide. A Generator can be pickled
+    to send it to worker processes, as long as its config holds no callables.
+
+    Example:
+        >>> generator = Generator(input_file_type=InputFileType.JsonSchema)  # doctest: +SKIP
+        >>> results = generator.generate_many([schema_a, schema_b])  # doctest: +SKIP
+    """
+
+    def __init__(self, config: GenerateConfig | None = None, **options: Unpack[GenerateConfigDict]) -> None:
+        """Validate the options once. Accepts a GenerateConfig or its fields, like generate()."""
+        self.config: GenerateConfig = _resolve_generate_config(config, options)
+        self._code_formatters: dict[str, CodeFormatter] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the config only; formatters are rebuilt on first use."""
+        return {"config": self.config}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled Generator."""
+        self.config = state["config"]
+        self._code_formatters = {}
+
+    def generate(self, input_: Path | str | ParseResult | Mapping[str, Any]) -> str | GeneratedModules | None:
+        """Generate models from one input, returning the same values as the module-level function."""
+        with use_code_formatters(self._code_formatters):
+            return generate(input_, config=self.config)
+
+    def generate_many(
+        self, inputs: Iterable[Path | str | ParseResult | Mapping[str, Any]]
+    ) -> list[str | GeneratedModules | None]:
+        """Generate models from every input in order.
+
+        `$ref` documents loaded for one input are reused by the following ones, unless a
+        document cache is already installed with `use_document_cache`.
+        """
+        from datamodel_code_generator.cache import (  # noqa: PLC0415
+            DocumentCache,
+            get_document_cache,
+            use_document_cache,
+        )
+
+        if get_document_cache() is not None:
+            return [self.generate(input_) for input_ in inputs]
+        with use_document_cache(DocumentCache()):
+            return [self.generate(input_) for input_ in inputs]
+
+
 def infer_input_type(text: str) -> InputFileType:
     """Automatically detect the input file type from text content."""
     import yaml.parser  # noqa: PLC0415
@@ -967,10 +1156,14 @@ inferred_message = (
 
 
 _LAZY_IMPORTS = {
+    "DynamicModelsCache": "datamodel_code_generator.dynamic",
+    "DynamicModelsCacheInfo": "datamodel_code_generator.dynamic",
     "clear_dynamic_models_cache": "datamodel_code_generator.dynamic",
     "detect_jsonschema_version": "datamodel_code_generator.parser.schema_version",
     "detect_openapi_version": "datamodel_code_generator.parser.schema_version",
+    "dynamic_models_cache_info": "datamodel_code_generator.dynamic",
     "generate_dynamic_models": "datamodel_code_generator.dynamic",
+    "generate_dynamic_models_batch": "datamodel_code_generator.dynamic",
     "GenerateConfig": "datamodel_code_generator.config",
 }
 
@@ -1006,9 +1199,12 @@ __all__ = [
     "DateClassType",
     "DatetimeClassType",
     "DefaultPutDict",
+    "DynamicModelsCache",  # noqa: F822
+    "DynamicModelsCacheInfo",  # noqa: F822
     "Error",
     "FieldTypeCollisionStrategy",
     "GeneratedModules",
+    "Generator",
     "GraphQLScope",
     "InputFileType",
     "InputModelRefStrategy",
@@ -1030,8 +1226,10 @@ __all__ = [
     "clear_dynamic_models_cache",  # noqa: F822
     "detect_jsonschema_version",  # noqa: F822
     "detect_openapi_version",  # noqa: F822
+    "dynamic_models_cache_info",  # noqa: F822
     "generate",
     "generate_dynamic_models",  # noqa: F822
+    "generate_dynamic_models_batch",  # noqa: F822
 ]
 
 if is_pydantic_v2():  # pragma: no cover
@@ -74,7 +74,9 @@ from datamodel_code_generator import (
     generate,
 )
 from datamodel_code_generator.arguments import DEFAULT_ENCODING, arg_parser, namespace
+from datamodel_code_generator.enums import StrictTypes, UnionMode  # noqa: TC001 # needed for pydantic
 from datamodel_code_generator.format import (
+    DEFAULT_FORMATTERS,
     DateClassType,
     DatetimeClassType,
     Formatter,
@@ -83,14 +85,12 @@ from datamodel_code_generator.format import (
     _get_black,
     is_supported_in_black,
 )
-from datamodel_code_generator.model.pydantic_v2 import UnionMode  # noqa: TC001 # needed for pydantic
 from datamodel_code_generator.parser import LiteralType  # noqa: TC001 # needed for pydantic
-from datamodel_code_generator.reference import is_url
-from datamodel_code_generator.types import StrictTypes  # noqa: TC001 # needed for pydantic
 from datamodel_code_generator.util import (
     ConfigDict,
     field_validator,
     is_pydantic_v2,
+    is_url,
     load_toml,
     model_validator,
 )
@@ -101,6 +101,7 @@ if TYPE_CHECKING:
 
     from typing_extensions import Self
 
+    from datamodel_code_generator._types import GenerateConfigDict
     from datamodel_code_generator.validators import ModelValidators
 
 
@@ -201,6 +202,9 @@ class Config(BaseModel):
         "output",
         "custom_template_dir",
         "custom_file_header_path",
+        "cache_dir",
+        "timings",
+        "http_cache_dir",
         mode="before",
     )
     def validate_path(cls, value: Any) -> Path | None:  # noqa: N805
@@ -329,6 +333,7 @@ class Config(BaseModel):
     __validate_custom_file_header_err: ClassVar[str] = (
         "`--custom_file_header_path` can not be used with `--custom_file_header`."
     )
+    __validate_jobs_err: ClassVar[str] = "`--jobs` must be at least 1."
     __validate_keyword_only_err: ClassVar[str] = (
         f"`--keyword-only` requires `--target-python-version` {PythonVersion.PY_310.value} or higher."
     )
@@ -365,6 +370,13 @@ class Config(BaseModel):
                 raise Error(self.__validate_custom_file_header_err)
             return self
 
+        @model_validator()  # ty: ignore
+        def validate_jobs(self: Self) -> Self:  # ty: ignore
+            """Validate the number of worker processes is positive."""
+            if self.jobs < 1:
+                raise Error(self.__validate_jobs_err)
+            return self
+
         @model_validator()  # ty: ignore
         def validate_keyword_only(self: Self) -> Self:  # ty: ignore
             """Validate keyword-only compatibility with target Python version."""
@@ -440,6 +452,13 @@ class Config(BaseModel):
                 raise Error(cls.__validate_custom_file_header_err)
             return values
 
+        @model_validator()  # ty: ignore
+        def validate_jobs(cls, values: dict[str, Any]) -> dict[str, Any]:  # noqa: N805
+            """Validate the number of worker processes is positive."""
+            if values.get("jobs", 1) < 1:
+                raise Error(cls.__validate_jobs_err)
+            return values
+
         @model_validator()  # ty: ignore
         def validate_keyword_only(cls, values: dict[str, Any]) -> dict[str, Any]:  # noqa: N805
             """Validate keyword-only compatibility with target Python version."""
@@ -515,6 +534,7 @@ class Config(BaseModel):
     disable_timestamp: bool = False
     enable_version_header: bool = False
     enable_command_header: bool = False
+    enable_fingerprint_header: bool = False
     allow_population_by_field_name: bool = False
     allow_extra_fields: bool = False
     extra_fields: Optional[str] = None  # noqa: UP045
@@ -560,6 +580,7 @@ class Config(BaseModel):
     openapi_scopes: Optional[list[OpenAPIScope]] = [OpenAPIScope.Schemas]  # noqa: UP045
     include_path_parameters: bool = False
     openapi_include_paths: Optional[list[str]] = None  # noqa: UP045
+    openapi_reachable_from: Optional[list[str]] = None  # noqa: UP045
     graphql_no_typename: bool = False
     wrap_string_literal: Optional[bool] = None  # noqa: UP045
     use_title_as_name: bool = False
@@ -572,6 +593,9 @@ class Config(BaseModel):
     http_headers: Optional[Sequence[tuple[str, str]]] = None  # noqa: UP045
     http_ignore_tls: bool = False
     http_timeout: Optional[float] = None  # noqa: UP045
+    http_prefetch: bool = False
+    http_cache_dir: Optional[Path] = None  # noqa: UP045
+    http_offline: bool = False
     use_annotated: bool = False
     use_serialize_as_any: bool = False
     use_non_positive_negative_number_constrained_types: bool = False
@@ -624,6 +648,10 @@ class Config(BaseModel):
     watch_delay: float = 0.5
     schema_version: Optional[str] = None  # noqa: UP045
     schema_version_mode: Optional[VersionMode] = None  # noqa: UP045
+    cache_dir: Optional[Path] = None  # noqa: UP045
+    jobs: int = 1
+    lazy_definitions: bool = False
+    timings: Optional[Path] = None  # noqa: UP045
 
     def merge_args(self, args: Namespace) -> None:
         """Merge command-line arguments into config."""
@@ -926,9 +954,8 @@ def _load_validators_config(
         return None, f"Invalid validators configuration: {e}"
 
 
-def run_generate_from_config(  # noqa: PLR0913, PLR0917
+def _generate_options(  # noqa: PLR0913, PLR0917
     config: Config,
-    input_: Path | str | ParseResult,
     output: Path | None,
     extra_template_data: dict[str, Any] | None,
     aliases: dict[str, str] | None,
@@ -937,10 +964,11 @@ def run_generate_from_config(  # noqa: PLR0913, PLR0917
     settings_path: Path | None = None,
     validators: Mapping[str, ModelValidators] | None = None,
     default_value_overrides: dict[str, Any] | None = None,
-) -> None:
-    """Run code generation with the given config and parameters."""
-    result = generate(
-        input_=input_,
+) -> GenerateConfigDict:
+    """Return the generate() options for the given config and parameters."""
+    from datamodel_code_generator._types import GenerateConfigDict  # noqa: PLC0415
+
+    return GenerateConfigDict(
         input_file_type=config.input_file_type,
         output=output,
         output_model_type=config.output_model_type,
@@ -960,6 +988,7 @@ def run_generate_from_config(  # noqa: PLR0913, PLR0917
         disable_timestamp=config.disable_timestamp,
         enable_version_header=config.enable_version_header,
         enable_command_header=config.enable_command_header,
+        enable_fingerprint_header=config.enable_fingerprint_header,
         command_line=command_line,
         allow_population_by_field_name=config.allow_population_by_field_name,
         allow_extra_fields=config.allow_extra_fields,
@@ -1004,6 +1033,7 @@ def run_generate_from_config(  # noqa: PLR0913, PLR0917
         openapi_scopes=config.openapi_scopes,
         include_path_parameters=config.include_path_parameters,
         openapi_include_paths=config.openapi_include_paths,
+        openapi_reachable_from=config.openapi_reachable_from,
         graphql_no_typename=config.graphql_no_typename,
         wrap_string_literal=config.wrap_string_literal,
         use_title_as_name=config.use_title_as_name,
@@ -1016,6 +1046,9 @@ def run_generate_from_config(  # noqa: PLR0913, PLR0917
         http_headers=config.http_headers,
         http_ignore_tls=config.http_ignore_tls,
         http_timeout=config.http_timeout,
+        http_prefetch=config.http_prefetch,
+        http_cache_dir=config.http_cache_dir,
+        http_offline=config.http_offline,
         use_annotated=config.use_annotated,
         use_serialize_as_any=config.use_serialize_as_any,
         use_non_positive_negative_number_constrained_types=config.use_non_positive_negative_number_constrained_types,
@@ -1070,8 +1103,47 @@ def run_generate_from_config(  # noqa: PLR0913, PLR0917
         default_value_overrides=default_value_overrides,
         schema_version=config.schema_version,
         schema_version_mode=config.schema_version_mode,
+        cache_dir=config.cache_dir,
+        jobs=config.jobs,
+        lazy_definitions=config.lazy_definitions,
+        timings=config.timings,
     )
 
+
+def run_generate_from_config(  # noqa: PLR0913, PLR0917
+    config: Config,
+    input_: Path | str | ParseResult,
+    output: Path | None,
+    extra_template_data: dict[str, Any] | None,
+    aliases: dict[str, str] | None,
+    command_line: str | None,
+    custom_formatters_kwargs: dict[str, str] | None,
+    settings_path: Path | None = None,
+    validators: Mapping[str, ModelValidators] | None = None,
+    default_value_overrides: dict[str, Any] | None = None,
+) -> None:
+    """Run code generation with the given config and parameters."""
+    result = generate(
+        input_=input_,
+        **_generate_options(
+            config,
+            output,
+            extra_template_data,
+            aliases,
+            command_line,
+            custom_formatters_kwargs,
+            settings_path,
+            validators,
+            default_value_overrides,
+        ),
+    )
+
+    if config.timings is not None:
+        from datamodel_code_generator.timings import format_timings_report  # noqa: PLC0415
+
+        report = json.loads(config.timings.read_text(encoding="utf-8"))
+        print(format_timings_report(report), file=sys.stderr)  # noqa: T201
+
     if output is None and result is not None:  # pragma: no cover
         if isinstance(result, str):
             sys.stdout.write(result + "\n")
@@ -1185,7 +1257,8 @@ def main(args: Sequence[str] | None = None) -> Exit:  # noqa: PLR0911, PLR0912,
         )
         return Exit.ERROR
 
-    if not is_supported_in_black(config.target_python_version):  # pragma: no cover
+    formatters = config.formatters if config.formatters is not None else DEFAULT_FORMATTERS
+    if Formatter.BLACK in formatters and not is_supported_in_black(config.target_python_version):  # pragma: no cover
         print(  # noqa: T201
             f"Installed black doesn't support Python version {config.target_python_version.value}.\n"
             f"You have to install a newer black.\n"
@@ -1367,13 +1440,34 @@ def main(args: Sequence[str] | None = None) -> Exit:  # noqa: PLR0911, PLR0912,
         else:
             input_ = config.url or config.input or sys.stdin.read()
 
+        command_line = shlex.join(["datamodel-codegen", *args]) if config.enable_command_header else None
+        if config.check and config.enable_fingerprint_header:
+            from datamodel_code_generator import Generator  # noqa: PLC0415
+            from datamodel_code_generator.cache import fingerprints_match  # noqa: PLC0415
+
+            options = _generate_options(
+                config,
+                config.output,
+                extra_template_data,
+                aliases,
+                command_line,
+                custom_formatters_kwargs,
+                config.output,
+                validators_config,
+                default_value_overrides,
+            )
+            if fingerprints_match(Generator(**options).config, input_):
+                if temp_context is not None:  # pragma: no branch
+                    temp_context.cleanup()
+                return Exit.OK
+
         run_generate_from_config(
             config=config,
             input_=input_,
             output=generate_output,
             extra_template_data=extra_template_data,
             aliases=aliases,
-            command_line=shlex.join(["datamodel-codegen", *args]) if config.enable_command_header else None,
+            command_line=command_line,
             custom_formatters_kwargs=custom_formatters_kwargs,
             settings_path=config.output,
             validators=validators_config,
@@ -114,6 +114,9 @@ class ParserConfigDict(TypedDict):
     http_headers: NotRequired[Sequence[tuple[str, str]] | None]
     http_ignore_tls: NotRequired[bool]
     http_timeout: NotRequired[float | None]
+    http_prefetch: NotRequired[bool]
+    http_cache_dir: NotRequired[Path | None]
+    http_offline: NotRequired[bool]
     use_annotated: NotRequired[bool]
     use_serialize_as_any: NotRequired[bool]
     use_non_positive_negative_number_constrained_types: NotRequired[bool]
@@ -152,6 +155,8 @@ class ParserConfigDict(TypedDict):
     use_default_factory_for_optional_nested_models: NotRequired[bool]
     formatters: NotRequired[list[Formatter] | None]
     defer_formatting: NotRequired[bool]
+    jobs: NotRequired[int]
+    lazy_definitions: NotRequired[bool]
     parent_scoped_naming: NotRequired[bool]
     naming_strategy: NotRequired[NamingStrategy | None]
     duplicate_name_suffix: NotRequired[dict[str, str] | None]
@@ -173,6 +178,7 @@ class GraphQLParserConfigDict(ParserConfigDict, closed=True):
 class JSONSchemaParserConfigDict(ParserConfigDict):
     jsonschema_version: NotRequired[JsonSchemaVersion | None]
     schema_version_mode: NotRequired[VersionMode | None]
+    remote_object_cache: NotRequired[DefaultPutDict[str, dict[str, Any]] | None]
 
 
 class OpenAPIParserConfigDict(JSONSchemaParserConfigDict, closed=True):
@@ -180,6 +186,7 @@ class OpenAPIParserConfigDict(JSONSchemaParserConfigDict, closed=True):
     include_path_parameters: NotRequired[bool]
     use_status_code_in_response_name: NotRequired[bool]
     openapi_include_paths: NotRequired[list[str] | None]
+    openapi_reachable_from: NotRequired[list[str] | None]
     openapi_version: NotRequired[OpenAPIVersion | None]
 
 
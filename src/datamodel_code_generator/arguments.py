@@ -70,6 +70,19 @@ def _dataclass_arguments(value: str) -> DataclassArguments:
     return cast("DataclassArguments", result)
 
 
+def _positive_int(value: str) -> int:
+    """Parse an integer of at least 1."""
+    try:
+        result = int(value)
+    except ValueError as e:
+        msg = f"invalid int value: {value!r}"
+        raise ArgumentTypeError(msg) from e
+    if result < 1:
+        msg = f"must be at least 1, got {result}"
+        raise ArgumentTypeError(msg)
+    return result
+
+
 class SortingHelpFormatter(RawDescriptionHelpFormatter):
     """Help formatter that sorts arguments, adds color to section headers, and preserves epilog formatting."""
 
@@ -134,6 +147,25 @@ base_options.add_argument(
     default=None,
     help="Timeout in seconds for HTTP requests to remote hosts (default: 30)",
 )
+base_options.add_argument(
+    "--http-prefetch",
+    help="Fetch all remote $ref documents concurrently over pooled connections before parsing",
+    action="store_true",
+    default=None,
+)
+base_options.add_argument(
+    "--http-cache-dir",
+    type=Path,
+    default=None,
+    metavar="DIR",
+    help="Keep fetched remote documents in DIR and revalidate them with ETag/Last-Modified on later runs",
+)
+base_options.add_argument(
+    "--http-offline",
+    help="Serve remote documents only from --http-cache-dir without sending any request",
+    action="store_true",
+    default=None,
+)
 base_options.add_argument(
     "--input",
     help="Input file/directory (default: stdin)",
@@ -281,6 +313,13 @@ model_options.add_argument(
     action="store_true",
     default=None,
 )
+model_options.add_argument(
+    "--enable-fingerprint-header",
+    help="Write a fingerprint of the input, $ref documents, options and versions on file headers, "
+    "so that --check can confirm up-to-date output without generating it",
+    action="store_true",
+    default=None,
+)
 extra_fields_model_options.add_argument(
     "--extra-fields",
     help="Set the generated models to allow, forbid, or ignore extra fields.",
@@ -971,6 +1010,17 @@ openapi_options.add_argument(
     ),
     default=None,
 )
+openapi_options.add_argument(
+    "--openapi-reachable-from",
+    nargs="+",
+    metavar="SELECTOR",
+    help=(
+        "Generate only the components reachable through $ref from the selected roots. "
+        "Selectors: 'path:PATTERN' (fnmatch), 'operation:OPERATION_ID', 'tag:TAG' or 'schema:NAME'. "
+        "With '--openapi-scopes paths', only the selected operations are generated."
+    ),
+    default=None,
+)
 openapi_options.add_argument(
     "--validation",
     help="Deprecated: Enable validation (Only OpenAPI). this option is deprecated. it will be removed in future "
@@ -1026,6 +1076,13 @@ graphql_options.add_argument(
 # ======================================================================================
 # General options
 # ======================================================================================
+general_options.add_argument(
+    "--cache-dir",
+    type=Path,
+    default=None,
+    help="Directory for a persistent generation cache. Unchanged inputs, $ref documents, options and "
+    "templates reuse the previous result without parsing. Compiled templates are kept there as well.",
+)
 general_options.add_argument(
     "--check",
     action="store_true",
@@ -1091,6 +1148,27 @@ general_options.add_argument(
     default=False,
     help="Ignore pyproject.toml configuration",
 )
+general_options.add_argument(
+    "--jobs",
+    type=_positive_int,
+    default=None,
+    metavar="N",
+    help="Number of worker processes used to decode input files and format generated modules; "
+    "parsing and rendering stay in one process (default: 1)",
+)
+general_options.add_argument(
+    "--timings",
+    help="Write a per-phase wall time and peak memory report as JSON to FILE and print it as a table to stderr",
+    type=Path,
+    default=None,
+    metavar="FILE",
+)
+general_options.add_argument(
+    "--lazy-definitions",
+    help="Keep definitions/$defs/components.schemas entries of JSON inputs packed until they are used",
+    action="store_true",
+    default=None,
+)
 general_options.add_argument(
     "--profile",
     help="Use a named profile from pyproject.toml [tool.datamodel-codegen.profiles.<name>]",
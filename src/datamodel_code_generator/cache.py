@@ -0,0 +1,734 @@
+"""Persistent on-disk cache for generation results.
+
+Entries are content-addressed: the key is derived from the normalized input and
+its location, the effective GenerateConfig, the custom template directory, the
+source of the custom formatter modules, the formatter versions and settings, and the
+tool version.
+Each entry also records every document loaded while resolving `$ref`s, so a change
+in any of them invalidates the entry even though the input itself is unchanged.
+
+The same digests make up the fingerprint that `--enable-fingerprint-header` writes
+into generated modules, which lets `--check` confirm up-to-date output without
+parsing or rendering anything.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import ParseResult
+
+from datamodel_code_generator.parser import DefaultPutDict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+    from datamodel_code_generator.config import GenerateConfig
+    from datamodel_code_generator.http import HTTPCache
+    from datamodel_code_generator.parser.base import Parser, Result
+
+CACHE_FORMAT_VERSION = 1
+
+# Subdirectory of the cache directory holding compiled Jinja templates.
+TEMPLATE_CACHE_DIRNAME = "templates"
+
+# Options that control the cache itself and never influence the generated code.
+_KEY_EXCLUDED_OPTIONS: frozenset[str] = frozenset({
+    "cache_dir",
+    "timings",
+    "http_prefetch",
+    "http_cache_dir",
+    "http_offline",
+})
+
+# Header lines written by `--enable-fingerprint-header`.
+FINGERPRINT_HEADER = "#   fingerprint: "
+DEPENDENCY_HEADER = "#   dependency: "
+
+# Options that differ between a run and its `--check` without changing the generated code.
+# The custom template directory is covered by the hash of its content instead of its path.
+_FINGERPRINT_EXCLUDED_OPTIONS: frozenset[str] = _KEY_EXCLUDED_OPTIONS | {
+    "output",
+    "settings_path",
+    "custom_template_dir",
+    "command_line",
+    "jobs",
+}
+
+# Files black, isort and ruff read their settings from, and the pyproject.toml tables they use.
+_FORMATTER_SETTINGS_FILES: tuple[str, ...] = (
+    "pyproject.toml",
+    "ruff.toml",
+    ".ruff.toml",
+    ".isort.cfg",
+    "setup.cfg",
+    "tox.ini",
+    ".editorconfig",
+)
+_FORMATTER_TOOLS: tuple[str, ...] = ("black", "isort", "ruff")
+
+_FORMATTER_DISTRIBUTIONS: dict[str, str] = {
+    "black": "black",
+    "isort": "isort",
+    "ruff-check": "ruff",
+    "ruff-format": "ruff",
+}
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _normalize_text(text: str) -> bytes:
+    """Encode text with normalized line endings so CRLF and LF checkouts share entries."""
+    return text.replace("\r\n", "\n").encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values that json cannot handle natively, rejecting everything else."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Path):
+        return value.as_posix()
+    if isinstance(value, ParseResult):
+        return value.geturl()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    msg = f"Object of type {type(value).__name__} can not be part of a cache key"
+    raise TypeError(msg)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=_json_default)
+
+
+def _hash_directory(directory: Path) -> str:
+    """Hash every file below a directory together with its relative path."""
+    hasher = hashlib.sha256()
+    for path in sorted(p for p in directory.rglob("*") if p.is_file()):
+        hasher.update(path.relative_to(directory).as_posix().encode("utf-8"))
+        hasher.update(b"\0")
+        hasher.update(path.read_bytes().replace(b"\r\n", b"\n"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def _location_to_path(location: str) -> Path | None:
+    """Return the local path of a dependency location, or None for remote URLs."""
+    if location.startswith("file://"):
+        from urllib.parse import urlparse  # noqa: PLC0415
+        from urllib.request import url2pathname  # noqa: PLC0415
+
+        parsed = urlparse(location)
+        path = url2pathname(parsed.path)
+        if parsed.netloc:
+            path = f"//{parsed.netloc}{path}"
+        return Path(path)
+    if location.startswith(("http://", "https://")):
+        return None
+    return Path(location)
+
+
+def _input_digest(
+    source: str | Path | ParseResult | Mapping[str, Any],
+    remote_text_cache: DefaultPutDict[str, str],
+) -> str | None:
+    """Hash the input of a run, or return None when it can not be hashed."""
+    match source:
+        case str():
+            input_digest = _digest(_normalize_text(source))
+        case ParseResult():
+            input_digest = _digest(_normalize_text(remote_text_cache[source.geturl()]))
+        case Path() if not source.exists():
+            return None
+        case Path() if source.is_dir():
+            input_digest = _hash_directory(source)
+        case Path():
+            input_digest = _digest(source.read_bytes().replace(b"\r\n", b"\n"))
+        case _:
+            try:
+                input_digest = _digest(_dumps(dict(source)).encode("utf-8"))
+            except (TypeError, ValueError):
+                return None
+    return input_digest
+
+
+def input_location(input_: str | Path | ParseResult | Mapping[str, Any], output: Path | None) -> str:
+    """Return where relative `$ref`s of an input are resolved from.
+
+    That is the input path or URL itself, or for text and dict input the directory the
+    parser runs in, which is the output directory when there is one.
+    """
+    match input_:
+        case Path():
+            return input_.expanduser().resolve().as_posix()
+        case ParseResult():
+            return input_.geturl()
+        case _ if output is not None:
+            return (output if output.is_dir() else output.parent).resolve().as_posix()
+        case _:
+            return Path.cwd().as_posix()
+
+
+def _formatter_settings_directory(settings_path: Path | None) -> Path:
+    """Return the directory formatters read their settings from, like `CodeFormatter` does."""
+    if not settings_path:
+        return Path.cwd()
+    if settings_path.is_file():
+        return settings_path.parent
+    for directory in (settings_path, *settings_path.parents):
+        if directory.exists():
+            return directory
+    return Path.cwd()  # pragma: no cover
+
+
+def _formatter_settings(config: GenerateConfig) -> dict[str, Any]:
+    """Return the formatter settings found from the settings path up to the filesystem root.
+
+    Files are keyed by their distance from the settings directory and their name, so the
+    result does not depend on where the project is checked out.
+    """
+    from datamodel_code_generator.util import load_toml  # noqa: PLC0415
+
+    directory = _formatter_settings_directory(config.settings_path).resolve()
+    settings: dict[str, Any] = {}
+    for depth, parent in enumerate((directory, *directory.parents)):
+        for name in _FORMATTER_SETTINGS_FILES:
+            path = parent / name
+            if not path.is_file():
+                continue
+            if name == "pyproject.toml":
+                try:
+                    tools = load_toml(path).get("tool", {})
+                except (OSError, ValueError):
+                    tools = None
+                if tools is None or any(tool in tools for tool in _FORMATTER_TOOLS):
+                    settings[f"{depth}/{name}"] = (
+                        {tool: tools.get(tool) for tool in _FORMATTER_TOOLS} if tools is not None else None
+                    )
+            else:
+                settings[f"{depth}/{name}"] = _digest(path.read_bytes().replace(b"\r\n", b"\n"))
+    return settings
+
+
+def _formatter_versions(config: GenerateConfig) -> dict[str, str | None]:
+    """Return the installed version of every formatter the run uses."""
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    from datamodel_code_generator.format import DEFAULT_FORMATTERS  # noqa: PLC0415
+
+    versions: dict[str, str | None] = {}
+    for formatter in config.formatters if config.formatters is not None else DEFAULT_FORMATTERS:
+        distribution = _FORMATTER_DISTRIBUTIONS[formatter.value]
+        try:
+            versions[distribution] = version(distribution)
+        except PackageNotFoundError:  # pragma: no cover
+            versions[distribution] = None
+    return versions
+
+
+def _custom_formatter_sources(config: GenerateConfig) -> dict[str, str | None] | None:
+    """Hash the source of every custom formatter module, or of its package directory.
+
+    Modules that can not be found are recorded as None; the run itself reports them.
+    """
+    if not config.custom_formatters:
+        return None
+    from importlib.util import find_spec  # noqa: PLC0415
+
+    sources: dict[str, str | None] = {}
+    for name in config.custom_formatters:
+        try:
+            spec = find_spec(name)
+        except (ImportError, ValueError):
+            spec = None
+        origin = Path(spec.origin) if spec is not None and spec.origin else None
+        if origin is None or not origin.is_file():
+            sources[name] = None
+        elif spec is not None and spec.submodule_search_locations:
+            sources[name] = _hash_directory(origin.parent)
+        else:
+            sources[name] = _digest(origin.read_bytes().replace(b"\r\n", b"\n"))
+    return sources
+
+
+def _key_data(
+    config: GenerateConfig,
+    input_digest: str,
+    excluded: frozenset[str],
+    *,
+    location: str | None,
+) -> str | None:
+    """Serialize everything besides `$ref` documents that determines the generated code.
+
+    Returns None when the config can not be serialized, e.g. when it holds callables
+    such as a custom class name generator.
+    """
+    from datamodel_code_generator import get_version  # noqa: PLC0415
+    from datamodel_code_generator.util import model_dump  # noqa: PLC0415
+
+    options = {k: v for k, v in model_dump(config).items() if k not in excluded}
+    template_dir = config.custom_template_dir
+    try:
+        return _dumps({
+            "format": CACHE_FORMAT_VERSION,
+            "version": get_version(),
+            "input": input_digest,
+            "location": location,
+            "config": options,
+            "templates": _hash_directory(template_dir) if template_dir and template_dir.is_dir() else None,
+            "custom_formatters": _custom_formatter_sources(config),
+            "formatters": _formatter_versions(config),
+            "formatter_settings": _formatter_settings(config),
+        })
+    except (TypeError, ValueError):
+        return None
+
+
+def _http_cache(config: GenerateConfig) -> HTTPCache | None:
+    """Return the HTTP cache remote dependencies are read through, if config has one."""
+    if config.http_cache_dir is None:
+        return None
+    from datamodel_code_generator.http import HTTPCache  # noqa: PLC0415
+
+    return HTTPCache(config.http_cache_dir, offline=config.http_offline)
+
+
+def _read_location(location: str, config: GenerateConfig, http_cache: HTTPCache | None) -> bytes | None:
+    """Read the current content of a local path or URL, or None if it can not be read."""
+    path = _location_to_path(location)
+    if path is not None:
+        try:
+            return path.read_bytes().replace(b"\r\n", b"\n")
+        except OSError:
+            return None
+
+    from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, get_body  # noqa: PLC0415
+
+    timeout = config.http_timeout if config.http_timeout is not None else DEFAULT_HTTP_TIMEOUT
+    try:
+        text = get_body(
+            location,
+            config.http_headers,
+            config.http_ignore_tls,
+            config.http_query_parameters,
+            timeout,
+            cache=http_cache,
+        )
+    except Exception:  # noqa: BLE001
+        return None
+    return _normalize_text(text)
+
+
+def dependency_locations(parser: Parser[Any, Any]) -> list[str]:
+    """Return the paths and URLs of every document the parser loaded while resolving `$ref`s."""
+    locations = set(parser.remote_text_cache.keys()) | set(getattr(parser, "remote_object_cache", {}).keys())
+    return sorted(locations)
+
+
+class GenerationCache:
+    """Content-addressed store of parser results keyed by input, config and tool version."""
+
+    def __init__(self, directory: Path, config: GenerateConfig) -> None:
+        """Initialize the cache rooted at directory for the given generation config."""
+        self.directory = directory
+        self.config = config
+
+    def make_key(
+        self,
+        source: str | Path | ParseResult | Mapping[str, Any],
+        remote_text_cache: DefaultPutDict[str, str],
+        location: str,
+    ) -> str | None:
+        """Compute the cache key for a generation run.
+
+        location is where relative `$ref`s are resolved from, see `input_location`. The
+        recorded dependencies are absolute, so an identical input in another directory
+        gets its own entry instead of reusing documents resolved against the first one.
+
+        Returns None when the run can not be cached, e.g. when the config holds
+        callables such as a custom class name generator.
+        """
+        input_digest = _input_digest(source, remote_text_cache)
+        if input_digest is None:
+            return None
+        key_data = _key_data(self.config, input_digest, _KEY_EXCLUDED_OPTIONS, location=location)
+        if key_data is None:
+            return None
+        return _digest(key_data.encode("utf-8"))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read_dependency(self, location: str, http_cache: HTTPCache | None) -> bytes | None:
+        """Read the current content of a dependency, or None if it is gone."""
+        return _read_location(location, self.config, http_cache)
+
+    def load_dependencies(self, key: str) -> list[str]:
+        """Return the locations of the documents recorded with the entry for key."""
+        try:
+            entry = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):  # pragma: no cover
+            return []
+        return [dependency["location"] for dependency in entry.get("dependencies", [])]
+
+    def load(self, key: str) -> str | dict[tuple[str, ...], Result] | None:
+        """Return cached parser results for key if every recorded dependency is unchanged."""
+        entry_path = self._entry_path(key)
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("format") != CACHE_FORMAT_VERSION:
+            return None
+
+        http_cache = _http_cache(self.config)
+        for dependency in entry["dependencies"]:
+            content = self._read_dependency(dependency["location"], http_cache)
+            if content is None or _digest(content) != dependency["digest"]:
+                return None
+
+        if "body" in entry:
+            return entry["body"]
+
+        from datamodel_code_generator.parser.base import Result  # noqa: PLC0415
+
+        return {
+            tuple(module["name"]): Result(
+                body=module["body"],
+                future_imports=module["future_imports"],
+                source=Path(module["source"]) if module["source"] is not None else None,
+            )
+            for module in entry["modules"]
+        }
+
+    def store(
+        self,
+        key: str,
+        results: str | dict[tuple[str, ...], Result],
+        parser: Parser[Any, Any],
+    ) -> None:
+        """Store parser results together with the documents the parser loaded."""
+        remote_text_cache = parser.remote_text_cache
+        dependencies: list[dict[str, str]] = []
+        http_cache = _http_cache(self.config)
+        for location in dependency_locations(parser):
+            if location in remote_text_cache and _location_to_path(location) is None:
+                content: bytes | None = _normalize_text(remote_text_cache[location])
+            else:
+                content = self._read_dependency(location, http_cache)
+            if content is None:  # pragma: no cover
+                return
+            dependencies.append({"location": location, "digest": _digest(content)})
+
+        entry: dict[str, Any] = {"format": CACHE_FORMAT_VERSION, "dependencies": dependencies}
+        if isinstance(results, str):
+            entry["body"] = results
+        else:
+            entry["modules"] = [
+                {
+                    "name": list(name),
+                    "body": result.body,
+                    "future_imports": result.future_imports,
+                    "source": result.source.as_posix() if result.source is not None else None,
+                }
+                for name, result in results.items()
+            ]
+
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            Path(temp_name).replace(entry_path)
+        except BaseException:  # pragma: no cover
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+
+def _run_digest(
+    config: GenerateConfig,
+    input_digest: str,
+    dependency_digests: Iterable[str],
+    module_paths: Iterable[str],
+) -> str | None:
+    key_data = _key_data(config, input_digest, _FINGERPRINT_EXCLUDED_OPTIONS, location=None)
+    if key_data is None:
+        return None
+    return _digest(
+        _dumps({
+            "key": key_data,
+            "dependencies": sorted(dependency_digests),
+            "modules": sorted(module_paths),
+        }).encode("utf-8")
+    )[:32]
+
+
+def _module_digest(text: str) -> str:
+    return _digest(_normalize_text(text))[:32]
+
+
+def _header_end(lines: list[str]) -> int:
+    """Return the index of the first line after the `# generated by datamodel-codegen:` block."""
+    end = 1
+    while end < len(lines) and lines[end].startswith("#   "):
+        end += 1
+    return end
+
+
+def _dependency_base(input_: str | Path | ParseResult | Mapping[str, Any]) -> Path:
+    """Return the directory local dependencies are written relative to: the input's, or the working directory."""
+    if isinstance(input_, Path):
+        input_ = input_.expanduser().resolve()
+        return input_ if input_.is_dir() else input_.parent
+    return Path.cwd()
+
+
+def _relative_location(location: str, directory: Path) -> str:
+    """Write a local dependency relative to directory so that the header does not depend on the checkout."""
+    path = _location_to_path(location)
+    if path is None:
+        return location
+    try:
+        return Path(os.path.relpath(path, directory)).as_posix()
+    except ValueError:  # pragma: no cover
+        return path.as_posix()
+
+
+class Fingerprint:
+    """Fingerprint of a generation run, written to the header of every module it outputs.
+
+    The fingerprint line of a module holds two digests. The first covers the input, the
+    `$ref` documents, the options, the tool and formatter versions and the set of written
+    modules. The second covers the module text, so edits of generated files are noticed.
+    The `$ref` documents are listed on dependency lines, relative to the input, which lets
+    `fingerprints_match` recompute the first digest without parsing the input.
+    """
+
+    def __init__(self, run_digest: str, dependencies: list[str], base: Path) -> None:
+        """Initialize from the digest of the run, the locations of its `$ref` documents and their base."""
+        self.run_digest = run_digest
+        self.dependencies = dependencies
+        self.base = base
+
+    @classmethod
+    def create(
+        cls,
+        config: GenerateConfig,
+        input_: str | Path | ParseResult | Mapping[str, Any],
+        remote_text_cache: DefaultPutDict[str, str],
+        locations: Iterable[str],
+        module_paths: Iterable[str],
+    ) -> Fingerprint | None:
+        """Fingerprint a run, or return None when its input or options can not be hashed.
+
+        Documents below an input path are left out, since the input digest covers them.
+        """
+        input_digest = _input_digest(input_, remote_text_cache)
+        if input_digest is None:
+            return None
+        input_path = input_.resolve() if isinstance(input_, Path) else None
+        dependencies: list[str] = []
+        digests: list[str] = []
+        http_cache = _http_cache(config)
+        for location in locations:
+            path = _location_to_path(location)
+            if isinstance(input_, ParseResult) and location == input_.geturl():
+                continue
+            if input_path is not None and path is not None and path.resolve().is_relative_to(input_path):
+                continue
+            if path is None and location in remote_text_cache:
+                content: bytes | None = _normalize_text(remote_text_cache[location])
+            else:
+                content = _read_location(location, config, http_cache)
+            if content is None:  # pragma: no cover
+                return None
+            dependencies.append(location)
+            digests.append(_digest(content))
+        run_digest = _run_digest(config, input_digest, digests, module_paths)
+        if run_digest is None:
+            return None
+        return cls(run_digest, dependencies, _dependency_base(input_))
+
+    def dependency_header(self) -> str:
+        """Return the dependency lines to append to the header of every module."""
+        return "".join(
+            f"\n{DEPENDENCY_HEADER}{_relative_location(location, self.base)}" for location in self.dependencies
+        )
+
+    def stamp(self, path: Path, encoding: str) -> None:
+        """Add the fingerprint line to the header of a written module."""
+        text = path.read_text(encoding=encoding)
+        lines = text.split("\n")
+        lines.insert(_header_end(lines), f"{FINGERPRINT_HEADER}{self.run_digest}-{_module_digest(text)}")
+        path.write_text("\n".join(lines), encoding=encoding)
+
+
+def _read_stamp(path: Path, encoding: str, base: Path) -> tuple[str, list[str]] | None:
+    """Return the run digest and dependency locations stamped into an unmodified module.
+
+    Returns None when the module has no fingerprint line or was changed after it was written.
+    """
+    try:
+        lines = _normalize_text(path.read_text(encoding=encoding)).decode("utf-8").split("\n")
+    except (OSError, UnicodeError):
+        return None
+    end = _header_end(lines)
+    stamps = [index for index in range(1, end) if lines[index].startswith(FINGERPRINT_HEADER)]
+    if len(stamps) != 1:
+        return None
+    run_digest, _, module_digest = lines.pop(stamps[0]).removeprefix(FINGERPRINT_HEADER).partition("-")
+    if _module_digest("\n".join(lines)) != module_digest:
+        return None
+    dependencies: list[str] = []
+    for line in lines[1 : _header_end(lines)]:
+        if not line.startswith(DEPENDENCY_HEADER):
+            continue
+        location = line.removeprefix(DEPENDENCY_HEADER)
+        if _location_to_path(location) is not None:
+            location = str((base / location).resolve())
+        dependencies.append(location)
+    return run_digest, dependencies
+
+
+def fingerprints_match(config: GenerateConfig, input_: str | Path | ParseResult) -> bool:
+    """Return whether the output of config was written by a run with the same fingerprint.
+
+    Only the input, the recorded `$ref` documents and the written modules are read; nothing
+    is parsed or rendered. Returns False on any mismatch, so callers fall back to generating
+    the output and comparing it.
+    """
+    output = config.output
+    if output is None or not output.exists():
+        return False
+    if output.suffix:
+        paths = [output]
+        module_paths: list[str] = []
+    else:
+        paths = sorted(path for path in output.rglob("*.py") if "__pycache__" not in path.parts)
+        module_paths = [path.relative_to(output).as_posix() for path in paths]
+    base = _dependency_base(input_)
+    stamps = [_read_stamp(path, config.encoding, base) for path in paths]
+    if not stamps or None in stamps or len({stamp[0] for stamp in stamps if stamp is not None}) != 1:
+        return False
+    run_digest, dependencies = cast("tuple[str, list[str]]", stamps[0])
+
+    http_cache = _http_cache(config)
+    if isinstance(input_, ParseResult):
+        content = _read_location(input_.geturl(), config, http_cache)
+        input_digest = _digest(content) if content is not None else None
+    else:
+        input_digest = _input_digest(input_.expanduser().resolve() if isinstance(input_, Path) else input_, {})
+    if input_digest is None:
+        return False
+    digests: list[str] = []
+    for location in dependencies:
+        content = _read_location(location, config, http_cache)
+        if content is None:
+            return False
+        digests.append(_digest(content))
+    return _run_digest(config, input_digest, digests, module_paths) == run_digest
+
+
+class _RunDocuments(DefaultPutDict[str, dict[str, Any]]):
+    """`$ref` documents of one generation run, copied from the documents of a `DocumentCache`.
+
+    Parsers modify the documents they resolve, e.g. the OpenAPI parser adds path-level
+    parameters to the operations of a path item. Each run therefore gets copies, and the
+    cache keeps the documents as they were loaded.
+    """
+
+    def __init__(self, documents: dict[str, dict[str, Any]]) -> None:
+        super().__init__()
+        self._documents = documents
+
+    def get_or_put(
+        self,
+        key: str,
+        default: dict[str, Any] | None = None,
+        default_factory: Callable[[str], dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Get the run's copy of the document for key, loading the document if no run has."""
+        if key in self:
+            return self[key]
+        if key not in self._documents:
+            self._documents[key] = copy.deepcopy(super().get_or_put(key, default, default_factory))
+            return self[key]
+        value = self[key] = copy.deepcopy(self._documents[key])
+        return value
+
+
+class DocumentCache:
+    """Loaded `$ref` documents shared by consecutive generation runs of a long-lived process.
+
+    Local documents are evicted with `invalidate` when they change on disk, so a run only
+    reloads the files that were actually modified. Remote documents are kept until the
+    cache is discarded. Every run resolves references against copies of the decoded
+    documents, see `object_cache`.
+
+    Only loading is shared: each run still parses the input and resolves every reference.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty text and document caches."""
+        self.remote_text_cache: DefaultPutDict[str, str] = DefaultPutDict()
+        self._documents: dict[str, dict[str, Any]] = {}
+
+    def object_cache(self) -> DefaultPutDict[str, dict[str, Any]]:
+        """Return the decoded `$ref` documents for one generation run."""
+        return _RunDocuments(self._documents)
+
+    def invalidate(self, paths: Iterable[Path]) -> set[str]:
+        """Evict every cached document loaded from one of paths and return the evicted keys."""
+        changed = {path.resolve() for path in paths}
+        evicted: set[str] = set()
+        for cache in (self.remote_text_cache, self._documents):
+            for location in list(cache.keys()):
+                path = _location_to_path(location)
+                if path is not None and path.resolve() in changed:
+                    del cache[location]
+                    evicted.add(location)
+        return evicted
+
+
+_active_document_cache: ContextVar[DocumentCache | None] = ContextVar("_active_document_cache", default=None)
+
+
+def get_document_cache() -> DocumentCache | None:
+    """Return the document cache installed by `use_document_cache`, if any."""
+    return _active_document_cache.get()
+
+
+@contextmanager
+def use_document_cache(document_cache: DocumentCache) -> Iterator[DocumentCache]:
+    """Make generate() calls in the current context load `$ref` documents through document_cache."""
+    token = _active_document_cache.set(document_cache)
+    try:
+        yield document_cache
+    finally:
+        _active_document_cache.reset(token)
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "DEPENDENCY_HEADER",
+    "FINGERPRINT_HEADER",
+    "TEMPLATE_CACHE_DIRNAME",
+    "DocumentCache",
+    "Fingerprint",
+    "GenerationCache",
+    "dependency_locations",
+    "fingerprints_match",
+    "get_document_cache",
+    "input_location",
+    "use_document_cache",
+]
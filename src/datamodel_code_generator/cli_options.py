@@ -230,6 +230,7 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
     "--disable-timestamp": CLIOptionMeta(name="--disable-timestamp", category=OptionCategory.TEMPLATE),
     "--enable-version-header": CLIOptionMeta(name="--enable-version-header", category=OptionCategory.TEMPLATE),
     "--enable-command-header": CLIOptionMeta(name="--enable-command-header", category=OptionCategory.TEMPLATE),
+    "--enable-fingerprint-header": CLIOptionMeta(name="--enable-fingerprint-header", category=OptionCategory.TEMPLATE),
     "--formatters": CLIOptionMeta(name="--formatters", category=OptionCategory.TEMPLATE),
     "--custom-formatters": CLIOptionMeta(name="--custom-formatters", category=OptionCategory.TEMPLATE),
     "--custom-formatters-kwargs": CLIOptionMeta(name="--custom-formatters-kwargs", category=OptionCategory.TEMPLATE),
@@ -246,6 +247,7 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
     ),
     "--include-path-parameters": CLIOptionMeta(name="--include-path-parameters", category=OptionCategory.OPENAPI),
     "--openapi-include-paths": CLIOptionMeta(name="--openapi-include-paths", category=OptionCategory.OPENAPI),
+    "--openapi-reachable-from": CLIOptionMeta(name="--openapi-reachable-from", category=OptionCategory.OPENAPI),
     "--validation": CLIOptionMeta(
         name="--validation",
         category=OptionCategory.OPENAPI,
@@ -259,12 +261,19 @@ CLI_OPTION_META: dict[str, CLIOptionMeta] = {
     # ==========================================================================
     # General Options
     # ==========================================================================
+    "--cache-dir": CLIOptionMeta(name="--cache-dir", category=OptionCategory.GENERAL),
     "--check": CLIOptionMeta(name="--check", category=OptionCategory.GENERAL),
     "--http-headers": CLIOptionMeta(name="--http-headers", category=OptionCategory.GENERAL),
     "--http-ignore-tls": CLIOptionMeta(name="--http-ignore-tls", category=OptionCategory.GENERAL),
     "--http-query-parameters": CLIOptionMeta(name="--http-query-parameters", category=OptionCategory.GENERAL),
     "--http-timeout": CLIOptionMeta(name="--http-timeout", category=OptionCategory.GENERAL),
+    "--http-prefetch": CLIOptionMeta(name="--http-prefetch", category=OptionCategory.GENERAL),
+    "--http-cache-dir": CLIOptionMeta(name="--http-cache-dir", category=OptionCategory.GENERAL),
+    "--http-offline": CLIOptionMeta(name="--http-offline", category=OptionCategory.GENERAL),
     "--ignore-pyproject": CLIOptionMeta(name="--ignore-pyproject", category=OptionCategory.GENERAL),
+    "--jobs": CLIOptionMeta(name="--jobs", category=OptionCategory.GENERAL),
+    "--lazy-definitions": CLIOptionMeta(name="--lazy-definitions", category=OptionCategory.GENERAL),
+    "--timings": CLIOptionMeta(name="--timings", category=OptionCategory.GENERAL),
     "--generate-cli-command": CLIOptionMeta(name="--generate-cli-command", category=OptionCategory.GENERAL),
     "--generate-pyproject-config": CLIOptionMeta(name="--generate-pyproject-config", category=OptionCategory.GENERAL),
     "--shared-module-name": CLIOptionMeta(name="--shared-module-name", category=OptionCategory.GENERAL),
@@ -55,6 +55,7 @@ from datamodel_code_generator.validators import ModelValidators  # noqa: TC001 -
 CallableSchema = Callable[[str], str]
 DumpResolveReferenceAction = Callable[[Iterable[str]], str]
 DefaultPutDictSchema = DefaultPutDict[str, str]
+DefaultPutDictObjectSchema = DefaultPutDict[str, dict[str, Any]]
 if TYPE_CHECKING:
     ExtraTemplateDataType = defaultdict[str, dict[str, Any]]
 elif is_pydantic_v2():
@@ -97,6 +98,7 @@ class GenerateConfig(BaseModel):
     disable_timestamp: bool = False
     enable_version_header: bool = False
     enable_command_header: bool = False
+    enable_fingerprint_header: bool = False
     command_line: str | None = None
     allow_population_by_field_name: bool = False
     allow_extra_fields: bool = False
@@ -142,6 +144,7 @@ class GenerateConfig(BaseModel):
     openapi_scopes: list[OpenAPIScope] | None = None
     include_path_parameters: bool = False
     openapi_include_paths: list[str] | None = None
+    openapi_reachable_from: list[str] | None = None
     graphql_scopes: list[GraphQLScope] | None = None
     graphql_no_typename: bool = False
     wrap_string_literal: bool | None = None
@@ -155,6 +158,9 @@ class GenerateConfig(BaseModel):
     http_headers: Sequence[tuple[str, str]] | None = None
     http_ignore_tls: bool = False
     http_timeout: float | None = None
+    http_prefetch: bool = False
+    http_cache_dir: Path | None = None
+    http_offline: bool = False
     use_annotated: bool = False
     use_serialize_as_any: bool = False
     use_non_positive_negative_number_constrained_types: bool = False
@@ -208,6 +214,10 @@ class GenerateConfig(BaseModel):
     default_value_overrides: Mapping[str, Any] | None = None
     schema_version: str | None = None
     schema_version_mode: VersionMode | None = None
+    cache_dir: Path | None = None
+    jobs: int = 1
+    lazy_definitions: bool = False
+    timings: Path | None = None
 
 
 class ParserConfig(BaseModel):
@@ -293,6 +303,9 @@ class ParserConfig(BaseModel):
     http_headers: Sequence[tuple[str, str]] | None = None
     http_ignore_tls: bool = False
     http_timeout: float | None = None
+    http_prefetch: bool = False
+    http_cache_dir: Path | None = None
+    http_offline: bool = False
     use_annotated: bool = False
     use_serialize_as_any: bool = False
     use_non_positive_negative_number_constrained_types: bool = False
@@ -331,6 +344,8 @@ class ParserConfig(BaseModel):
     use_default_factory_for_optional_nested_models: bool = False
     formatters: list[Formatter] | None = None
     defer_formatting: bool = False
+    jobs: int = 1
+    lazy_definitions: bool = False
     parent_scoped_naming: bool = False
     naming_strategy: NamingStrategy | None = None
     duplicate_name_suffix: dict[str, str] | None = None
@@ -356,6 +371,7 @@ class JSONSchemaParserConfig(ParserConfig):
 
     jsonschema_version: JsonSchemaVersion | None = None
     schema_version_mode: VersionMode | None = None
+    remote_object_cache: DefaultPutDictObjectSchema | None = None
 
 
 class OpenAPIParserConfig(JSONSchemaParserConfig):
@@ -365,6 +381,7 @@ class OpenAPIParserConfig(JSONSchemaParserConfig):
     include_path_parameters: bool = False
     use_status_code_in_response_name: bool = False
     openapi_include_paths: list[str] | None = None
+    openapi_reachable_from: list[str] | None = None
     openapi_version: OpenAPIVersion | None = None
 
 
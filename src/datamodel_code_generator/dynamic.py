@@ -8,14 +8,20 @@ from __future__ import annotations
 
 import ast
 import builtins
+import hashlib
 import itertools
 import json
+import marshal
+import os
 import sys
+import tempfile
 import threading
 import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from enum import Enum
-from pathlib import PurePath
-from typing import TYPE_CHECKING, Any
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import pydantic
 from pydantic import BaseModel
@@ -28,10 +34,10 @@ from datamodel_code_generator.parser._graph import stable_toposort
 from datamodel_code_generator.types import StrictTypes
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Hashable, Iterable, Mapping
+
+    from datamodel_code_generator import GeneratedModules
 
-_dynamic_models_cache: dict[str, dict[str, type]] = {}
-_dynamic_models_lock = threading.Lock()
 _dynamic_module_counter = itertools.count(1)
 
 
@@ -49,10 +55,86 @@ def _path_to_module_name(package_name: str, path_tuple: tuple[str, ...]) -> str:
     return ".".join(parts)
 
 
-def _execute_single_module(code: str) -> dict[str, type]:
+class _CompiledModule(NamedTuple):
+    """A compiled generated module with the names it imports relatively."""
+
+    code: types.CodeType
+    relative_imports: frozenset[str]
+
+
+class _CodeCache:
+    """LRU cache of compiled generated modules keyed by a hash of their source.
+
+    With a directory, code objects are also marshalled to disk so that a new process
+    executing the same generated source skips compilation.
+    """
+
+    def __init__(self, max_entries: int = 1024, directory: Path | None = None) -> None:
+        self.max_entries = max_entries
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CompiledModule] = OrderedDict()
+
+    def _entry_path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / (sys.implementation.cache_tag or "none") / key[:2] / f"{key}.marshal"
+
+    def _load(self, key: str) -> _CompiledModule | None:
+        if (entry_path := self._entry_path(key)) is None:
+            return None
+        try:
+            code, relative_imports = marshal.loads(entry_path.read_bytes())  # noqa: S302
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return _CompiledModule(code, frozenset(relative_imports))
+
+    def _dump(self, key: str, compiled: _CompiledModule) -> None:
+        if (entry_path := self._entry_path(key)) is None:
+            return
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        except OSError:  # pragma: no cover
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump((compiled.code, sorted(compiled.relative_imports)), f)
+            Path(temp_name).replace(entry_path)
+        except BaseException:  # pragma: no cover
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    def compile(self, source: str, filename: str) -> _CompiledModule:
+        """Return the compiled module for source, compiling it unless it is cached."""
+        key = hashlib.sha256(f"{filename}\0{source}".encode()).hexdigest()
+        with self._lock:
+            if (compiled := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                return compiled
+        if (compiled := self._load(key)) is None:
+            tree = ast.parse(source, filename)
+            compiled = _CompiledModule(compile(tree, filename, "exec"), frozenset(_get_relative_imports(tree)))
+            self._dump(key, compiled)
+        with self._lock:
+            self._entries[key] = compiled
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Remove every in-memory entry; marshalled files are kept."""
+        with self._lock:
+            self._entries.clear()
+
+
+_code_cache = _CodeCache()
+
+
+def _execute_single_module(code: str, code_cache: _CodeCache = _code_cache) -> dict[str, type]:
     """Execute single module code and extract models."""
     namespace: dict[str, Any] = {"__builtins__": builtins.__dict__}
-    exec(code, namespace)  # noqa: S102
+    exec(code_cache.compile(code, "<string>").code, namespace)  # noqa: S102
 
     models = _extract_models(namespace)
 
@@ -63,10 +145,9 @@ def _execute_single_module(code: str) -> dict[str, type]:
     return models
 
 
-def _get_relative_imports(code: str) -> set[str]:
-    """Extract relative import module names from code using AST."""
+def _get_relative_imports(tree: ast.Module) -> set[str]:
+    """Extract relative import module names from the AST of a module."""
     imports: set[str] = set()
-    tree = ast.parse(code)
     for node in ast.walk(tree):
         if isinstance(node, ast.ImportFrom) and node.level == 1:
             if node.module:
@@ -76,8 +157,10 @@ def _get_relative_imports(code: str) -> set[str]:
     return imports
 
 
-def _build_module_edges(modules: dict[tuple[str, ...], str]) -> dict[tuple[str, ...], set[tuple[str, ...]]]:
-    """Build dependency edges for topological sort.
+def _build_module_edges(
+    modules: Mapping[tuple[str, ...], _CompiledModule],
+) -> dict[tuple[str, ...], set[tuple[str, ...]]]:
+    """Build dependency edges for topological sort from the relative imports of the compiled modules.
 
     Returns edges where edges[u] contains v means u must come before v.
     """
@@ -87,16 +170,17 @@ def _build_module_edges(modules: dict[tuple[str, ...], str]) -> dict[tuple[str,
             name_to_path[name] = path
 
     edges: dict[tuple[str, ...], set[tuple[str, ...]]] = {path: set() for path in modules}
-    for path, code in modules.items():
-        for imported in _get_relative_imports(code):
+    for path, compiled in modules.items():
+        for imported in compiled.relative_imports:
             if dep_path := name_to_path.get(imported):
                 edges[dep_path].add(path)
     return edges
 
 
-def _execute_multi_module(modules: dict[tuple[str, ...], str]) -> dict[str, type]:
+def _execute_multi_module(modules: dict[tuple[str, ...], str], code_cache: _CodeCache = _code_cache) -> dict[str, type]:
     """Execute multiple modules and extract models."""
     package_name = f"_dcg_dynamic_{next(_dynamic_module_counter)}"
+    compiled_modules = {path: code_cache.compile(code, f"<{'/'.join(path)}>") for path, code in modules.items()}
 
     created_modules: list[str] = []
     all_namespaces: dict[str, dict[str, Any]] = {}
@@ -105,7 +189,7 @@ def _execute_multi_module(modules: dict[tuple[str, ...], str]) -> dict[str, type
         nodes = list(modules.keys())
         nodes.sort(key=lambda p: (_is_init_file(p), p))
         node_index = {node: i for i, node in enumerate(nodes)}
-        edges = _build_module_edges(modules)
+        edges = _build_module_edges(compiled_modules)
         sorted_paths = stable_toposort(nodes, edges, key=node_index.__getitem__)
 
         for path_tuple in sorted_paths:
@@ -126,7 +210,7 @@ def _execute_multi_module(modules: dict[tuple[str, ...], str]) -> dict[str, type
 
         for path_tuple in sorted_paths:
             module_name = _path_to_module_name(package_name, path_tuple)
-            exec(modules[path_tuple], all_namespaces[module_name])  # noqa: S102
+            exec(compiled_modules[path_tuple].code, all_namespaces[module_name])  # noqa: S102
 
         models: dict[str, type] = {}
         combined_namespace: dict[str, Any] = {}
@@ -156,15 +240,281 @@ def _extract_models(namespace: dict[str, Any]) -> dict[str, type]:
 
 
 def _make_cache_key(schema: Mapping[str, Any], config: GenerateConfig) -> str | None:
-    """Create cache key from schema and config.
+    """Create cache key from a hash of schema and config.
 
     Returns None if the schema is not JSON-serializable.
     """
     try:
         key_data = {"schema": dict(schema), "config": config.model_dump(mode="json", exclude_defaults=True)}
-        return json.dumps(key_data, sort_keys=True, separators=(",", ":"))
+        serialized = json.dumps(key_data, sort_keys=True, separators=(",", ":"))
     except (TypeError, ValueError):
         return None
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _resolve_config(input_: Mapping[str, Any], config: GenerateConfig | None) -> GenerateConfig:
+    """Return config with the input file type detected from input_ when it is not given."""
+    if pydantic.VERSION < "2.0.0":  # pragma: no cover
+        msg = f"generate_dynamic_models requires Pydantic v2, found v{pydantic.VERSION}"
+        raise Error(msg)
+
+    GenerateConfig.model_rebuild(_types_namespace={"StrictTypes": StrictTypes, "UnionMode": UnionMode})
+
+    if config is None:
+        if is_openapi(input_):
+            return GenerateConfig(
+                input_file_type=InputFileType.OpenAPI,
+                output_model_type=DataModelType.PydanticV2BaseModel,
+            )
+        return GenerateConfig(
+            input_file_type=InputFileType.JsonSchema,
+            output_model_type=DataModelType.PydanticV2BaseModel,
+        )
+    if config.input_file_type == InputFileType.Auto:
+        detected_type = InputFileType.OpenAPI if is_openapi(input_) else InputFileType.JsonSchema
+        return config.model_copy(update={"input_file_type": detected_type})
+    return config
+
+
+def _generate_code(input_: Mapping[str, Any], config: GenerateConfig) -> str | GeneratedModules:
+    """Generate the source code of the models; runs in worker processes for batches."""
+    result = generate(input_=input_, config=config)
+    if result is None:  # pragma: no cover
+        msg = "generate() returned None"
+        raise Error(msg)
+    return result
+
+
+def _execute_code(code: str | GeneratedModules, code_cache: _CodeCache) -> tuple[dict[str, type], int]:
+    """Execute generated code, returning the models with the size of the code in bytes."""
+    if isinstance(code, str):
+        return _execute_single_module(code, code_cache), len(code.encode())
+    return _execute_multi_module(code, code_cache), sum(len(module.encode()) for module in code.values())
+
+
+def _generate_models(
+    input_: Mapping[str, Any], config: GenerateConfig, code_cache: _CodeCache
+) -> tuple[dict[str, type], int]:
+    """Generate and execute the models, returning them with the size of the generated code in bytes."""
+    return _execute_code(_generate_code(input_, config), code_cache)
+
+
+def _generate_batch(
+    inputs: Iterable[Mapping[str, Any]],
+    config: GenerateConfig | None,
+    max_workers: int | None,
+    cache: DynamicModelsCache | None,
+    max_entries: int,
+) -> list[dict[str, type]]:
+    """Generate models for every input, running generate() for the uncached ones in a process pool.
+
+    max_entries bounds the cache for this call only; the cache itself is not changed.
+    """
+    inputs = list(inputs)
+    configs = [_resolve_config(input_, config) for input_ in inputs]
+    results: list[dict[str, type]] = [{} for _ in inputs]
+    pending: dict[str | int, list[int]] = {}
+    for index, (input_, input_config) in enumerate(zip(inputs, configs, strict=True)):
+        cache_key = _make_cache_key(input_, input_config) if cache is not None and max_entries > 0 else None
+        if cache_key is None:
+            pending[index] = [index]
+        elif cache_key in pending:
+            pending[cache_key].append(index)
+            cache._count_hit()  # noqa: SLF001
+        elif (models := cache._lookup(cache_key)) is not None:  # noqa: SLF001
+            results[index] = models
+        else:
+            pending[cache_key] = [index]
+    if not pending:
+        return results
+
+    code_cache = cache._code_cache if cache is not None else _code_cache  # noqa: SLF001
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_generate_code, inputs[indexes[0]], configs[indexes[0]]): key
+            for key, indexes in pending.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            models, size = _execute_code(future.result(), code_cache)
+            if cache is not None and isinstance(key, str):
+                cache._put(key, models, size, max_entries)  # noqa: SLF001
+            for index in pending[key]:
+                results[index] = models
+    return results
+
+
+class DynamicModelsCacheInfo(NamedTuple):
+    """Statistics of a DynamicModelsCache.
+
+    A call waiting for a generation already running for the same key counts as a hit.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_entries: int
+    max_bytes: int | None
+
+
+class _Generation:
+    """A generation in progress that concurrent callers of the same key wait for."""
+
+    __slots__ = ("done", "error", "models")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.models: dict[str, type] = {}
+        self.error: BaseException | None = None
+
+
+class DynamicModelsCache:
+    """Thread-safe LRU cache of dynamically generated models.
+
+    Models are generated outside of the cache lock, so calls for different schemas run
+    concurrently, while concurrent calls for the same schema and config share one generation.
+    The least recently used entries are evicted once there are max_entries of them or their
+    generated code exceeds max_bytes in total. With code_cache_dir, the compiled generated
+    modules are also marshalled to that directory, so a new process skips compiling them.
+    """
+
+    def __init__(
+        self, max_entries: int = 128, max_bytes: int | None = None, code_cache_dir: Path | None = None
+    ) -> None:
+        """Initialize an empty cache. A max_entries of 0 disables caching."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._code_cache = _CodeCache(directory=Path(code_cache_dir)) if code_cache_dir is not None else _code_cache
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[dict[str, type], int]] = OrderedDict()
+        self._generations: dict[Hashable, _Generation] = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def generate(
+        self, input_: Mapping[str, Any], *, config: GenerateConfig | None = None, key: Hashable | None = None
+    ) -> dict[str, type]:
+        """Return the models generated from input_, generating them unless they are cached.
+
+        By default the cache key is a hash of input_ and config, which serializes both on every
+        call. A caller that already identifies its schemas can pass that as key instead; it must
+        not pass the same key for a different schema or config.
+        """
+        return self._generate(input_, config, key, self.max_entries)
+
+    def _generate(
+        self, input_: Mapping[str, Any], config: GenerateConfig | None, key: Hashable | None, max_entries: int
+    ) -> dict[str, type]:
+        """Generate as in generate(), bounding the cache to max_entries for this call."""
+        config = _resolve_config(input_, config)
+        cache_key: Hashable | None = None
+        if max_entries > 0:
+            cache_key = _make_cache_key(input_, config) if key is None else ("key", key)
+        if cache_key is None:
+            with self._lock:
+                self._misses += 1
+            return _generate_models(input_, config, self._code_cache)[0]
+
+        with self._lock:
+            if (entry := self._entries.get(cache_key)) is not None:
+                self._entries.move_to_end(cache_key)
+                self._hits += 1
+                return entry[0]
+            generation = self._generations.get(cache_key)
+            owner = generation is None
+            if generation is None:
+                generation = self._generations[cache_key] = _Generation()
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if not owner:
+            generation.done.wait()
+            if generation.error is not None:
+                raise generation.error
+            return generation.models
+
+        try:
+            generation.models, size = _generate_models(input_, config, self._code_cache)
+        except BaseException as e:
+            generation.error = e
+            raise
+        else:
+            with self._lock:
+                self._store(cache_key, generation.models, size, max_entries)
+            return generation.models
+        finally:
+            with self._lock:
+                del self._generations[cache_key]
+            generation.done.set()
+
+    def generate_batch(
+        self,
+        inputs: Iterable[Mapping[str, Any]],
+        *,
+        config: GenerateConfig | None = None,
+        max_workers: int | None = None,
+    ) -> list[dict[str, type]]:
+        """Return the models for every input, generating the uncached ones in up to max_workers processes."""
+        return _generate_batch(inputs, config, max_workers, self, self.max_entries)
+
+    def _lookup(self, cache_key: Hashable) -> dict[str, type] | None:
+        """Return the cached models for cache_key, counting a hit or a miss."""
+        with self._lock:
+            if (entry := self._entries.get(cache_key)) is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            return entry[0]
+
+    def _count_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def _put(self, cache_key: Hashable, models: dict[str, type], size: int, max_entries: int) -> None:
+        with self._lock:
+            self._store(cache_key, models, size, max_entries)
+
+    def _store(self, cache_key: Hashable, models: dict[str, type], size: int, max_entries: int) -> None:
+        """Add an entry, evicting the least recently used ones to keep max_entries. Must hold the lock."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        while self._entries and (
+            len(self._entries) >= max_entries or (self.max_bytes is not None and self._size + size > self.max_bytes)
+        ):
+            self._size -= self._entries.popitem(last=False)[1][1]
+            self._evictions += 1
+        self._entries[cache_key] = (models, size)
+        self._size += size
+
+    def cache_info(self) -> DynamicModelsCacheInfo:
+        """Return hit, miss and eviction counts and the current size of the cache."""
+        with self._lock:
+            return DynamicModelsCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> int:
+        """Remove every entry and reset the statistics, returning the number of entries removed."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._size = self._hits = self._misses = self._evictions = 0
+            return count
+
+
+_dynamic_models_cache = DynamicModelsCache()
 
 
 def generate_dynamic_models(
@@ -172,6 +522,8 @@ def generate_dynamic_models(
     *,
     config: GenerateConfig | None = None,
     cache_size: int = 128,
+    cache: DynamicModelsCache | None = None,
+    key: Hashable | None = None,
 ) -> dict[str, type]:
     """Generate actual Python model classes from schema at runtime.
 
@@ -182,16 +534,20 @@ def generate_dynamic_models(
     Args:
         input_: JSON Schema or OpenAPI schema as dict.
         config: A GenerateConfig object with generation options. If None, uses defaults.
-        cache_size: Maximum number of schemas to cache. Set to 0 to disable caching.
+        cache_size: Maximum number of schemas to cache in the shared cache. Set to 0 to disable caching.
+        cache: A DynamicModelsCache to use instead of the shared one; cache_size is then ignored.
+        key: A hashable identifying input_ and config, used as the cache key instead of hashing
+            them. It must not be reused for a different schema or config.
 
     Returns:
         Dictionary mapping class names to model classes.
 
     Note:
-        - Thread-safe (uses internal lock and cache)
+        - Thread-safe; calls for different schemas generate concurrently and concurrent
+          calls for the same schema share one generation
         - Pydantic v2 only (v1 is not supported)
         - Not pickle-able (use model_dump() to serialize instances)
-        - Cached by schema + config hash with FIFO eviction when cache_size is exceeded
+        - Cached by schema + config hash, or by key, with LRU eviction when cache_size is exceeded
         - Supports both single-module and multi-module output
 
     Example:
@@ -206,56 +562,53 @@ def generate_dynamic_models(
         >>> user.model_dump()
         {'name': 'John', 'age': 30}
     """
-    if pydantic.VERSION < "2.0.0":  # pragma: no cover
-        msg = f"generate_dynamic_models requires Pydantic v2, found v{pydantic.VERSION}"
-        raise Error(msg)
+    if cache is not None:
+        return cache.generate(input_, config=config, key=key)
+    if cache_size <= 0:
+        return _generate_models(input_, _resolve_config(input_, config), _code_cache)[0]
+    return _dynamic_models_cache._generate(input_, config, key, cache_size)  # noqa: SLF001
 
-    GenerateConfig.model_rebuild(_types_namespace={"StrictTypes": StrictTypes, "UnionMode": UnionMode})
 
-    if config is None:
-        if is_openapi(input_):
-            config = GenerateConfig(
-                input_file_type=InputFileType.OpenAPI,
-                output_model_type=DataModelType.PydanticV2BaseModel,
-            )
-        else:
-            config = GenerateConfig(
-                input_file_type=InputFileType.JsonSchema,
-                output_model_type=DataModelType.PydanticV2BaseModel,
-            )
-    elif config.input_file_type == InputFileType.Auto:
-        detected_type = InputFileType.OpenAPI if is_openapi(input_) else InputFileType.JsonSchema
-        config = config.model_copy(update={"input_file_type": detected_type})
+def clear_dynamic_models_cache() -> int:
+    """Clear the dynamic models cache.
 
-    cache_key = _make_cache_key(input_, config)
-    use_cache = cache_size > 0 and cache_key is not None
+    Returns:
+        Number of cached entries that were cleared.
+    """
+    _code_cache.clear()
+    return _dynamic_models_cache.clear()
 
-    with _dynamic_models_lock:
-        if use_cache and cache_key in _dynamic_models_cache:
-            return _dynamic_models_cache[cache_key]
 
-        result = generate(input_=input_, config=config)
-        if result is None:  # pragma: no cover
-            msg = "generate() returned None"
-            raise Error(msg)
-        models = _execute_single_module(result) if isinstance(result, str) else _execute_multi_module(result)
+def dynamic_models_cache_info() -> DynamicModelsCacheInfo:
+    """Return the statistics of the cache shared by generate_dynamic_models calls."""
+    return _dynamic_models_cache.cache_info()
 
-        if use_cache:
-            while len(_dynamic_models_cache) >= cache_size:
-                oldest_key = next(iter(_dynamic_models_cache))
-                del _dynamic_models_cache[oldest_key]
-            _dynamic_models_cache[cache_key] = models  # type: ignore[index]
 
-        return models
+def generate_dynamic_models_batch(
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    config: GenerateConfig | None = None,
+    max_workers: int | None = None,
+    cache_size: int = 128,
+    cache: DynamicModelsCache | None = None,
+) -> list[dict[str, type]]:
+    """Generate model classes for many schemas, using one process per CPU for code generation.
 
+    generate() runs in a ProcessPoolExecutor with max_workers processes and only the generated
+    source code is sent back; it is executed into classes in the calling process. Schemas
+    found in the cache, and repeats within inputs, are not generated again.
 
-def clear_dynamic_models_cache() -> int:
-    """Clear the dynamic models cache.
+    Args:
+        inputs: JSON Schema or OpenAPI schemas as dicts.
+        config: A GenerateConfig object applied to every schema. If None, uses defaults.
+            It is pickled for the worker processes, so it must not hold callables.
+        max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+        cache_size: Maximum number of schemas to cache in the shared cache. Set to 0 to disable caching.
+        cache: A DynamicModelsCache to use instead of the shared one; cache_size is then ignored.
 
     Returns:
-        Number of cached entries that were cleared.
+        One dictionary mapping class names to model classes per schema, in the order of inputs.
     """
-    with _dynamic_models_lock:
-        count = len(_dynamic_models_cache)
-        _dynamic_models_cache.clear()
-        return count
+    if cache is not None:
+        return _generate_batch(inputs, config, max_workers, cache, cache.max_entries)
+    return _generate_batch(inputs, config, max_workers, _dynamic_models_cache if cache_size > 0 else None, cache_size)
@@ -9,17 +9,20 @@ from __future__ import annotations
 import shutil
 import subprocess  # noqa: S404
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 from functools import cached_property, lru_cache
 from importlib import import_module
+from itertools import repeat
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 from warnings import warn
 
 from datamodel_code_generator.util import load_toml
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
 
 @lru_cache(maxsize=1)
@@ -245,6 +248,19 @@ class CodeFormatter:
 
         self.settings_path: str = str(settings_path)
         self.formatters = formatters
+        # Everything needed to rebuild an equivalent formatter in a worker process.
+        self._worker_kwargs: dict[str, Any] = {
+            "python_version": python_version,
+            "settings_path": settings_path,
+            "wrap_string_literal": wrap_string_literal,
+            "skip_string_normalization": skip_string_normalization,
+            "known_third_party": known_third_party,
+            "custom_formatters": custom_formatters,
+            "custom_formatters_kwargs": custom_formatters_kwargs,
+            "encoding": encoding,
+            "formatters": formatters,
+            "defer_formatting": defer_formatting,
+        }
         self.defer_formatting = defer_formatting
         self.encoding = encoding
 
@@ -341,10 +357,7 @@ class CodeFormatter:
         code: str,
     ) -> str:
         """Apply all configured formatters to the code string."""
-        if Formatter.ISORT in self.formatters:
-            code = self.apply_isort(code)
-        if Formatter.BLACK in self.formatters:
-            code = self.apply_black(code)
+        code = self._apply_in_process_formatters(code)
 
         if not self.defer_formatting:
             has_ruff_check = Formatter.RUFF_CHECK in self.formatters
@@ -356,11 +369,84 @@ class CodeFormatter:
             elif has_ruff_format:
                 code = self.apply_ruff_formatter(code)
 
+        return self._apply_custom_formatters(code)
+
+    def _apply_in_process_formatters(self, code: str) -> str:
+        if Formatter.ISORT in self.formatters:
+            code = self.apply_isort(code)
+        if Formatter.BLACK in self.formatters:
+            code = self.apply_black(code)
+        return code
+
+    def _apply_custom_formatters(self, code: str) -> str:
         for formatter in self.custom_formatters:
             code = formatter.apply(code)
-
         return code
 
+    def format_codes(self, codes: Sequence[str], jobs: int = 1) -> list[str | Exception]:
+        """Format several code strings, using up to jobs worker processes.
+
+        Results keep the order of codes. A code string that fails to format yields
+        the raised exception instead of aborting the whole batch. Ruff runs once for
+        the whole batch instead of once per code string.
+        """
+        uses_ruff = not self.defer_formatting and (
+            Formatter.RUFF_CHECK in self.formatters or Formatter.RUFF_FORMAT in self.formatters
+        )
+        if not uses_ruff or len(codes) <= 1:
+            return self._map_format_step("format_code", codes, jobs)
+
+        results = self._map_format_step("_apply_in_process_formatters", codes, jobs)
+        pending = [index for index, result in enumerate(results) if isinstance(result, str)]
+        ruff_results = self.apply_ruff_to_codes([cast("str", results[index]) for index in pending])
+        for index, code in zip(pending, ruff_results, strict=True):
+            results[index] = _run_format_step(self, "_apply_custom_formatters", code)
+        return results
+
+    def _map_format_step(self, step: str, codes: Sequence[str], jobs: int) -> list[str | Exception]:
+        """Run the formatter method named step on every code string, in a process pool if jobs > 1."""
+        if jobs <= 1 or len(codes) <= 1:
+            return [_run_format_step(self, step, code) for code in codes]
+
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(codes)),
+            initializer=_init_format_worker,
+            initargs=(self._worker_kwargs,),
+        ) as executor:
+            return list(executor.map(_run_format_step_in_worker, repeat(step), codes))
+
+    def apply_ruff_to_codes(self, codes: Sequence[str]) -> list[str]:
+        """Run the configured ruff formatters over many code strings with a single invocation each.
+
+        The code strings are written to a temporary directory and passed to ruff as explicit
+        files, so that ruff's exclude settings never skip a module.
+        """
+        import tempfile  # noqa: PLC0415
+
+        ruff_path = self._find_ruff_path()
+        with tempfile.TemporaryDirectory(prefix="datamodel-codegen-") as temp_dir:
+            paths = [Path(temp_dir) / f"module_{index}.py" for index in range(len(codes))]
+            for path, code in zip(paths, codes, strict=True):
+                path.write_bytes(code.encode(self.encoding))
+            files = [str(path) for path in paths]
+            if Formatter.RUFF_CHECK in self.formatters:
+                subprocess.run(  # noqa: S603
+                    (ruff_path, "check", "--fix", "--unsafe-fixes", *files),
+                    capture_output=True,
+                    check=False,
+                    cwd=self.settings_path,
+                )
+            if Formatter.RUFF_FORMAT in self.formatters:
+                subprocess.run(  # noqa: S603
+                    (ruff_path, "format", *files),
+                    capture_output=True,
+                    check=False,
+                    cwd=self.settings_path,
+                )
+            return [path.read_bytes().decode(self.encoding) for path in paths]
+
     def apply_black(self, code: str) -> str:
         """Format code using black."""
         black = _get_black()
@@ -449,6 +535,57 @@ class CodeFormatter:
             )
 
 
+_active_code_formatters: ContextVar[dict[str, CodeFormatter] | None] = ContextVar(
+    "_active_code_formatters", default=None
+)
+
+
+@contextmanager
+def use_code_formatters(code_formatters: dict[str, CodeFormatter]) -> Iterator[dict[str, CodeFormatter]]:
+    """Make get_code_formatter calls in the current context reuse the formatters stored in code_formatters."""
+    token = _active_code_formatters.set(code_formatters)
+    try:
+        yield code_formatters
+    finally:
+        _active_code_formatters.reset(token)
+
+
+def get_code_formatter(**kwargs: Any) -> CodeFormatter:
+    """Return a CodeFormatter for kwargs, reusing one built earlier inside `use_code_formatters`.
+
+    Building a formatter reads the black and isort settings from disk, which dominates
+    the cost of generating many small inputs with the same options.
+    """
+    code_formatters = _active_code_formatters.get()
+    if code_formatters is None:
+        return CodeFormatter(**kwargs)
+    key = repr((Path.cwd(), sorted(kwargs.items())))
+    if (code_formatter := code_formatters.get(key)) is None:
+        code_formatter = code_formatters[key] = CodeFormatter(**kwargs)
+    return code_formatter
+
+
+_worker_code_formatter: CodeFormatter | None = None
+
+
+def _run_format_step(code_formatter: CodeFormatter, step: str, code: str) -> str | Exception:
+    try:
+        return getattr(code_formatter, step)(code)
+    except Exception as exc:  # noqa: BLE001
+        return exc
+
+
+def _init_format_worker(formatter_kwargs: dict[str, Any]) -> None:
+    """Build the formatter used by every task of a worker process."""
+    global _worker_code_formatter  # noqa: PLW0603
+    _worker_code_formatter = CodeFormatter(**formatter_kwargs)
+
+
+def _run_format_step_in_worker(step: str, code: str) -> str | Exception:
+    assert _worker_code_formatter is not None
+    return _run_format_step(_worker_code_formatter, step, code)
+
+
 class CustomCodeFormatter:
     """Base class for custom code formatters.
 
@@ -7,10 +7,15 @@ file:// URLs are handled without additional dependencies.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 
 def _get_httpx() -> Any:
@@ -24,25 +29,183 @@ def _get_httpx() -> Any:
 
 
 DEFAULT_HTTP_TIMEOUT = 30.0
+DEFAULT_HTTP_MAX_CONNECTIONS = 16
+HTTP_CACHE_FORMAT_VERSION = 1
 
 
-def get_body(
+class HTTPCache:
+    """On-disk store of fetched documents, revalidated with conditional requests.
+
+    Entries are keyed by URL together with the request headers and query parameters,
+    and keep the ETag and Last-Modified validators of the response. A cached document
+    is sent back as If-None-Match/If-Modified-Since and reused on 304 Not Modified, or
+    when the host can not be reached. In offline mode no request is sent at all and
+    only cached documents are served, however old they are.
+    """
+
+    def __init__(self, directory: Path, *, offline: bool = False) -> None:
+        """Initialize the cache rooted at directory."""
+        self.directory = directory
+        self.offline = offline
+
+    @staticmethod
+    def make_key(
+        url: str,
+        headers: Sequence[tuple[str, str]] | None = None,
+        query_parameters: Sequence[tuple[str, str]] | None = None,
+    ) -> str:
+        """Compute the cache key of a request."""
+        key_data = json.dumps({
+            "url": url,
+            "headers": [list(header) for header in headers or ()],
+            "query_parameters": [list(parameter) for parameter in query_parameters or ()],
+        })
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for key, or None if there is no readable one."""
+        try:
+            entry = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("format") != HTTP_CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def store(self, key: str, url: str, text: str, etag: str | None, last_modified: str | None) -> None:
+        """Store a fetched document under key."""
+        entry = {
+            "format": HTTP_CACHE_FORMAT_VERSION,
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "text": text,
+        }
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            Path(temp_name).replace(entry_path)
+        except BaseException:  # pragma: no cover
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    def fetch(
+        self,
+        url: str,
+        headers: Sequence[tuple[str, str]] | None,
+        query_parameters: Sequence[tuple[str, str]] | None,
+        send: Callable[[list[tuple[str, str]]], Any],
+    ) -> str:
+        """Return the document at url, calling send with the conditional headers to fetch it."""
+        key = self.make_key(url, headers, query_parameters)
+        entry = self.load(key)
+        if self.offline:
+            if entry is None:
+                from datamodel_code_generator import Error  # noqa: PLC0415
+
+                msg = f"{url} is not in the HTTP cache and requests are disabled by --http-offline"
+                raise Error(msg)
+            return entry["text"]
+
+        conditional_headers: list[tuple[str, str]] = []
+        if entry is not None:
+            if entry["etag"]:
+                conditional_headers.append(("If-None-Match", entry["etag"]))
+            if entry["last_modified"]:
+                conditional_headers.append(("If-Modified-Since", entry["last_modified"]))
+        httpx = _get_httpx()
+        try:
+            response = send(conditional_headers)
+        except httpx.TransportError:
+            if entry is None:
+                raise
+            return entry["text"]
+        if entry is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return entry["text"]
+        if response.is_success:
+            self.store(key, url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return response.text
+
+
+def get_body(  # noqa: PLR0913
     url: str,
     headers: Sequence[tuple[str, str]] | None = None,
     ignore_tls: bool = False,  # noqa: FBT001, FBT002
     query_parameters: Sequence[tuple[str, str]] | None = None,
     timeout: float = DEFAULT_HTTP_TIMEOUT,
+    *,
+    cache: HTTPCache | None = None,
 ) -> str:
-    """Fetch content from a URL with optional headers and query parameters."""
+    """Fetch content from a URL with optional headers and query parameters, through cache if given."""
+    httpx = _get_httpx()
+
+    def send(extra_headers: Sequence[tuple[str, str]] = ()) -> Any:
+        return httpx.get(
+            url,
+            headers=[*(headers or ()), *extra_headers] if extra_headers else headers,
+            verify=not ignore_tls,
+            follow_redirects=True,
+            params=query_parameters,  # ty: ignore
+            timeout=timeout,
+        )
+
+    if cache is None:
+        return send().text
+    return cache.fetch(url, headers, query_parameters, send)
+
+
+def get_bodies(  # noqa: PLR0913
+    urls: Iterable[str],
+    headers: Sequence[tuple[str, str]] | None = None,
+    ignore_tls: bool = False,  # noqa: FBT001, FBT002
+    query_parameters: Sequence[tuple[str, str]] | None = None,
+    timeout: float = DEFAULT_HTTP_TIMEOUT,
+    *,
+    max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS,
+    cache: HTTPCache | None = None,
+) -> dict[str, str]:
+    """Fetch several URLs concurrently through one pooled client.
+
+    Requests are sent like `get_body` sends them. URLs that cannot be fetched are left out
+    of the result, so that fetching them again later reports the error where it matters.
+    """
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    from datamodel_code_generator import Error  # noqa: PLC0415
+
     httpx = _get_httpx()
-    return httpx.get(
-        url,
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+
+    with httpx.Client(
         headers=headers,
         verify=not ignore_tls,
         follow_redirects=True,
         params=query_parameters,  # ty: ignore
         timeout=timeout,
-    ).text
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    ) as client:
+
+        def fetch(url: str) -> str | None:
+            try:
+                if cache is None:
+                    return client.get(url).text
+                return cache.fetch(
+                    url, headers, query_parameters, lambda extra_headers: client.get(url, headers=extra_headers)
+                )
+            except (httpx.HTTPError, Error):
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_connections, len(urls))) as executor:
+            bodies = dict(zip(urls, executor.map(fetch, urls), strict=True))
+    return {url: body for url, body in bodies.items() if body is not None}
 
 
 def join_url(url: str, ref: str = ".") -> str:  # noqa: PLR0912
@@ -9,6 +9,8 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import deepcopy
 from functools import cached_property, lru_cache
 from pathlib import Path
@@ -44,7 +46,7 @@ __all__ = ["WrappedDefault"]
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    from jinja2 import Environment, Template
+    from jinja2 import BytecodeCache, Environment, Template
 
     from datamodel_code_generator import DataclassArguments
 
@@ -186,6 +188,7 @@ class DataModelFieldBase(_BaseModel):
     use_one_literal_as_default: bool = False
     _exclude_fields: ClassVar[set[str]] = {"parent"}
     _pass_fields: ClassVar[set[str]] = {"parent", "data_type"}
+    _share_fields_set: ClassVar[bool] = True
     can_have_extra_keys: ClassVar[bool] = True
     type_has_null: Optional[bool] = None  # noqa: UP045
     read_only: bool = False
@@ -470,8 +473,38 @@ class DataModelFieldBase(_BaseModel):
             new_data_type.parent = self
 
 
+_active_template_bytecode_cache_dir: ContextVar[Path | None] = ContextVar(
+    "_active_template_bytecode_cache_dir", default=None
+)
+
+
+@contextmanager
+def use_template_bytecode_cache_dir(directory: Path | None) -> Iterator[Path | None]:
+    """Make templates loaded in the current context store their compiled code in directory.
+
+    Entries are keyed by template name and file and checked against the template source,
+    so edited custom templates are recompiled. None disables the bytecode cache.
+    """
+    token = _active_template_bytecode_cache_dir.set(directory)
+    try:
+        yield directory
+    finally:
+        _active_template_bytecode_cache_dir.reset(token)
+
+
+def _get_bytecode_cache(bytecode_cache_dir: Path | None) -> BytecodeCache | None:
+    if bytecode_cache_dir is None:
+        return None
+    from jinja2 import FileSystemBytecodeCache  # noqa: PLC0415
+
+    bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+
 @lru_cache(maxsize=16)
-def _get_environment(template_subdir: Path, custom_template_dir: Path | None) -> Environment:
+def _get_environment(
+    template_subdir: Path, custom_template_dir: Path | None, bytecode_cache_dir: Path | None = None
+) -> Environment:
     """Get or create a cached Jinja2 Environment for the given directories."""
     from jinja2 import ChoiceLoader, Environment, FileSystemLoader, select_autoescape  # noqa: PLC0415
 
@@ -488,13 +521,16 @@ def _get_environment(template_subdir: Path, custom_template_dir: Path | None) ->
     env = Environment(
         loader=loader,
         autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=_get_bytecode_cache(bytecode_cache_dir),
     )
     env.filters["escape_docstring"] = escape_docstring
     return env
 
 
 @lru_cache
-def _get_template_with_custom_dir(template_file_path: Path, custom_template_dir: Path | None) -> Template:
+def _get_template_with_custom_dir(
+    template_file_path: Path, custom_template_dir: Path | None, bytecode_cache_dir: Path | None = None
+) -> Template:
     """Load and cache a Jinja2 template with optional custom directory support.
 
     When custom_template_dir is provided, templates are searched in this order:
@@ -505,12 +541,14 @@ def _get_template_with_custom_dir(template_file_path: Path, custom_template_dir:
     while keeping other templates from the default directory.
     """
     template_subdir = template_file_path.parent
-    environment = _get_environment(template_subdir, custom_template_dir)
+    environment = _get_environment(template_subdir, custom_template_dir, bytecode_cache_dir)
     return environment.get_template(template_file_path.name)
 
 
 @lru_cache(maxsize=16)
-def _get_environment_with_absolute_path(absolute_template_dir: Path, builtin_subdir: Path) -> Environment:
+def _get_environment_with_absolute_path(
+    absolute_template_dir: Path, builtin_subdir: Path, bytecode_cache_dir: Path | None = None
+) -> Environment:
     """Get or create a cached Jinja2 Environment for absolute path templates."""
     from jinja2 import ChoiceLoader, Environment, FileSystemLoader, select_autoescape  # noqa: PLC0415
 
@@ -521,13 +559,16 @@ def _get_environment_with_absolute_path(absolute_template_dir: Path, builtin_sub
     env = Environment(
         loader=ChoiceLoader(loaders),
         autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=_get_bytecode_cache(bytecode_cache_dir),
     )
     env.filters["escape_docstring"] = escape_docstring
     return env
 
 
 @lru_cache
-def _get_template_with_absolute_path(absolute_template_path: Path, builtin_subdir: Path) -> Template:
+def _get_template_with_absolute_path(
+    absolute_template_path: Path, builtin_subdir: Path, bytecode_cache_dir: Path | None = None
+) -> Template:
     """Load a Jinja2 template from an absolute path with fallback to built-in directory.
 
     This handles backward compatibility for custom templates found at absolute paths.
@@ -535,14 +576,14 @@ def _get_template_with_absolute_path(absolute_template_path: Path, builtin_subdi
     1. The directory containing the absolute template path
     2. TEMPLATE_DIR/<builtin_subdir>/ (fallback for includes not in custom dir)
     """
-    environment = _get_environment_with_absolute_path(absolute_template_path.parent, builtin_subdir)
+    environment = _get_environment_with_absolute_path(absolute_template_path.parent, builtin_subdir, bytecode_cache_dir)
     return environment.get_template(absolute_template_path.name)
 
 
 @lru_cache
-def get_template(template_file_path: Path) -> Template:
+def get_template(template_file_path: Path, bytecode_cache_dir: Path | None = None) -> Template:
     """Load and cache a Jinja2 template from the template directory."""
-    return _get_template_with_custom_dir(template_file_path, None)
+    return _get_template_with_custom_dir(template_file_path, None, bytecode_cache_dir)
 
 
 def sanitize_module_name(name: str, *, treat_dot_as_module: bool | None) -> str:
@@ -596,7 +637,7 @@ class TemplateBase(ABC):
     @cached_property
     def template(self) -> Template:
         """Get the cached Jinja2 template instance."""
-        return get_template(self.template_file_path)
+        return get_template(self.template_file_path, _active_template_bytecode_cache_dir.get())
 
     @abstractmethod
     def render(self) -> str:
@@ -757,6 +798,10 @@ class DataModel(TemplateBase, Nullable, ABC):  # noqa: PLR0904
         self._dedup_key_cache[cache_key] = result
         return result
 
+    def invalidate_dedup_key(self) -> None:
+        """Drop the cached dedup keys after a change to the fields, base classes or their references."""
+        self._dedup_key_cache.clear()
+
     def create_reuse_model(self, base_ref: Reference) -> Self:
         """Create inherited model with empty fields pointing to base reference."""
         return self.__class__(
@@ -778,8 +823,10 @@ class DataModel(TemplateBase, Nullable, ABC):  # noqa: PLR0904
         from datamodel_code_generator.parser.base import get_most_of_parent  # noqa: PLC0415
 
         for child in self.reference.children[:]:
-            if isinstance(child, DataType) and get_most_of_parent(child) in models:
+            if isinstance(child, DataType) and (parent := get_most_of_parent(child)) in models:
                 child.replace_reference(new_ref)
+                if isinstance(parent, DataModel):  # pragma: no branch
+                    parent.invalidate_dedup_key()
 
     def set_base_class(self) -> None:
         """Set up the base class(es) for this model."""
@@ -815,9 +862,14 @@ class DataModel(TemplateBase, Nullable, ABC):  # noqa: PLR0904
     def template(self) -> Template:
         """Get the Jinja2 template with custom directory support for includes."""
         resolved_path = self.template_file_path
+        bytecode_cache_dir = _active_template_bytecode_cache_dir.get()
         if resolved_path.is_absolute():
-            return _get_template_with_absolute_path(resolved_path, Path(self.TEMPLATE_FILE_PATH).parent)
-        return _get_template_with_custom_dir(Path(self.TEMPLATE_FILE_PATH), self._custom_template_dir)
+            return _get_template_with_absolute_path(
+                resolved_path, Path(self.TEMPLATE_FILE_PATH).parent, bytecode_cache_dir
+            )
+        return _get_template_with_custom_dir(
+            Path(self.TEMPLATE_FILE_PATH), self._custom_template_dir, bytecode_cache_dir
+        )
 
     @property
     def imports(self) -> tuple[Import, ...]:
@@ -0,0 +1,233 @@
+"""Lazy loading of large JSON schema documents.
+
+`load_json_lazily` decodes a JSON document eagerly except for the definition
+containers (`definitions`, `$defs` and `components/schemas`). Those are returned as
+`LazyJsonObject`s that keep each entry packed with `marshal` and unpack it the first
+time it is accessed. Every entry is decoded from JSON exactly once, while the document
+is read, which also validates it; the packed form is far smaller than the decoded
+objects and is dropped as soon as the entry is unpacked, and the source text is not
+kept at all. Memory is saved for the entries that are never read, such as the unused
+definitions of a large document that is only loaded through `$ref`.
+
+Finding where an entry ends takes a decode anyway: scanning the text in Python is
+several times slower than the C decoder, so the decoded value is packed instead of
+thrown away and decoded again.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import marshal
+import re
+from collections.abc import Callable, ItemsView, Iterator, ValuesView
+from json.decoder import scanstring
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Nested object keys whose entries are kept packed until accessed. None marks a lazy container.
+LAZY_CONTAINERS: dict[str, Any] = {
+    "definitions": None,
+    "$defs": None,
+    "components": {"schemas": None},
+}
+
+
+class _Packed(bytes):
+    """A value packed with marshal that has not been accessed yet."""
+
+    __slots__ = ()
+
+
+class LazyJsonObject(dict):  # type: ignore[type-arg]  # noqa: FURB189
+    """JSON object whose values are unpacked on first access.
+
+    It subclasses dict because the parser checks schema nodes with isinstance(value, dict).
+    The dict storage holds the packed form of values that were not accessed yet, so
+    length, membership and key iteration work natively; value access goes through the
+    overridden methods, which replace each packed value with the unpacked one.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def _unpack(value: Any) -> Any:
+        if type(value) is _Packed:
+            return marshal.loads(value)  # noqa: S302  # packed by _index_object from decoded JSON
+        return value
+
+    def _unpack_stored(self, key: str, value: Any) -> Any:
+        if type(value) is not _Packed:
+            return value
+        unpacked = self._unpack(value)
+        super().__setitem__(key, unpacked)
+        return unpacked
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value stored under key, unpacking it on first access."""
+        return self._unpack_stored(key, super().__getitem__(key))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default if it is missing."""
+        if key not in self:
+            return default
+        return self[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over keys in document order.
+
+        Overriding it keeps dict(), update() and ** unpacking off the C fast path that
+        would copy the packed values.
+        """
+        return super().__iter__()
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        """Return a view unpacking each value as it is iterated."""
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        """Return a view unpacking each value as it is iterated."""
+        return ItemsView(self)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove key and return its value."""
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        super().pop(key)
+        return value
+
+    def popitem(self) -> tuple[str, Any]:
+        """Remove and return the last inserted item."""
+        key, value = super().popitem()
+        return key, self._unpack(value)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, storing default if it is missing."""
+        if key in self:
+            return self[key]
+        super().__setitem__(key, default)
+        return default
+
+    def copy(self) -> LazyJsonObject:
+        """Return a shallow copy that shares the packed and the unpacked entries."""
+        return LazyJsonObject(super().items())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> LazyJsonObject:
+        """Return a deep copy that shares the packed entries, which are immutable, and keeps them packed."""
+        return LazyJsonObject(
+            (key, value if type(value) is _Packed else copy.deepcopy(value, memo)) for key, value in super().items()
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with any mapping by unpacked content."""
+        if isinstance(other, LazyJsonObject):
+            other = dict(other.items())
+        return dict(self.items()) == other
+
+    def __ne__(self, other: object) -> bool:
+        """Compare with any mapping by unpacked content."""
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Any) -> dict[str, Any]:
+        """Return a plain dict merging unpacked content with other."""
+        return dict(self.items()) | other
+
+    def __ror__(self, other: Any) -> dict[str, Any]:
+        """Return a plain dict merging other with unpacked content."""
+        return dict(other) | dict(self.items())
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[dict[str, Any]]]:
+        """Pickle as a plain, fully unpacked dict."""
+        return dict, (dict(self.items()),)
+
+    def __repr__(self) -> str:
+        """Return the repr of the unpacked content."""
+        return repr(dict(self.items()))
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    return _WHITESPACE.match(text, index).end()  # type: ignore[union-attr]
+
+
+def _scan_object(
+    text: str, index: int, read_value: Callable[[str, int], tuple[Any, int]]
+) -> tuple[dict[str, Any], int]:
+    """Scan the object starting at index, reading each member with read_value(key, value_offset).
+
+    read_value returns the value to store and the offset just after the member value.
+    """
+    if text[index : index + 1] != "{":
+        msg = "Expecting '{'"
+        raise json.JSONDecodeError(msg, text, index)
+    result: dict[str, Any] = {}
+    index = _skip_whitespace(text, index + 1)
+    if text[index : index + 1] == "}":
+        return result, index + 1
+    while True:
+        if text[index : index + 1] != '"':
+            msg = "Expecting property name enclosed in double quotes"
+            raise json.JSONDecodeError(msg, text, index)
+        key, index = scanstring(text, index + 1)
+        index = _skip_whitespace(text, index)
+        if text[index : index + 1] != ":":
+            msg = "Expecting ':' delimiter"
+            raise json.JSONDecodeError(msg, text, index)
+        result[key], index = read_value(key, _skip_whitespace(text, index + 1))
+        index = _skip_whitespace(text, index)
+        delimiter = text[index : index + 1]
+        if delimiter == "}":
+            return result, index + 1
+        if delimiter != ",":
+            msg = "Expecting ',' delimiter"
+            raise json.JSONDecodeError(msg, text, index)
+        index = _skip_whitespace(text, index + 1)
+
+
+def _decode_object(text: str, index: int, lazy_containers: dict[str, Any]) -> tuple[dict[str, Any], int]:
+    """Decode the object starting at index, packing the entries of the given containers."""
+
+    def read_value(key: str, value_index: int) -> tuple[Any, int]:
+        if key in lazy_containers and text[value_index : value_index + 1] == "{":
+            nested = lazy_containers[key]
+            if nested is None:
+                return _index_object(text, value_index)
+            return _decode_object(text, value_index, nested)
+        return _DECODER.raw_decode(text, value_index)
+
+    return _scan_object(text, index, read_value)
+
+
+def _index_object(text: str, index: int) -> tuple[LazyJsonObject, int]:
+    """Decode the members of the object starting at index and keep them packed."""
+
+    def read_value(_key: str, value_index: int) -> tuple[_Packed, int]:
+        value, end = _DECODER.raw_decode(text, value_index)
+        return _Packed(marshal.dumps(value)), end
+
+    entries, end = _scan_object(text, index, read_value)
+    return LazyJsonObject(entries), end
+
+
+def load_json_lazily(text: str) -> dict[str, Any]:
+    """Decode a JSON object, keeping the entries of definition containers packed until accessed.
+
+    Raises json.JSONDecodeError if text is not a single valid JSON object.
+    """
+    index = _skip_whitespace(text, 0)
+    result, end = _decode_object(text, index, LAZY_CONTAINERS)
+    if _skip_whitespace(text, end) != len(text):
+        msg = "Extra data"
+        raise json.JSONDecodeError(msg, text, end)
+    return result
+
+
+__all__ = [
+    "LAZY_CONTAINERS",
+    "LazyJsonObject",
+    "load_json_lazily",
+]
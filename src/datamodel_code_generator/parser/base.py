@@ -15,6 +15,7 @@ import sys
 from abc import ABC, abstractmethod
 from collections import Counter, OrderedDict, defaultdict
 from collections.abc import Callable, Hashable, Sequence
+from heapq import heappop, heappush
 from itertools import groupby
 from pathlib import Path
 from typing import (
@@ -48,11 +49,13 @@ from datamodel_code_generator import (
     ReadOnlyWriteOnlyModelType,
     ReuseScope,
     YamlValue,
+    load_data,
 )
 from datamodel_code_generator.format import (
     CodeFormatter,
     Formatter,
     PythonVersion,
+    get_code_formatter,
 )
 from datamodel_code_generator.imports import (
     IMPORT_ANNOTATIONS,
@@ -83,6 +86,7 @@ from datamodel_code_generator.parser import DefaultPutDict, LiteralType
 from datamodel_code_generator.parser._graph import stable_toposort
 from datamodel_code_generator.parser._scc import find_circular_sccs, strongly_connected_components
 from datamodel_code_generator.reference import ModelResolver, ModelType, Reference
+from datamodel_code_generator.timings import timed, timed_phase
 from datamodel_code_generator.types import ANY, DataType, DataTypeManager
 from datamodel_code_generator.util import camel_to_snake, model_copy, model_dump
 
@@ -91,6 +95,7 @@ if TYPE_CHECKING:
 
     from datamodel_code_generator._types import ParserConfigDict
     from datamodel_code_generator.config import ParserConfig
+    from datamodel_code_generator.http import HTTPCache
     from datamodel_code_generator.parser.schema_version import JsonSchemaFeatures
 
 ParserConfigT = TypeVar("ParserConfigT", bound="ParserConfig")
@@ -451,46 +456,80 @@ def add_model_path_to_list(
     return paths
 
 
-def sort_data_models(  # noqa: PLR0912, PLR0915
+def _resolve_models_in_passes(
+    unsorted_data_models: list[DataModel],
+    sorted_data_models: SortedDataModels,
+    require_update_action: Callable[[DataModel], None],
+    max_passes: int,
+) -> list[DataModel]:
+    """Move every model whose references can be resolved into sorted_data_models and return the rest.
+
+    The order is the one produced by scanning the unresolved models in list order, pass after
+    pass, adding each model once all its references (besides itself) are sorted: a model is
+    added in the pass after the last of its references, or in the same pass when that reference
+    comes earlier in the list. Instead of re-scanning, each model waits on the paths it still
+    needs and is scheduled by (pass, position) as soon as the last of them is sorted.
+    """
+    waiting: defaultdict[str, list[int]] = defaultdict(list)
+    pending: list[int] = []
+    earliest_pass: list[int] = [1] * len(unsorted_data_models)
+    ready: list[tuple[int, int]] = []
+    for index, model in enumerate(unsorted_data_models):
+        needed = {path for path in model.reference_classes if path != model.path and path not in sorted_data_models}
+        for path in needed:
+            waiting[path].append(index)
+        pending.append(len(needed))
+        if not needed:
+            heappush(ready, (1, index))
+
+    resolved = [False] * len(unsorted_data_models)
+    while ready:
+        pass_number, index = heappop(ready)
+        if pass_number > max_passes:
+            break
+        model = unsorted_data_models[index]
+        resolved[index] = True
+        sorted_data_models[model.path] = model
+        if model.path in model.reference_classes:
+            require_update_action(model)
+        for waiting_index in waiting.pop(model.path, ()):
+            # A reference sorted later in the list is only seen by the next pass.
+            available_pass = pass_number if index < waiting_index else pass_number + 1
+            earliest_pass[waiting_index] = max(earliest_pass[waiting_index], available_pass)
+            pending[waiting_index] -= 1
+            if not pending[waiting_index]:
+                heappush(ready, (earliest_pass[waiting_index], waiting_index))
+
+    return [model for index, model in enumerate(unsorted_data_models) if not resolved[index]]
+
+
+def sort_data_models(  # noqa: PLR0912
     unsorted_data_models: list[DataModel],
     sorted_data_models: SortedDataModels | None = None,
     require_update_action_models: list[str] | None = None,
     recursion_count: int = MAX_RECURSION_COUNT,
 ) -> tuple[list[DataModel], SortedDataModels, list[str]]:
-    """Sort data models by dependency order for correct forward references."""
+    """Sort data models by dependency order for correct forward references.
+
+    recursion_count bounds the number of passes after the first one, as the recursion depth did
+    when every pass was a recursive call.
+    """
     if sorted_data_models is None:
         sorted_data_models = OrderedDict()
     if require_update_action_models is None:
         require_update_action_models = []
-    sorted_model_count: int = len(sorted_data_models)
-
-    unresolved_references: list[DataModel] = []
-    for model in unsorted_data_models:
-        if not model.reference_classes:
-            sorted_data_models[model.path] = model
-        elif model.path in model.reference_classes and len(model.reference_classes) == 1:  # only self-referencing
-            sorted_data_models[model.path] = model
-            add_model_path_to_list(require_update_action_models, model)
-        elif (
-            not model.reference_classes - {model.path} - sorted_data_models.keys()
-        ):  # reference classes have been resolved
-            sorted_data_models[model.path] = model
-            if model.path in model.reference_classes:
-                add_model_path_to_list(require_update_action_models, model)
-        else:
-            unresolved_references.append(model)
-    if unresolved_references:
-        if sorted_model_count != len(sorted_data_models) and recursion_count:
-            try:
-                return sort_data_models(
-                    unresolved_references,
-                    sorted_data_models,
-                    require_update_action_models,
-                    recursion_count - 1,
-                )
-            except RecursionError:  # pragma: no cover
-                pass
+    require_update_action_paths = set(require_update_action_models)
+
+    def require_update_action(model: DataModel) -> None:
+        # Same as add_model_path_to_list, with a set for the membership test.
+        if not model.is_alias and model.path not in require_update_action_paths:
+            require_update_action_paths.add(model.path)
+            require_update_action_models.append(model.path)
 
+    unresolved_references = _resolve_models_in_passes(
+        unsorted_data_models, sorted_data_models, require_update_action, recursion_count + 1
+    )
+    if unresolved_references:
         # sort on base_class dependency
         while True:
             ordered_models: list[tuple[int, DataModel]] = []
@@ -528,17 +567,21 @@ def sort_data_models(  # noqa: PLR0912, PLR0915
         # circular reference
         unsorted_data_model_names = set(path_to_index.keys())
         for model in unresolved_references:
-            unresolved_model = model.reference_classes - {model.path} - sorted_data_models.keys()
-            base_models = [getattr(s.reference, "path", None) for s in model.base_classes]
-            update_action_parent = set(require_update_action_models).intersection(base_models)
+            # Membership tests instead of `- sorted_data_models.keys()`, which iterates over every sorted model.
+            unresolved_model = {
+                path for path in model.reference_classes if path != model.path and path not in sorted_data_models
+            }
+            update_action_parent = any(
+                getattr(s.reference, "path", None) in require_update_action_paths for s in model.base_classes
+            )
             if not unresolved_model:
                 sorted_data_models[model.path] = model
                 if update_action_parent:
-                    add_model_path_to_list(require_update_action_models, model)
+                    require_update_action(model)
                 continue
             if not unresolved_model - unsorted_data_model_names:
                 sorted_data_models[model.path] = model
-                add_model_path_to_list(require_update_action_models, model)
+                require_update_action(model)
                 continue
             # unresolved
             unresolved_classes = ", ".join(
@@ -804,6 +847,7 @@ class Source(BaseModel):
     raw_data: dict[str, YamlValue] | None = None
 
     @classmethod
+    @timed("load input")
     def from_path(cls, path: Path, base_path: Path, encoding: str) -> Source:
         """Create a Source from a file path relative to base_path."""
         return cls(
@@ -817,6 +861,120 @@ class Source(BaseModel):
         return cls(path=Path(), raw_data=data)
 
 
+def _decode_source_text(text: str) -> dict[str, YamlValue] | None:
+    """Decode the text of an input file in a worker process, or return None if it cannot be decoded."""
+    try:
+        return load_data(text)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+class SourceDocuments:
+    """Input sources of a parser, read from disk and decoded at most once.
+
+    Every parsing phase iterates the same `Source` objects and gets the same decoded
+    document for each of them, instead of reading and decoding the files again.
+    `$ref`s to an input file reuse its text but get a document of their own, because
+    parsing an input may modify its document. read_count and load_counts record how
+    often the sources were read and decoded.
+    """
+
+    def __init__(
+        self,
+        read_sources: Callable[[], Iterator[Source]],
+        *,
+        base_path: Path | None = None,
+        lazy: bool = False,
+    ) -> None:
+        """Initialize the store with the function reading the sources, their base path and the lazy flag."""
+        self._read_sources = read_sources
+        self._base_path = base_path
+        self._lazy = lazy
+        self._sources: list[Source] | None = None
+        self._sources_by_path: dict[Path, Source] | None = None
+        self._documents: dict[Path, dict[str, YamlValue]] = {}
+        self._referenced_documents: dict[Path, dict[str, YamlValue]] = {}
+        self.read_count: int = 0
+        self.load_counts: Counter[Path] = Counter()
+
+    @property
+    def sources(self) -> list[Source]:
+        """Return the input sources, reading them on first use."""
+        if self._sources is None:
+            self._sources = list(self._read_sources())
+            self.read_count += 1
+        return self._sources
+
+    def load(self, source: Source) -> dict[str, YamlValue]:
+        """Return the decoded document of source, decoding its text on first use.
+
+        Raises the same errors as `load_data` when the text is not a mapping.
+        """
+        if source.raw_data is not None:
+            return source.raw_data
+        document = self._documents.get(source.path)
+        if document is None:
+            self.load_counts[source.path] += 1
+            document = self._documents[source.path] = load_data(source.text, lazy=self._lazy)
+        return document
+
+    def load_path(self, path: Path) -> dict[str, YamlValue] | None:
+        """Return a document for `$ref`s to the input file at path, or None if path is not an input file.
+
+        The text is decoded again instead of returning the document `load` gives the parser,
+        so changes made while parsing the input do not show up through the reference.
+        """
+        if self._base_path is None:
+            return None
+        if self._sources_by_path is None:
+            self._sources_by_path = {
+                (self._base_path / source.path).resolve(): source
+                for source in self.sources
+                if source.raw_data is None and source.path.name
+            }
+        source = self._sources_by_path.get(path.resolve())
+        if source is None:
+            return None
+        document = self._referenced_documents.get(source.path)
+        if document is None:
+            self.load_counts[source.path] += 1
+            document = self._referenced_documents[source.path] = load_data(source.text, lazy=self._lazy)
+        return document
+
+    @timed("decode sources")
+    def decode_in_parallel(self, jobs: int) -> None:
+        """Decode the input files in up to jobs worker processes.
+
+        Only the JSON or YAML decoding of each file runs in the workers; the documents are
+        sent back and stored by path. Parsing the documents, resolving references, building
+        models and every post-processing pass still run in this process in input order,
+        because they share one ModelResolver, so the output is the same as when decoding
+        one file at a time. Files that fail to decode are left to `load`, which raises where
+        it always did.
+        """
+        if jobs <= 1 or self._lazy:
+            return
+        pending = [source for source in self.sources if source.raw_data is None and source.path not in self._documents]
+        if len(pending) <= 1:
+            return
+
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        workers = min(jobs, len(pending))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            documents = list(
+                executor.map(
+                    _decode_source_text,
+                    [source.text for source in pending],
+                    chunksize=max(1, len(pending) // (workers * 4)),
+                )
+            )
+        for source, document in zip(pending, documents, strict=True):
+            if document is not None:
+                self.load_counts[source.path] += 1
+                self._documents[source.path] = document
+
+
 class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
     """Abstract base class for schema parsers.
 
@@ -975,7 +1133,9 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         self.model_extra_keys_without_x_prefix: set[str] = config.model_extra_keys_without_x_prefix or set()
         self.field_include_all_keys: bool = config.field_include_all_keys
 
-        self.remote_text_cache: DefaultPutDict[str, str] = config.remote_text_cache or DefaultPutDict()
+        self.remote_text_cache: DefaultPutDict[str, str] = (
+            config.remote_text_cache if config.remote_text_cache is not None else DefaultPutDict()
+        )
         self.current_source_path: Path | None = None
         self.use_title_as_name: bool = config.use_title_as_name
         self.use_operation_id_as_name: bool = config.use_operation_id_as_name
@@ -1074,6 +1234,12 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         self.http_query_parameters: Sequence[tuple[str, str]] | None = config.http_query_parameters
         self.http_ignore_tls: bool = config.http_ignore_tls
         self.http_timeout: float | None = config.http_timeout
+        self.http_prefetch: bool = config.http_prefetch
+        self.http_cache: HTTPCache | None = None
+        if config.http_cache_dir is not None:
+            from datamodel_code_generator.http import HTTPCache  # noqa: PLC0415
+
+            self.http_cache = HTTPCache(config.http_cache_dir, offline=config.http_offline)
         self.use_annotated: bool = config.use_annotated
         if self.use_annotated and not self.field_constraints:  # pragma: no cover
             msg = "`use_annotated=True` has to be used with `field_constraints=True`"
@@ -1100,6 +1266,13 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         self.default_field_extras: dict[str, Any] | None = config.default_field_extras
         self.formatters: list[Formatter] | None = config.formatters
         self.defer_formatting: bool = config.defer_formatting
+        self.jobs: int = config.jobs
+        self.lazy_definitions: bool = config.lazy_definitions
+        self.source_documents: SourceDocuments = SourceDocuments(
+            self._read_sources,
+            base_path=self.base_path if isinstance(source, (Path, list)) else None,
+            lazy=self.lazy_definitions,
+        )
         self.type_mappings: dict[tuple[str, str], str] = Parser._parse_type_mappings(config.type_mappings)
         self.type_overrides: dict[str, str] = config.type_overrides or {}
         self._type_override_imports: dict[str, Import] = {
@@ -1161,7 +1334,10 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
 
     @property
     def iter_source(self) -> Iterator[Source]:
-        """Iterate over all source files to be parsed."""
+        """Iterate over all source files to be parsed, reading them only the first time."""
+        return iter(self.source_documents.sources)
+
+    def _read_sources(self) -> Iterator[Source]:
         match self.source:
             case str():
                 yield Source(path=Path(), text=self.source)
@@ -1217,6 +1393,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             return normalize(custom_base_path)
         return self.base_class or None
 
+    @timed("load input")
     def _get_text_from_url(self, url: str) -> str:
         from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, get_body  # noqa: PLC0415
 
@@ -1224,7 +1401,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         return self.remote_text_cache.get_or_put(
             url,
             default_factory=lambda _url: get_body(
-                url, self.http_headers, self.http_ignore_tls, self.http_query_parameters, timeout
+                url, self.http_headers, self.http_ignore_tls, self.http_query_parameters, timeout, cache=self.http_cache
             ),
         )
 
@@ -1258,6 +1435,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         idx = models.index(original)
         models[idx] = replacement
 
+    @timed()
     def __delete_duplicate_models(self, models: list[DataModel]) -> None:  # noqa: PLR0912
         model_class_names: dict[str, DataModel] = {}
         model_to_duplicate_models: defaultdict[DataModel, list[DataModel]] = defaultdict(list)
@@ -1313,6 +1491,9 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 models_to_remove.add(duplicate_model)
 
         if self.reuse_model and self.collapse_reuse_models:
+            # Keys are computed once and only dropped for the models that a replacement below changes.
+            for model in models:
+                model.invalidate_dedup_key()
             max_iterations, iteration = len(models), 0
             while True:
                 iteration += 1
@@ -1323,7 +1504,6 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 content_key_to_models: dict[tuple[Any, ...], list[DataModel]] = defaultdict(list)
                 for model in models:
                     if model not in models_to_remove and not isinstance(model, self.data_model_root_type):
-                        model._dedup_key_cache.clear()  # noqa: SLF001
                         content_key_to_models[model.get_dedup_key(None, use_default=True)].append(model)
 
                 if not (
@@ -1341,12 +1521,14 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                     duplicate.replace_children_in_models(models, canonical.reference)
                     for child in duplicate.reference.iter_data_model_children():  # pragma: no cover
                         child.base_classes = list({c.reference: c for c in child.base_classes}.values())
+                        child.invalidate_dedup_key()
                     models_to_remove.add(duplicate)
 
         # Batch removal: O(n) instead of O(n²)
         if models_to_remove:
             models[:] = [m for m in models if m not in models_to_remove]
 
+    @timed()
     def __replace_duplicate_name_in_module(self, models: list[DataModel]) -> None:
         scoped_model_resolver = ModelResolver(
             exclude_names={i.alias or i.import_ for m in models for i in m.imports},
@@ -1370,6 +1552,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 model.class_name = duplicate_name
                 model_names[duplicate_name] = model
 
+    @timed()
     def __change_from_import(  # noqa: PLR0913, PLR0914
         self,
         models: list[DataModel],
@@ -1460,6 +1643,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 imports.append(after_import)
 
     @classmethod
+    @timed()
     def __extract_inherited_enum(cls, models: list[DataModel]) -> None:
         for model in models.copy():
             if model.fields:
@@ -1503,6 +1687,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             data_type = self.data_type(literals=type_names)
         return data_type
 
+    @timed()
     def __apply_discriminator_type(  # noqa: PLR0912, PLR0914, PLR0915
         self,
         models: list[DataModel],
@@ -1718,6 +1903,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             return data_type
         return None  # pragma: no cover
 
+    @timed()
     def __replace_unique_list_to_set(self, models: list[DataModel]) -> None:
         for model in models:
             for model_field in model.fields:
@@ -1754,6 +1940,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         return references
 
     @classmethod
+    @timed()
     def __mark_set_item_models_hashable(cls, models: list[DataModel]) -> None:
         """Mark models used as set/frozenset items with hash flag for __hash__ generation."""
         set_item_references = cls.__collect_set_item_references(models)
@@ -1766,6 +1953,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 class_body_lines.append("__hash__ = object.__hash__")
 
     @classmethod
+    @timed()
     def __set_reference_default_value_to_field(cls, models: list[DataModel]) -> None:
         for model in models:
             for model_field in model.fields:
@@ -1778,6 +1966,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                     # pragma: no cover
                     model_field.default = model_field.data_type.reference.source.default
 
+    @timed()
     def __reuse_model(self, models: list[DataModel], require_update_action_models: list[str]) -> None:
         if not self.reuse_model or self.reuse_scope == ReuseScope.Tree:
             return
@@ -1910,6 +2099,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
 
         return (shared_module,), shared_models
 
+    @timed()
     def __reuse_model_tree_scope(
         self,
         module_models: list[tuple[tuple[str, ...], list[DataModel]]],
@@ -1930,6 +2120,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         """Check if the output model type is Pydantic v2."""
         return self.data_model_type.__module__.startswith("datamodel_code_generator.model.pydantic_v2")
 
+    @timed()
     def __collapse_root_models(  # noqa: PLR0912, PLR0914, PLR0915
         self,
         models: list[DataModel],
@@ -2116,6 +2307,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                     if not root_type_model.reference.children:
                         unused_models.append(root_type_model)
 
+    @timed()
     def __set_default_enum_member(
         self,
         models: list[DataModel],
@@ -2142,6 +2334,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                     else:
                         enum_member.alias = data_type.alias
 
+    @timed()
     def __wrap_root_model_default_values(
         self,
         models: list[DataModel],
@@ -2165,6 +2358,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                     type_name=type_name,
                 )
 
+    @timed()
     def __override_required_field(
         self,
         models: list[DataModel],
@@ -2207,6 +2401,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 model.fields.insert(index, copied_original_field)
                 model.fields.remove(model_field)
 
+    @timed()
     def __sort_models(
         self,
         models: list[DataModel],
@@ -2219,6 +2414,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
 
         _reorder_models_keep_model_order(models, imports, use_deferred_annotations=use_deferred_annotations)
 
+    @timed()
     def __change_field_name(
         self,
         models: list[DataModel],
@@ -2274,6 +2470,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                         field.alias = filed_name
                     field.name = f"{current_name}_"
 
+    @timed()
     def __set_one_literal_on_default(self, models: list[DataModel]) -> None:
         if not self.use_one_literal_as_default:
             return
@@ -2286,6 +2483,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 if model_field.nullable is not True:  # pragma: no cover
                     model_field.nullable = False
 
+    @timed()
     def __fix_dataclass_field_ordering(self, models: list[DataModel]) -> None:
         """Fix field ordering for dataclasses with inheritance after defaults are set."""
         for model in models:
@@ -2345,6 +2543,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             and not dataclass_model.has_field_assignment(field)
         )
 
+    @timed()
     def __remove_overridden_models(self, models: list[DataModel]) -> list[DataModel]:
         """Remove models that are being overridden by custom types (model-level only).
 
@@ -2357,6 +2556,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         model_level_overrides = {k for k in self.type_overrides if "." not in k}
         return [m for m in models if m.class_name not in model_level_overrides]
 
+    @timed()
     def __apply_type_overrides(self, models: list[DataModel]) -> None:
         """Replace field type references with custom import types.
 
@@ -2397,6 +2597,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             self._apply_override_to_data_type(nested)
 
     @classmethod
+    @timed()
     def __update_type_aliases(cls, models: list[DataModel]) -> None:
         """Update type aliases and RootModels to properly handle forward references per PEP 484."""
         model_index: dict[str, int] = {m.class_name: i for i, m in enumerate(models)}
@@ -2429,6 +2630,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 model.has_forward_reference = True
 
     @classmethod
+    @timed()
     def __postprocess_result_modules(cls, results: dict[tuple[str, ...], Result]) -> dict[tuple[str, ...], Result]:
         def process(input_tuple: tuple[str, ...]) -> tuple[str, ...]:
             r = []
@@ -2455,6 +2657,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 results.update({init_file: init_result})
         return results
 
+    @timed()
     def __change_imported_model_name(  # noqa: PLR6301
         self,
         models: list[DataModel],
@@ -2477,6 +2680,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 class_name=True,
             ).name
 
+    @timed()
     def __alias_shadowed_imports(  # noqa: PLR6301
         self,
         models: list[DataModel],
@@ -2508,6 +2712,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         for model in models:
             _alias_base_class_imports(model, aliased_imports)
 
+    @timed()
     def __apply_generic_base_class(  # noqa: PLR0912, PLR0914, PLR0915
         self,
         processed_models: Sequence[ModuleContext],
@@ -2891,6 +3096,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
 
         return graph
 
+    @timed()
     def __resolve_circular_imports(  # noqa: PLR0914
         self,
         module_models_list: list[tuple[tuple[str, ...], list[DataModel]]],
@@ -3048,10 +3254,10 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
 
         code_formatter: CodeFormatter | None = None
         if format_:
-            code_formatter = CodeFormatter(
-                self.target_python_version,
-                settings_path,
-                self.wrap_string_literal,
+            code_formatter = get_code_formatter(
+                python_version=self.target_python_version,
+                settings_path=settings_path,
+                wrap_string_literal=self.wrap_string_literal,
                 skip_string_normalization=not self.use_double_quotes,
                 known_third_party=self.known_third_party,
                 custom_formatters=self.custom_formatter,
@@ -3070,6 +3276,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             all_exports_collision_strategy=all_exports_collision_strategy,
         )
 
+    @timed()
     def _build_module_structure(
         self,
         sorted_data_models: SortedDataModels,
@@ -3137,6 +3344,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             model_path_to_module_name,
         )
 
+    @timed()
     def _process_single_module(  # noqa: PLR0913, PLR0917
         self,
         module_: ModulePath,
@@ -3201,6 +3409,7 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
 
         return ModuleContext(module, module_, models, is_init, imports, scoped_model_resolver)
 
+    @timed()
     def _finalize_modules(
         self,
         contexts: list[ModuleContext],
@@ -3288,18 +3497,8 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         if not result and not ctx.is_init:
             return None
 
-        body = "\n".join(result)
-        if config.code_formatter:
-            try:
-                body = config.code_formatter.format_code(body)
-            except Exception as exc:  # noqa: BLE001
-                warn(
-                    f"Failed to format code: {exc!r}. Emitting unformatted output.",
-                    stacklevel=1,
-                )
-
         return Result(
-            body=body,
+            body="\n".join(result),
             future_imports=future_imports_str,
             source=ctx.models[0].file_path if ctx.models else None,
         )
@@ -3325,20 +3524,29 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
                 import_parts = [s for s in [future_imports_str, str(self.imports)] if s] if config.with_import else []
                 parts = import_parts + (["\n"] if import_parts else [])
                 parts += [str(export_imports), "", export_imports.dump_all(multiline=True)]
-                body = "\n".join(parts)
-                if config.code_formatter:
-                    try:
-                        body = config.code_formatter.format_code(body)
-                    except Exception as exc:  # noqa: BLE001
-                        warn(
-                            f"Failed to format code: {exc!r}. Emitting unformatted output.",
-                            stacklevel=1,
-                        )
                 results[init_module] = Result(
-                    body=body,
+                    body="\n".join(parts),
                     future_imports=future_imports_str,
                 )
 
+    @timed("format")
+    def _format_results(
+        self,
+        results: dict[ModulePath, Result],
+        modules: list[ModulePath],
+        code_formatter: CodeFormatter,
+    ) -> None:
+        """Format the bodies of the given modules in one batch using up to `jobs` worker processes."""
+        bodies = code_formatter.format_codes([results[module].body for module in modules], self.jobs)
+        for module, body in zip(modules, bodies, strict=True):
+            if isinstance(body, Exception):
+                warn(
+                    f"Failed to format code: {body!r}. Emitting unformatted output.",
+                    stacklevel=1,
+                )
+                continue
+            results[module].body = body
+
     def parse(  # noqa: PLR0913, PLR0914, PLR0917
         self,
         with_import: bool | None = True,  # noqa: FBT001, FBT002
@@ -3350,7 +3558,8 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         module_split_mode: ModuleSplitMode | None = None,
     ) -> str | dict[tuple[str, ...], Result]:
         """Parse schema and generate code, returning single file or module dict."""
-        self.parse_raw()
+        with timed_phase("parse_raw"):
+            self.parse_raw()
 
         config = self._prepare_parse_config(
             with_import,
@@ -3362,8 +3571,9 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
             module_split_mode,
         )
 
-        _, sorted_data_models, require_update_action_models = sort_data_models(self.results)
-        sort_base_classes_for_mro(sorted_data_models)
+        with timed_phase("sort_data_models"):
+            _, sorted_data_models, require_update_action_models = sort_data_models(self.results)
+            sort_base_classes_for_mro(sorted_data_models)
 
         (
             module_models,
@@ -3404,15 +3614,26 @@ class Parser(ABC, Generic[ParserConfigT, SchemaFeaturesT]):
         future_imports = self.imports.extract_future()
         future_imports_str = str(future_imports)
 
-        for ctx in contexts:
-            result = self._generate_module_output(
-                ctx, config, contexts, forwarder_map, require_update_action_models, future_imports_str
-            )
-            if result is not None:
-                results[ctx.module] = result
+        # Modules are rendered unformatted and then formatted together, so that ruff runs once
+        # for the whole batch and the work can be spread over `jobs` processes.
+        results_before_rendering = dict(results)
+
+        with timed_phase("render"):
+            for ctx in contexts:
+                result = self._generate_module_output(
+                    ctx, config, contexts, forwarder_map, require_update_action_models, future_imports_str
+                )
+                if result is not None:
+                    results[ctx.module] = result
+
+            if config.all_exports_scope is not None:
+                self._generate_empty_init_exports(results, contexts, config, future_imports_str)
 
-        if config.all_exports_scope is not None:
-            self._generate_empty_init_exports(results, contexts, config, future_imports_str)
+        if config.code_formatter:
+            rendered = [
+                module for module, result in results.items() if results_before_rendering.get(module) is not result
+            ]
+            self._format_results(results, rendered, config.code_formatter)
 
         if [*results] == [("__init__.py",)]:
             single_result = results["__init__.py",]
@@ -6,6 +6,8 @@ objects, interfaces, enums, scalars, inputs, and union types.
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from functools import cached_property
 from typing import (
     TYPE_CHECKING,
@@ -16,7 +18,9 @@ from typing import (
 from typing_extensions import Unpack
 
 from datamodel_code_generator import (
+    Error,
     LiteralType,
+    _is_json_text,
     snooper_to_methods,
 )
 from datamodel_code_generator.format import DatetimeClassType
@@ -37,6 +41,7 @@ except ImportError as exc:  # pragma: no cover
     msg = "Please run `$pip install 'datamodel-code-generator[graphql]`' to generate data-model from a GraphQL schema."
     raise Exception(msg) from exc  # noqa: TRY002
 
+from graphql.pyutils import natural_comparison_key
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -55,10 +60,73 @@ except AttributeError:
     graphql_resolver_kind = graphql.type.introspection.TypeFields.kind  # ty: ignore
 
 
+# Schemas built from SDL, keyed by the SHA-256 of the SDL and oldest first.
+_built_schemas: OrderedDict[str, graphql.GraphQLSchema] = OrderedDict()
+_BUILT_SCHEMAS_MAX_SIZE = 8
+
+
 def build_graphql_schema(schema_str: str) -> graphql.GraphQLSchema:
-    """Build a graphql schema from a string."""
-    schema = graphql.build_schema(schema_str)
-    return graphql.lexicographic_sort_schema(schema)
+    """Build a graphql schema from a string.
+
+    The last few schemas built are kept by the hash of their SDL, so generating from the
+    same SDL again in one process, as watch mode and `Generator` do, skips parsing and
+    validating it.
+    """
+    digest = hashlib.sha256(schema_str.encode("utf-8")).hexdigest()
+    schema = _built_schemas.get(digest)
+    if schema is None:
+        schema = graphql.lexicographic_sort_schema(graphql.build_schema(schema_str))
+        _built_schemas[digest] = schema
+        if len(_built_schemas) > _BUILT_SCHEMAS_MAX_SIZE:
+            _built_schemas.popitem(last=False)
+    else:
+        _built_schemas.move_to_end(digest)
+    return schema
+
+
+def _sort_by_name(items: list[dict[str, Any]] | None) -> list[dict[str, Any]] | None:
+    if items is None:
+        return None
+    return sorted(items, key=lambda item: natural_comparison_key(item["name"]))
+
+
+def _sort_introspection_type(type_: dict[str, Any]) -> dict[str, Any]:
+    sorted_type = {**type_}
+    for key in ("interfaces", "possibleTypes", "enumValues", "inputFields"):
+        sorted_type[key] = _sort_by_name(type_.get(key))
+    sorted_type["fields"] = _sort_by_name(
+        None
+        if type_.get("fields") is None
+        else [{**field, "args": _sort_by_name(field.get("args"))} for field in type_["fields"]]
+    )
+    return sorted_type
+
+
+def build_graphql_schema_from_introspection(introspection: dict[str, Any]) -> graphql.GraphQLSchema:
+    """Build a graphql schema from the result of an introspection query.
+
+    The result is accepted with or without the `data` envelope of a GraphQL response. Types,
+    fields, arguments and values are sorted in the result itself, which gives the same order
+    as `build_graphql_schema` without building the schema a second time.
+    """
+    result = introspection.get("data", introspection)
+    schema = result.get("__schema") if isinstance(result, dict) else None
+    if not isinstance(schema, dict):
+        msg = "Expected a GraphQL introspection result with a `__schema` object, optionally inside `data`"
+        raise Error(msg)
+    sorted_schema = {
+        **schema,
+        "types": [_sort_introspection_type(type_) for type_ in _sort_by_name(schema.get("types")) or []],
+        "directives": [
+            {
+                **directive,
+                "locations": sorted(directive.get("locations", []), key=natural_comparison_key),
+                "args": _sort_by_name(directive.get("args")),
+            }
+            for directive in _sort_by_name(schema.get("directives")) or []
+        ],
+    }
+    return graphql.build_client_schema({"__schema": sorted_schema})
 
 
 @snooper_to_methods()
@@ -504,8 +572,12 @@ class GraphQLParser(Parser["GraphQLParserConfig", "JsonSchemaFeatures"]):
             graphql.type.introspection.TypeKind.UNION: self.parse_union,
         }
 
-        combined_schema = "\n".join(source.text for source in self.iter_source)
-        schema: graphql.GraphQLSchema = build_graphql_schema(combined_schema)
+        sources = list(self.iter_source)
+        schema: graphql.GraphQLSchema
+        if len(sources) == 1 and _is_json_text(sources[0].text):
+            schema = build_graphql_schema_from_introspection(self.source_documents.load(sources[0]))
+        else:
+            schema = build_graphql_schema("\n".join(source.text for source in sources))
         self.raw_obj = schema
 
         self._resolve_types([], schema)
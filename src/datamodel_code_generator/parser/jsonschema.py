@@ -7,17 +7,22 @@ Python data models. Supports draft-04 through draft-2020-12 schemas.
 from __future__ import annotations
 
 import enum as _enum
+import hashlib
 import importlib
+import io
 import json
+import pickle  # noqa: S403
 import re
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
 from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union
 from urllib.parse import ParseResult, unquote
 from warnings import warn
+from weakref import WeakValueDictionary
 
 from pydantic import (
     Field,
@@ -51,6 +56,8 @@ from datamodel_code_generator.model.enum import (
 )
 from datamodel_code_generator.model.pydantic_v2.dataclass import DataClass as PydanticV2DataClass
 from datamodel_code_generator.parser import DefaultPutDict, LiteralType
+from datamodel_code_generator.parser._lazy_json import LazyJsonObject
+from datamodel_code_generator.parser._scc import find_circular_sccs
 from datamodel_code_generator.parser.base import (
     SPECIAL_PATH_FORMAT,
     Parser,
@@ -60,6 +67,7 @@ from datamodel_code_generator.parser.base import (
     title_to_class_name,
 )
 from datamodel_code_generator.reference import SPECIAL_PATH_MARKER, ModelType, Reference, is_url
+from datamodel_code_generator.timings import timed
 from datamodel_code_generator.types import (
     ANY,
     DataType,
@@ -89,6 +97,8 @@ if TYPE_CHECKING:
 
     from datamodel_code_generator._types import JSONSchemaParserConfigDict
     from datamodel_code_generator.config import JSONSchemaParserConfig
+    from datamodel_code_generator.parser._scc import ModuleGraph
+    from datamodel_code_generator.parser.base import Result
     from datamodel_code_generator.parser.schema_version import JsonSchemaFeatures
 
 
@@ -204,6 +214,65 @@ class Discriminator(BaseModel):
     mapping: Optional[dict[str, str]] = None  # noqa: UP045
 
 
+# Keys of a schema whose values are sub-schemas, or lists or name mappings of them.
+_SUB_SCHEMA_KEYS = (
+    "items",
+    "prefixItems",
+    "additionalProperties",
+    "unevaluatedProperties",
+    "patternProperties",
+    "propertyNames",
+    "oneOf",
+    "anyOf",
+    "allOf",
+    "properties",
+)
+
+
+def _get_pointer_child(value: Any, key: str) -> Any:
+    """Return the member or item of value named by an unescaped JSON pointer segment, or None."""
+    if isinstance(value, dict):
+        return value.get(key)
+    if isinstance(value, list) and key.isdigit() and int(key) < len(value):
+        return value[int(key)]
+    return None
+
+
+class _SchemaPickler(pickle.Pickler):
+    """Pickler for digesting raw schemas that keeps the entries of lazily loaded objects packed."""
+
+    def reducer_override(self, obj: Any) -> Any:  # noqa: PLR6301
+        """Reduce a LazyJsonObject to its stored entries instead of unpacking them."""
+        if type(obj) is LazyJsonObject:
+            return LazyJsonObject, (tuple(dict.items(obj)),)
+        return NotImplemented
+
+
+def _schema_object_key(raw: Any) -> bytes | None:
+    """Return a digest of raw that is equal only for raw schemas with the same content and key order.
+
+    Key order is part of the key because it decides the order of the generated fields. Entries of
+    lazily loaded objects are digested in their packed form, so they are not unpacked.
+    Returns None if raw can not be pickled.
+    """
+    buffer = io.BytesIO()
+    pickler = _SchemaPickler(buffer, pickle.HIGHEST_PROTOCOL)
+    # Without the memo, equal values are written the same way wherever they are and whatever their identity.
+    pickler.fast = True
+    try:
+        pickler.dump(raw)
+    except (pickle.PicklingError, TypeError, AttributeError, ValueError, RecursionError):
+        return None
+    return hashlib.sha256(buffer.getbuffer()).digest()
+
+
+# Schema objects the running parser shares between schemas, by id; they refuse attribute assignment.
+# Entries go away with their objects, so an object that reuses the id of a dead one is never matched.
+_shared_schema_objects: ContextVar[WeakValueDictionary[int, JsonSchemaObject] | None] = ContextVar(
+    "_shared_schema_objects", default=None
+)
+
+
 class JsonSchemaObject(BaseModel):
     """Represent a JSON Schema object with validation and parsing capabilities."""
 
@@ -419,6 +488,14 @@ class JsonSchemaObject(BaseModel):
             if isinstance(x_prop_names, dict):
                 self.propertyNames = model_validate(JsonSchemaObject, x_prop_names)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, unless the running parser shares this object between schemas."""
+        shared = _shared_schema_objects.get()
+        if shared is not None and shared.get(id(self)) is self:
+            msg = f"{type(self).__name__} is shared between schemas and can not be modified; use model_copy instead"
+            raise TypeError(msg)
+        super().__setattr__(name, value)
+
     @cached_property
     def is_object(self) -> bool:
         """Check if the schema represents an object type."""
@@ -528,6 +605,30 @@ def get_ref_type(ref: str) -> JSONReference:
     return JSONReference.REMOTE
 
 
+def _iter_remote_documents(raw: Any, base_url: str | None) -> Iterator[str]:
+    """Yield the HTTP(S) URLs of the documents referenced by the $ref values found anywhere in raw.
+
+    Relative references are resolved against the root $id of raw, or base_url without one.
+    """
+    from datamodel_code_generator.http import join_url  # noqa: PLC0415
+
+    if base_url is not None and isinstance(raw, dict) and isinstance(root_id := raw.get("$id"), str):
+        base_url = join_url(base_url, root_id)
+    stack = [raw]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            ref = value.get("$ref")
+            if isinstance(ref, str) and (document := ref.split("#", 1)[0]):
+                if base_url is not None:
+                    document = join_url(base_url, document).split("#", 1)[0]
+                if document.startswith(("http://", "https://")):
+                    yield document
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
 def _get_type(
     type_: str,
     format__: str | None = None,
@@ -584,6 +685,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
 
     SCHEMA_PATHS: ClassVar[list[str]] = ["#/definitions", "#/$defs"]
     SCHEMA_OBJECT_TYPE: ClassVar[type[JsonSchemaObject]] = JsonSchemaObject
+    SCHEMA_OBJECT_CACHE_SIZE: ClassVar[int] = 256
 
     COMPATIBLE_PYTHON_TYPES: ClassVar[dict[str, frozenset[str]]] = {
         "string": frozenset({"str", "String"}),
@@ -698,7 +800,10 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             options["target_datetime_class"] = DatetimeClassType.Awaredatetime
         super().__init__(source=source, config=config, **options)
 
-        self.remote_object_cache: DefaultPutDict[str, dict[str, YamlValue]] = DefaultPutDict()
+        remote_object_cache = getattr(self.config, "remote_object_cache", None)
+        self.remote_object_cache: DefaultPutDict[str, dict[str, YamlValue]] = (
+            remote_object_cache if remote_object_cache is not None else DefaultPutDict()
+        )
         self.raw_obj: dict[str, YamlValue] = {}
         self._root_id: Optional[str] = None  # noqa: UP045
         self._root_id_base_path: Optional[str] = None  # noqa: UP045
@@ -711,6 +816,9 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             *self.field_extra_keys_without_x_prefix,
         }
         self._circular_ref_cache: dict[str, bool] = {}
+        self._schema_object_cache: OrderedDict[bytes, JsonSchemaObject] = OrderedDict()
+        self._schema_object_keys: OrderedDict[int, tuple[dict[str, Any], bytes]] = OrderedDict()
+        self._shared_schema_objects: WeakValueDictionary[int, JsonSchemaObject] = WeakValueDictionary()
 
         if self.data_model_field_type.can_have_extra_keys:
             self.get_field_extra_key: Callable[[str], str] = (
@@ -1567,8 +1675,12 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         if fragment:
             pointer = [p for p in fragment.split("/") if p]
             target_schema = get_model_by_path(raw_doc, pointer)
+            if self.SCHEMA_OBJECT_CACHE_SIZE and id(target_schema) not in self._schema_object_keys:
+                cached = self._get_cached_sub_schema_object(raw_doc, pointer)
+                if cached is not None:
+                    return cached
 
-        return model_validate(self.SCHEMA_OBJECT_TYPE, target_schema)
+        return self._get_schema_object(target_schema)
 
     def _build_anchor_indexes(self, obj: JsonSchemaObject, path: list[str]) -> None:
         """Build $recursiveAnchor and $dynamicAnchor indexes for a schema object."""
@@ -1666,23 +1778,38 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         merged = self._deep_merge(ref_dict, current_dict)
         merged.pop("$ref", None)
 
-        return model_validate(self.SCHEMA_OBJECT_TYPE, merged)
+        return self._get_schema_object(merged)
 
     def _is_ref_circular(self, resolved_ref: str) -> bool:
-        """Check if a resolved $ref target contains a circular reference (cached)."""
+        """Check if a resolved $ref target is part of a $ref cycle (cached).
+
+        The $ref graph reachable from resolved_ref is built once and split into strongly connected
+        components, which classifies every target in it. Targets classified by an earlier call are
+        not expanded again, so the whole graph is walked at most once per parser.
+        """
         if resolved_ref in self._circular_ref_cache:
             return self._circular_ref_cache[resolved_ref]
+        graph: ModuleGraph = {}
+        pending = [resolved_ref]
         try:
-            result = self._has_ref_cycle(resolved_ref, resolved_ref, set())
+            while pending:
+                ref = pending.pop()
+                if (ref,) in graph:
+                    continue
+                targets = {target for target in self._get_ref_targets(ref) if target not in self._circular_ref_cache}
+                graph[ref,] = {(target,) for target in targets}
+                pending.extend(targets)
         except Exception:  # noqa: BLE001  # pragma: no cover
-            result = True
-        self._circular_ref_cache[resolved_ref] = result
-        return result
-
-    def _has_ref_cycle(self, ref_to_check: str, target: str, visited: set[str]) -> bool:
-        """Check if the schema at ref_to_check contains a reference back to target."""
-        visited.add(ref_to_check)
-        file_part, _, fragment = ref_to_check.partition("#")
+            self._circular_ref_cache[resolved_ref] = True
+            return True
+        circular_refs = {ref for scc in find_circular_sccs(graph) for (ref,) in scc}
+        for (ref,) in graph:
+            self._circular_ref_cache[ref] = ref in circular_refs
+        return self._circular_ref_cache[resolved_ref]
+
+    def _get_ref_targets(self, resolved_ref: str) -> set[str]:
+        """Return the resolved targets of every $ref found in the schema at resolved_ref."""
+        file_part, _, fragment = resolved_ref.partition("#")
         if file_part and is_url(file_part):
             base_path = None
             root_path = [file_part]
@@ -1700,26 +1827,21 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             if fragment:
                 pointer = [p for p in fragment.split("/") if p]
                 raw_obj = get_model_by_path(raw_doc, pointer)
-            return self._walk_for_ref(raw_obj, target, visited)
-
-    def _walk_for_ref(self, data: dict[str, Any] | list[Any], target: str, visited: set[str]) -> bool:
-        """Recursively walk raw dict/list data looking for a $ref that resolves to target."""
-        if isinstance(data, dict):
-            ref_value = data.get("$ref")
-            if isinstance(ref_value, str):
-                try:
-                    resolved = self.model_resolver.resolve_ref(ref_value)
-                except Exception:  # noqa: BLE001
-                    resolved = ref_value
-                if resolved == target:
-                    return True
-                if resolved not in visited and self._has_ref_cycle(resolved, target, visited):
-                    return True
-            for value in data.values():
-                if isinstance(value, (dict, list)) and self._walk_for_ref(value, target, visited):
-                    return True
-            return False
-        return any(isinstance(item, (dict, list)) and self._walk_for_ref(item, target, visited) for item in data)
+            targets: set[str] = set()
+            stack = [raw_obj]
+            while stack:
+                data = stack.pop()
+                if isinstance(data, dict):
+                    ref_value = data.get("$ref")
+                    if isinstance(ref_value, str):
+                        try:
+                            targets.add(self.model_resolver.resolve_ref(ref_value))
+                        except Exception:  # noqa: BLE001
+                            targets.add(ref_value)
+                    stack.extend(value for value in data.values() if isinstance(value, (dict, list)))
+                elif isinstance(data, list):
+                    stack.extend(item for item in data if isinstance(item, (dict, list)))
+            return targets
 
     def _merge_primitive_schemas(self, items: list[JsonSchemaObject]) -> JsonSchemaObject:
         """Merge multiple primitive schemas by computing the intersection of their constraints."""
@@ -1743,7 +1865,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
                     else:
                         base_dict[field] = JsonSchemaParser._intersect_constraint(field, base_dict[field], value)
 
-        return model_validate(self.SCHEMA_OBJECT_TYPE, base_dict)
+        return self._get_schema_object(base_dict)
 
     def _merge_primitive_schemas_for_allof(self, items: list[JsonSchemaObject]) -> JsonSchemaObject | None:
         """Merge primitive schemas for allOf, respecting allof_merge_mode setting."""
@@ -1761,7 +1883,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             merged_dict = model_dump(merged, exclude_unset=True, by_alias=True)
             if merged_format:
                 merged_dict["format"] = merged_format
-            return model_validate(self.SCHEMA_OBJECT_TYPE, merged_dict)
+            return self._get_schema_object(merged_dict)
 
         base_dict: dict[str, Any] = {}
         for item in items:
@@ -1780,7 +1902,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         if merged_format:
             base_dict["format"] = merged_format
 
-        return model_validate(self.SCHEMA_OBJECT_TYPE, base_dict)
+        return self._get_schema_object(base_dict)
 
     @staticmethod
     def _intersect_constraint(field: str, val1: Any, val2: Any) -> Any:  # noqa: PLR0911
@@ -2044,14 +2166,14 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             parent_dict = model_dump(parent_prop, exclude_unset=True, by_alias=True)
             child_dict = model_dump(child_prop, exclude_unset=True, by_alias=True)
             merged_dict = self._merge_property_schemas(parent_dict, child_dict)
-            merged_properties[prop_name] = model_validate(self.SCHEMA_OBJECT_TYPE, merged_dict)
+            merged_properties[prop_name] = self._get_schema_object(merged_dict)
 
         merged_obj_dict = model_dump(child_obj, exclude_unset=True, by_alias=True)
         merged_obj_dict["properties"] = {
             k: model_dump(v, exclude_unset=True, by_alias=True) if isinstance(v, JsonSchemaObject) else v
             for k, v in merged_properties.items()
         }
-        return model_validate(self.SCHEMA_OBJECT_TYPE, merged_obj_dict)
+        return self._get_schema_object(merged_obj_dict)
 
     def _get_inherited_field_type(  # noqa: PLR0912
         self, prop_name: str, base_classes: list[Reference], visited: frozenset[str] | None = None
@@ -2188,7 +2310,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         if obj.description:
             merged_dict = model_dump(merged_schema, exclude_unset=True, by_alias=True)
             merged_dict["description"] = obj.description
-            merged_schema = model_validate(self.SCHEMA_OBJECT_TYPE, merged_dict)
+            merged_schema = self._get_schema_object(merged_dict)
 
         return self.parse_root_type(name, merged_schema, path)
 
@@ -2229,7 +2351,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             merged_schema["required"] = list(dict.fromkeys(merged_schema["required"]))
 
         merged_schema.pop("allOf", None)
-        return model_validate(self.SCHEMA_OBJECT_TYPE, merged_schema)
+        return self._get_schema_object(merged_schema)
 
     def parse_combined_schema(
         self,
@@ -2251,8 +2373,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
                         refs.append(index)
                     else:
                         combined_schemas.append(
-                            model_validate(
-                                self.SCHEMA_OBJECT_TYPE,
+                            self._get_schema_object(
                                 self._deep_merge(
                                     base_object, model_dump(merged_attr, exclude_unset=True, by_alias=True)
                                 ),
@@ -2263,8 +2384,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
                     refs.append(index)
             else:
                 combined_schemas.append(
-                    model_validate(
-                        self.SCHEMA_OBJECT_TYPE,
+                    self._get_schema_object(
                         self._deep_merge(
                             base_object,
                             model_dump(target_attribute, exclude_unset=True, by_alias=True),
@@ -3761,21 +3881,68 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
                 path = f"//{parsed.netloc}{path}"
             file_path = Path(path)
             return self.remote_object_cache.get_or_put(
-                ref, default_factory=lambda _: load_data_from_path(file_path, self.encoding)
+                ref, default_factory=lambda _: load_data_from_path(file_path, self.encoding, lazy=self.lazy_definitions)
             )
         return self.remote_object_cache.get_or_put(
-            ref, default_factory=lambda key: load_data(self._get_text_from_url(key))
+            ref, default_factory=lambda key: load_data(self._get_text_from_url(key), lazy=self.lazy_definitions)
         )
 
     def _get_ref_body_from_remote(self, resolved_ref: str) -> dict[str, YamlValue]:
         """Get reference body from a remote file path."""
         full_path = self.base_path / resolved_ref
 
-        return self.remote_object_cache.get_or_put(
-            str(full_path),
-            default_factory=lambda _: load_data_from_path(full_path, self.encoding),
-        )
+        def load(_: str) -> dict[str, YamlValue]:
+            document = self.source_documents.load_path(full_path)
+            if document is None:
+                document = load_data_from_path(full_path, self.encoding, lazy=self.lazy_definitions)
+            return document
+
+        return self.remote_object_cache.get_or_put(str(full_path), default_factory=load)
+
+    @timed()
+    def prefetch_remote_refs(self) -> None:
+        """Fetch all remote documents reachable through $ref from the input concurrently.
+
+        The documents are stored in remote_text_cache, so resolving references while parsing
+        does not wait on the network. Each round fetches the documents referenced by the ones
+        fetched in the previous round, until no new document turns up. Relative references of
+        local input files are not followed; remote documents they lead to are fetched on use.
+        """
+        import yaml  # noqa: PLC0415
 
+        from datamodel_code_generator.http import DEFAULT_HTTP_TIMEOUT, get_bodies  # noqa: PLC0415
+
+        base_url = self.source.geturl() if isinstance(self.source, ParseResult) else None
+        pending: set[str] = set()
+        for source in self.iter_source:
+            try:
+                raw = self.source_documents.load(source)
+            except (TypeError, yaml.YAMLError):
+                continue
+            pending.update(_iter_remote_documents(raw, base_url))
+
+        timeout = self.http_timeout if self.http_timeout is not None else DEFAULT_HTTP_TIMEOUT
+        seen: set[str] = set()
+        while pending := pending - seen - self.remote_text_cache.keys():
+            seen |= pending
+            bodies = get_bodies(
+                sorted(pending),
+                self.http_headers,
+                self.http_ignore_tls,
+                self.http_query_parameters,
+                timeout,
+                cache=self.http_cache,
+            )
+            pending = set()
+            for url, text in bodies.items():
+                self.remote_text_cache[url] = text
+                try:
+                    raw = load_data(text)
+                except (TypeError, yaml.YAMLError):
+                    continue
+                pending.update(_iter_remote_documents(raw, url))
+
+    @timed()
     def resolve_ref(self, object_ref: str) -> Reference:
         """Resolve a reference by loading and parsing the referenced schema."""
         reference = self.model_resolver.add_ref(object_ref)
@@ -3915,6 +4082,80 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         yield
         self.root_id = previous_root_id
 
+    @contextmanager
+    def shared_schema_objects_context(self) -> Generator[None, None, None]:
+        """Context manager that makes the schema objects this parser shares refuse attribute assignment."""
+        token = _shared_schema_objects.set(self._shared_schema_objects)
+        try:
+            yield
+        finally:
+            _shared_schema_objects.reset(token)
+
+    def _get_schema_object(self, raw: dict[str, YamlValue] | YamlValue) -> JsonSchemaObject:
+        """Validate raw as SCHEMA_OBJECT_TYPE, returning the same instance for raw schemas with the same content.
+
+        Raw schemas are keyed by a digest of their content, so a definition that is parsed and also
+        loaded through $ref, or a schema that is repeated byte for byte, is validated once. The digest
+        of a raw dict is remembered by identity, so a dict that is validated again is not digested
+        again. The last SCHEMA_OBJECT_CACHE_SIZE objects are kept. Returned objects are shared: while
+        the parser runs, assigning to their attributes raises TypeError.
+        """
+        if not self.SCHEMA_OBJECT_CACHE_SIZE or not isinstance(raw, dict):
+            return model_validate(self.SCHEMA_OBJECT_TYPE, raw)
+        key_entry = self._schema_object_keys.get(id(raw))
+        key = key_entry[1] if key_entry is not None else _schema_object_key(raw)
+        if key is None:
+            return model_validate(self.SCHEMA_OBJECT_TYPE, raw)
+        obj = self._schema_object_cache.get(key)
+        if obj is None:
+            obj = model_validate(self.SCHEMA_OBJECT_TYPE, raw)
+        self._share_schema_object(raw, key, obj)
+        return obj
+
+    def _share_schema_object(self, raw: dict[str, Any], key: bytes, obj: JsonSchemaObject) -> None:
+        """Cache obj under the digest key of the raw dict it was validated from, and freeze it."""
+        cache = self._schema_object_cache
+        cache[key] = obj
+        cache.move_to_end(key)
+        keys = self._schema_object_keys
+        # The raw dict is kept with its key, so its id can not be reused while the entry exists.
+        keys[id(raw)] = raw, key
+        keys.move_to_end(id(raw))
+        self._shared_schema_objects[id(obj)] = obj
+        while len(cache) > self.SCHEMA_OBJECT_CACHE_SIZE:
+            cache.popitem(last=False)
+        while len(keys) > self.SCHEMA_OBJECT_CACHE_SIZE:
+            keys.popitem(last=False)
+
+    def _get_cached_sub_schema_object(self, raw_doc: Any, pointer: list[str]) -> JsonSchemaObject | None:
+        """Return the schema at pointer taken from the validated object of its nearest cached ancestor.
+
+        Only ancestors whose raw dict was validated before are looked up, so no ancestor is digested.
+        Returns None if no ancestor is cached or the pointer leaves the sub-schemas of the ancestor.
+        """
+        cache = self._schema_object_cache
+        keys = self._schema_object_keys
+        node: Any = raw_doc
+        value: Any = None
+        for segment in pointer:
+            key_entry = keys.get(id(node)) if isinstance(node, dict) else None
+            if key_entry is not None and key_entry[1] in cache:
+                value = cache[key_entry[1]]
+            key = unescape_json_pointer_segment(segment)
+            node = _get_pointer_child(node, key)
+            if value is not None:
+                if isinstance(value, JsonSchemaObject):
+                    value = getattr(value, key) if key in _SUB_SCHEMA_KEYS else None
+                else:
+                    value = _get_pointer_child(value, key)
+        if type(value) is not self.SCHEMA_OBJECT_TYPE or not isinstance(node, dict):
+            return None
+        node_key = _schema_object_key(node)
+        if node_key is None:
+            return None
+        self._share_schema_object(node, node_key, value)
+        return value
+
     def _validate_schema_object(
         self,
         raw: dict[str, YamlValue] | YamlValue,
@@ -3922,7 +4163,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
     ) -> JsonSchemaObject:
         """Validate raw data as JsonSchemaObject with path context in errors."""
         try:
-            return model_validate(self.SCHEMA_OBJECT_TYPE, raw)
+            return self._get_schema_object(raw)
         except SchemaParseError:
             raise
         except Exception as e:
@@ -4149,20 +4390,25 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
             ):
                 yield source, path_parts
 
+    def parse(self, *args: Any, **kwargs: Any) -> str | dict[tuple[str, ...], Result]:
+        """Parse schema and generate code; the schema objects shared while parsing can not be modified."""
+        with self.shared_schema_objects_context():
+            return super().parse(*args, **kwargs)
+
     def parse_raw(self) -> None:
         """Parse all raw input sources into data models."""
+        self.source_documents.decode_in_parallel(self.jobs)
+        if self.http_prefetch:
+            self.prefetch_remote_refs()
         for source, path_parts in self._get_context_source_path_parts():
-            if source.raw_data is not None:
-                raw_obj = source.raw_data
-                if not isinstance(raw_obj, dict):  # pragma: no cover
-                    warn(f"{source.path} is empty or not a dict. Skipping this file", stacklevel=2)
-                    continue
-            else:
-                try:
-                    raw_obj = load_data(source.text)
-                except TypeError:
-                    warn(f"{source.path} is empty or not a dict. Skipping this file", stacklevel=2)
-                    continue
+            try:
+                raw_obj = self.source_documents.load(source)
+            except TypeError:
+                warn(f"{source.path} is empty or not a dict. Skipping this file", stacklevel=2)
+                continue
+            if not isinstance(raw_obj, dict):  # pragma: no cover
+                warn(f"{source.path} is empty or not a dict. Skipping this file", stacklevel=2)
+                continue
             self.raw_obj = raw_obj
             title = self.raw_obj.get("title")
             title_str = str(title) if title is not None else "Model"
@@ -4183,6 +4429,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
         self._resolve_unparsed_json_pointer()
         self._generate_forced_base_models()
 
+    @timed()
     def _resolve_unparsed_json_pointer(self) -> None:
         """Resolve any remaining unparsed JSON pointer references recursively."""
         model_count: int = len(self.results)
@@ -4200,7 +4447,7 @@ class JsonSchemaParser(Parser["JSONSchemaParserConfig", "JsonSchemaFeatures"]):
                 for reserved_ref in sorted(reserved_refs):
                     if self.model_resolver.add_ref(reserved_ref, resolved=True).loaded:
                         continue
-                    self.raw_obj = dict(source.raw_data) if source.raw_data is not None else load_data(source.text)
+                    self.raw_obj = self.source_documents.load(source)
                     self.parse_json_pointer(self.raw_obj, reserved_ref, path_parts)
 
         if model_count != len(self.results):
@@ -24,7 +24,6 @@ from datamodel_code_generator import (
     Error,
     OpenAPIScope,
     YamlValue,
-    load_data,
     snooper_to_methods,
 )
 from datamodel_code_generator.enums import OpenAPIVersion, VersionMode
@@ -35,11 +34,12 @@ from datamodel_code_generator.parser.jsonschema import (
     get_model_by_path,
 )
 from datamodel_code_generator.reference import FieldNameResolver, is_url, snake_to_upper_camel
+from datamodel_code_generator.timings import timed
 from datamodel_code_generator.types import (
     DataType,
     EmptyDataType,
 )
-from datamodel_code_generator.util import BaseModel, model_dump, model_validate
+from datamodel_code_generator.util import BaseModel, model_copy, model_dump, model_validate
 
 if TYPE_CHECKING:
     from urllib.parse import ParseResult
@@ -63,6 +63,24 @@ OPERATION_NAMES: list[str] = [
     "trace",
 ]
 
+# Kinds of root selectors accepted by --openapi-reachable-from, written as "kind:value".
+REACHABILITY_SELECTOR_KINDS: tuple[str, ...] = ("path", "operation", "tag", "schema")
+
+
+def _parse_root_selectors(selectors: list[str]) -> dict[str, set[str]]:
+    """Group --openapi-reachable-from selectors by kind."""
+    root_selectors: dict[str, set[str]] = {}
+    for selector in selectors:
+        kind, separator, value = selector.partition(":")
+        if not separator or kind not in REACHABILITY_SELECTOR_KINDS or not value:
+            msg = (
+                f"Invalid --openapi-reachable-from selector {selector!r}. "
+                f"Expected one of {', '.join(f'{kind}:...' for kind in REACHABILITY_SELECTOR_KINDS)}."
+            )
+            raise Error(msg)
+        root_selectors.setdefault(kind, set()).add(value)
+    return root_selectors
+
 
 class ParameterLocation(Enum):
     """Represent OpenAPI parameter locations."""
@@ -206,6 +224,8 @@ class OpenAPIParser(JsonSchemaParser):
                 "--openapi-include-paths has no effect without --openapi-scopes paths",
                 stacklevel=2,
             )
+        self.openapi_reachable_from: list[str] | None = self.config.openapi_reachable_from  # ty: ignore
+        self._root_selectors: dict[str, set[str]] = _parse_root_selectors(self.openapi_reachable_from or [])
         self._discriminator_schemas: dict[str, dict[str, Any]] = {}
         self._discriminator_subtypes: dict[str, list[str]] = defaultdict(list)
 
@@ -226,7 +246,7 @@ class OpenAPIParser(JsonSchemaParser):
             if self.schema_features.nullable_keyword:
                 # OpenAPI 3.0: nullable: true is the standard way
                 if self.strict_nullable and isinstance(obj.type, str):
-                    obj.type = [obj.type, "null"]
+                    obj = model_copy(obj, update={"type": [obj.type, "null"]})
             else:
                 # OpenAPI 3.1+: nullable is deprecated, still process but warn in Strict mode
                 if self.config.schema_version_mode == VersionMode.Strict:
@@ -237,7 +257,7 @@ class OpenAPIParser(JsonSchemaParser):
                     )
                 # Still convert to type array for compatibility
                 if self.strict_nullable and isinstance(obj.type, str):
-                    obj.type = [obj.type, "null"]
+                    obj = model_copy(obj, update={"type": [obj.type, "null"]})
 
         return super().get_data_type(obj)
 
@@ -370,6 +390,78 @@ class OpenAPIParser(JsonSchemaParser):
             fnmatch.fnmatch(normalized_path, self._normalize_path(pattern)) for pattern in self.openapi_include_paths
         )
 
+    def _is_root_operation(self, path: str, operation: dict[str, Any]) -> bool:
+        """Check if an operation is selected by --openapi-reachable-from, or no selection is made."""
+        if not self._root_selectors:
+            return True
+        if operation.get("operationId") in self._root_selectors.get("operation", ()):
+            return True
+        if not self._root_selectors.get("tag", set()).isdisjoint(operation.get("tags") or ()):
+            return True
+        normalized_path = self._normalize_path(path)
+        return any(
+            fnmatch.fnmatch(normalized_path, self._normalize_path(pattern))
+            for pattern in self._root_selectors.get("path", ())
+        )
+
+    @timed()
+    def _collect_reachable_components(self, specification: dict[str, Any]) -> set[tuple[str, str]]:
+        """Return the (kind, name) of every component reachable through $ref from the selected roots.
+
+        Only the raw specification is walked: schemas outside the closure are never validated
+        or parsed. References into other documents are left to the regular on-demand resolution.
+        """
+        components: dict[str, Any] = specification.get("components", {})
+        pending: list[Any] = [
+            {"$ref": f"#/components/schemas/{name}"} for name in sorted(self._root_selectors.get("schema", ()))
+        ]
+        for path_name, path_item in specification.get("paths", {}).items():
+            if not isinstance(path_item, dict):
+                continue
+            methods = self.get_ref_model(path_item["$ref"]) if "$ref" in path_item else path_item
+            selected = [
+                operation
+                for operation_name, operation in methods.items()
+                if operation_name in OPERATION_NAMES
+                and isinstance(operation, dict)
+                and self._is_root_operation(path_name, operation)
+            ]
+            if selected:
+                pending.extend((*selected, methods.get("parameters"), path_item.get("parameters")))
+
+        reachable: set[tuple[str, str]] = set()
+        seen_refs: set[str] = set()
+        while pending:
+            value = pending.pop()
+            if isinstance(value, list):
+                pending.extend(value)
+                continue
+            if not isinstance(value, dict):
+                continue
+            pending.extend(value.values())
+            refs = [value["$ref"]] if isinstance(value.get("$ref"), str) else []
+            discriminator = value.get("discriminator")
+            if isinstance(discriminator, dict) and isinstance(discriminator.get("mapping"), dict):
+                refs.extend(
+                    target if target.startswith("#") else f"#/components/schemas/{target}"
+                    for target in discriminator["mapping"].values()
+                    if isinstance(target, str)
+                )
+            for ref in refs:
+                if ref in seen_refs or not ref.startswith("#/"):
+                    continue
+                seen_refs.add(ref)
+                parts = [part.replace("~1", "/").replace("~0", "~") for part in ref[2:].split("/")]
+                if len(parts) >= 3 and parts[0] == "components":  # noqa: PLR2004
+                    kind, name = parts[1], parts[2]
+                    reachable.add((kind, name))
+                    pending.append(components.get(kind, {}).get(name))
+                    if kind == "schemas":
+                        pending.extend({"$ref": subtype} for subtype in self._discriminator_subtypes.get(ref, ()))
+                else:
+                    pending.append(get_model_by_path(specification, parts))
+        return reachable
+
     def _process_path_items(  # noqa: PLR0913
         self,
         items: dict[str, dict[str, Any]],
@@ -411,6 +503,8 @@ class OpenAPIParser(JsonSchemaParser):
                 for operation_name, raw_operation in methods.items():
                     if operation_name not in OPERATION_NAMES:
                         continue
+                    if apply_path_filter and not self._is_root_operation(item_name, raw_operation):
+                        continue
                     if item_parameters:
                         if "parameters" in raw_operation:
                             raw_operation["parameters"].extend(item_parameters)
@@ -710,6 +804,9 @@ class OpenAPIParser(JsonSchemaParser):
 
     def parse_raw(self) -> None:  # noqa: PLR0912
         """Parse OpenAPI specification including schemas, paths, and operations."""
+        self.source_documents.decode_in_parallel(self.jobs)
+        if self.http_prefetch:
+            self.prefetch_remote_refs()
         for source, path_parts in self._get_context_source_path_parts():
             if self.validation:
                 warn(
@@ -742,9 +839,7 @@ class OpenAPIParser(JsonSchemaParser):
                             stacklevel=2,
                         )
 
-            specification: dict[str, Any] = (
-                dict(source.raw_data) if source.raw_data is not None else load_data(source.text)
-            )
+            specification: dict[str, Any] = self.source_documents.load(source)
             self.raw_obj = specification
             self._collect_discriminator_schemas()
             schemas: dict[str, Any] = specification.get("components", {}).get("schemas", {})
@@ -757,8 +852,11 @@ class OpenAPIParser(JsonSchemaParser):
                     "external files referenced from paths, consider using --openapi-scopes paths",
                     stacklevel=2,
                 )
+            reachable = self._collect_reachable_components(specification) if self._root_selectors else None
             if OpenAPIScope.Schemas in self.open_api_scopes:
                 for obj_name, raw_obj in schemas.items():
+                    if reachable is not None and ("schemas", obj_name) not in reachable:
+                        continue
                     self.parse_raw_obj(
                         obj_name,
                         raw_obj,
@@ -782,6 +880,8 @@ class OpenAPIParser(JsonSchemaParser):
             if OpenAPIScope.RequestBodies in self.open_api_scopes:
                 request_bodies: dict[str, Any] = specification.get("components", {}).get("requestBodies", {})
                 for body_name, raw_body in request_bodies.items():
+                    if reachable is not None and ("requestBodies", body_name) not in reachable:
+                        continue
                     resolved_body = self.get_ref_model(raw_body["$ref"]) if "$ref" in raw_body else raw_body
                     content = resolved_body.get("content", {})
                     for media_type, media_obj in content.items():
@@ -17,6 +17,7 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--allow-population-by-field-name": "Allow Pydantic model population by field name (not just alias).",
     "--base-class": "Specify a custom base class for generated models.",
     "--base-class-map": "Specify different base classes for specific models via JSON mapping.",
+    "--cache-dir": "Reuse previous generation results from a persistent on-disk cache.",
     "--capitalize-enum-members": "Capitalize enum member names to UPPER_CASE format.",
     "--check": "Verify generated code matches existing output without modifying files.",
     "--class-decorators": "Add custom decorators to generated model classes.",
@@ -42,6 +43,7 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--empty-enum-field-name": "Name for empty string enum field values.",
     "--enable-command-header": "Include command-line options in file header for reproducibility.",
     "--enable-faux-immutability": "Enable faux immutability in Pydantic v1 models (allow_mutation=False).",
+    "--enable-fingerprint-header": "Stamp generated files with a fingerprint that lets `--check` skip generation.",
     "--enable-version-header": "Include tool version information in file header.",
     "--encoding": "Specify character encoding for input and output files.",
     "--enum-field-as-literal": "Convert all enum fields to Literal types instead of Enum classes.",
@@ -59,8 +61,11 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--generate-cli-command": "Generate CLI command from pyproject.toml configuration.",
     "--generate-pyproject-config": "Generate pyproject.toml configuration from CLI arguments.",
     "--graphql-no-typename": "Exclude __typename field from generated GraphQL models.",
+    "--http-cache-dir": "Cache remote documents on disk and revalidate them.",
     "--http-headers": "Fetch schema from URL with custom HTTP headers.",
     "--http-ignore-tls": "Disable TLS certificate verification for HTTPS requests.",
+    "--http-offline": "Serve remote documents only from the HTTP cache.",
+    "--http-prefetch": "Fetch remote $ref documents concurrently before parsing.",
     "--http-query-parameters": "Add query parameters to HTTP requests for remote schemas.",
     "--http-timeout": "Set timeout for HTTP requests to remote hosts.",
     "--ignore-enum-constraints": "Ignore enum constraints and use base string type instead of Enum classes.",
@@ -70,8 +75,10 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--input-file-type": "Specify the input file type for code generation.",
     "--input-model": "Import a Python type or dict schema from a module.",
     "--input-model-ref-strategy": "Strategy for referenced types when using --input-model.",
+    "--jobs": "Decode input files and format generated modules in parallel worker processes.",
     "--keep-model-order": "Keep model definition order as specified in schema.",
     "--keyword-only": "Generate dataclasses with keyword-only fields (Python 3.10+).",
+    "--lazy-definitions": "Keep definitions of large JSON schemas packed until they are used.",
     "--model-extra-keys": "Add model-level schema extensions to ConfigDict json_schema_extra.",
     "--model-extra-keys-without-x-prefix": "Strip x- prefix from model-level schema extensions and add to ConfigDic...",
     "--module-split-mode": "Split generated models into separate files, one per model class.",
@@ -83,6 +90,7 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--no-use-standard-collections": "Use typing.Dict/List instead of built-in dict/list for container types.",
     "--no-use-union-operator": "Use Union[X, Y] / Optional[X] instead of X | Y union operator.",
     "--openapi-include-paths": "Filter OpenAPI paths to include in model generation.",
+    "--openapi-reachable-from": "Generate only the components reachable from selected operations or schemas.",
     "--openapi-scopes": "Specify OpenAPI scopes to generate (schemas, paths, parameters).",
     "--original-field-name-delimiter": "Specify delimiter for original field names when using snake-case conversion.",
     "--output": "Specify the destination path for generated Python code.",
@@ -106,6 +114,7 @@ OPTION_DESCRIPTIONS: dict[str, str] = {
     "--strip-default-none": "Remove fields with None as default value from generated models.",
     "--target-pydantic-version": "Target Pydantic version for generated code compatibility.",
     "--target-python-version": "Target Python version for generated code syntax and imports.",
+    "--timings": "Report wall time and peak memory of every generation phase.",
     "--treat-dot-as-module": "Treat dots in schema names as module separators.",
     "--type-mappings": "Override default type mappings for schema formats.",
     "--type-overrides": "Replace schema model types with custom Python types via JSON mapping.",
@@ -37,7 +37,7 @@ from typing_extensions import TypeIs
 from datamodel_code_generator import Error, NamingStrategy
 from datamodel_code_generator.enums import ClassNameAffixScope
 from datamodel_code_generator.format import PythonVersion
-from datamodel_code_generator.util import ConfigDict, camel_to_snake, is_pydantic_v2, model_validator
+from datamodel_code_generator.util import ConfigDict, camel_to_snake, is_pydantic_v2, is_url, model_validator
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator, Iterator, Mapping, Sequence
@@ -80,20 +80,94 @@ class ReferenceChild(Protocol):
         ...
 
 
+def _reject_change(*_args: Any) -> Any:
+    msg = "A shared fields set can not be changed"
+    raise TypeError(msg)
+
+
+class _SharedFieldsSet(set):  # type: ignore[type-arg]
+    """Read-only fields set shared by every model instance that set the same fields.
+
+    Adding a field that is already in the set is allowed, because pydantic does that on
+    every assignment; any other change raises TypeError. Copies are plain sets.
+    """
+
+    __slots__ = ()
+
+    def add(self, element: str) -> None:
+        """Accept a field that is already in the set."""
+        if element not in self:
+            _reject_change()
+
+    update = discard = remove = pop = clear = _reject_change
+    difference_update = intersection_update = symmetric_difference_update = _reject_change
+    __ior__ = __iand__ = __isub__ = __ixor__ = _reject_change  # type: ignore[assignment]
+
+    def __copy__(self) -> set[str]:
+        """Return a plain, changeable copy."""
+        return set(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> set[str]:
+        """Return a plain, changeable copy."""
+        return set(self)
+
+    def __reduce__(self) -> tuple[type[set[str]], tuple[list[str]]]:
+        """Pickle as a plain set."""
+        return set, (list(self),)
+
+
+_SHARED_FIELDS_SETS: dict[frozenset[str], _SharedFieldsSet] = {}
+_FIELDS_SET_ATTRIBUTE = "__pydantic_fields_set__" if is_pydantic_v2() else "__fields_set__"
+_MODEL_FIELDS_ATTRIBUTE = "model_fields" if is_pydantic_v2() else "__fields__"
+
+
+def _shared_fields_set(fields: AbstractSet[str]) -> _SharedFieldsSet:
+    """Return the shared fields set holding fields."""
+    key = frozenset(fields)
+    shared = _SHARED_FIELDS_SETS.get(key)
+    if shared is None:
+        shared = _SHARED_FIELDS_SETS[key] = _SharedFieldsSet(key)
+    return shared
+
+
 class _BaseModel(BaseModel):
-    """Base model with field exclusion and pass-through support."""
+    """Base model with field exclusion and pass-through support.
+
+    Subclasses that set _share_fields_set keep a shared, read-only fields set per
+    combination of explicitly set fields instead of a set per instance, and switch to
+    another shared set when a field is assigned. Models created in large numbers use it
+    to save memory; model_fields_set and dumping with exclude_unset work as usual.
+    """
 
     _exclude_fields: ClassVar[set[str]] = set()
     _pass_fields: ClassVar[set[str]] = set()
+    _share_fields_set: ClassVar[bool] = False
 
     if not TYPE_CHECKING:  # pragma: no branch
 
         def __init__(self, **values: Any) -> None:
             super().__init__(**values)
+            if self._share_fields_set:
+                self._use_shared_fields_set()
             for pass_field_name in self._pass_fields:
                 if pass_field_name in values:
                     setattr(self, pass_field_name, values[pass_field_name])
 
+        def __setattr__(self, name: str, value: Any) -> None:
+            fields_set = getattr(self, _FIELDS_SET_ATTRIBUTE)
+            if (
+                type(fields_set) is _SharedFieldsSet
+                and name not in fields_set
+                and name in getattr(type(self), _MODEL_FIELDS_ATTRIBUTE)
+            ):
+                object.__setattr__(self, _FIELDS_SET_ATTRIBUTE, _shared_fields_set(fields_set | {name}))
+            super().__setattr__(name, value)
+
+    def _use_shared_fields_set(self) -> None:
+        """Replace the fields set of this instance with the shared set holding the same fields."""
+        fields_set = getattr(self, _FIELDS_SET_ATTRIBUTE)
+        object.__setattr__(self, _FIELDS_SET_ATTRIBUTE, _shared_fields_set(fields_set))  # noqa: PLC2801
+
     if not TYPE_CHECKING:  # pragma: no branch
         if is_pydantic_v2():
 
@@ -154,6 +228,7 @@ class Reference(_BaseModel):
     source: Optional[ReferenceChild] = None  # noqa: UP045
     children: list[ReferenceChild] = Field(default_factory=list)
     _exclude_fields: ClassVar[set[str]] = {"children"}
+    _share_fields_set: ClassVar[bool] = True
 
     @model_validator(mode="before")  # ty: ignore
     def validate_original_name(cls, values: Any) -> Any:  # noqa: N805
@@ -1206,8 +1281,3 @@ def snake_to_upper_camel(word: str, delimiter: str = "_") -> str:
         word = word[1:]
 
     return prefix + "".join(x[0].upper() + x[1:] for x in word.split(delimiter) if x)
-
-
-def is_url(ref: str) -> bool:
-    """Check if a reference string is a URL (HTTP, HTTPS, or file scheme)."""
-    return ref.startswith(("https://", "http://", "file://"))
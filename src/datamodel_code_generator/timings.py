@@ -0,0 +1,214 @@
+"""Per-phase wall time and peak memory report for a generation run.
+
+Phases are recorded only while a `Timings` instance is active (see `record_timings`),
+so the `timed` decorator and `timed_phase` cost a single ContextVar lookup otherwise.
+Phases nest: a phase started while another one is running is reported as its child,
+and a phase that is re-entered recursively is only counted once, at its outermost call.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
+REPORT_FORMAT_VERSION = 1
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+@dataclass
+class PhaseTiming:
+    """Accumulated measurements of one phase at one position in the phase tree."""
+
+    path: tuple[str, ...]
+    calls: int = 0
+    seconds: float = 0.0
+    peak_memory: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON representation of the phase."""
+        return {
+            "name": self.path[-1],
+            "path": list(self.path),
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "peak_memory": self.peak_memory,
+        }
+
+
+@dataclass
+class _Frame:
+    name: str
+    timing: PhaseTiming
+    started: float
+    memory_at_start: int
+    peak_seen: int
+
+
+class Timings:
+    """Recorder of per-phase wall time and peak memory.
+
+    peak_memory is the highest amount of memory, in bytes, allocated by a phase above
+    what was allocated when it started, taken over all of its calls. It is measured with
+    tracemalloc, which `record_timings` starts if it is not already tracing.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        self.phases: dict[tuple[str, ...], PhaseTiming] = {}
+        self._stack: list[_Frame] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the enclosed block as phase name, nested under the running phase."""
+        if any(frame.name == name for frame in self._stack):
+            yield
+            return
+        import tracemalloc  # noqa: PLC0415
+
+        path = (*self._stack[-1].timing.path, name) if self._stack else (name,)
+        timing = self.phases.get(path)
+        if timing is None:
+            timing = self.phases[path] = PhaseTiming(path)
+        tracing = tracemalloc.is_tracing()
+        memory = 0
+        if tracing:
+            memory, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1].peak_seen = max(self._stack[-1].peak_seen, peak)
+            tracemalloc.reset_peak()
+        frame = _Frame(name, timing, time.perf_counter(), memory, memory)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            timing.seconds += time.perf_counter() - frame.started
+            timing.calls += 1
+            self._stack.pop()
+            if tracing:
+                frame.peak_seen = max(frame.peak_seen, tracemalloc.get_traced_memory()[1])
+                timing.peak_memory = max(timing.peak_memory, frame.peak_seen - frame.memory_at_start)
+                if self._stack:
+                    self._stack[-1].peak_seen = max(self._stack[-1].peak_seen, frame.peak_seen)
+
+    def to_report(self) -> dict[str, Any]:
+        """Return the JSON report with phases in the order they were first entered."""
+        return {
+            "version": REPORT_FORMAT_VERSION,
+            "phases": [timing.to_dict() for timing in self.phases.values()],
+        }
+
+    def write_report(self, path: Path) -> None:
+        """Write the JSON report to path."""
+        path.write_text(json.dumps(self.to_report(), indent=2) + "\n", encoding="utf-8")
+
+
+_active_timings: ContextVar[Timings | None] = ContextVar("_active_timings", default=None)
+
+
+def get_timings() -> Timings | None:
+    """Return the timings recorder active in the current context, if any."""
+    return _active_timings.get()
+
+
+@contextmanager
+def record_timings(timings: Timings, *, trace_memory: bool = True) -> Iterator[Timings]:
+    """Record phases entered in this context into timings, tracing memory allocations meanwhile.
+
+    With trace_memory=False only wall time is measured, which avoids the tracemalloc overhead
+    when the timings themselves are what is being compared.
+    """
+    import tracemalloc  # noqa: PLC0415
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    token = _active_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _active_timings.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def timed_phase(name: str) -> AbstractContextManager[None]:
+    """Measure the enclosed block as phase name when timings are being recorded."""
+    timings = _active_timings.get()
+    if timings is None:
+        return nullcontext()
+    return timings.phase(name)
+
+
+def timed(name: str | None = None) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Decorate a function so that each call is measured as a phase, named after the function by default."""
+
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        phase_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            timings = _active_timings.get()
+            if timings is None:
+                return func(*args, **kwargs)
+            with timings.phase(phase_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _format_memory(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:  # noqa: PLR2004
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def format_timings_report(report: dict[str, Any]) -> str:
+    """Render a JSON timings report as a human readable table, children indented under their parent."""
+    rows = [
+        (
+            "  " * (len(phase["path"]) - 1) + phase["name"],
+            str(phase["calls"]),
+            f"{phase['seconds']:.3f}",
+            _format_memory(phase["peak_memory"]),
+        )
+        for phase in report["phases"]
+    ]
+    header = ("Phase", "Calls", "Time (s)", "Peak memory")
+    widths = [max(len(row[column]) for row in (header, *rows)) for column in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in (header, *rows)
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+__all__ = [
+    "PhaseTiming",
+    "Timings",
+    "format_timings_report",
+    "get_timings",
+    "record_timings",
+    "timed",
+    "timed_phase",
+]
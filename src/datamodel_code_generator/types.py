@@ -459,6 +459,7 @@ class DataType(_BaseModel):
 
     _exclude_fields: ClassVar[set[str]] = {"parent", "children"}
     _pass_fields: ClassVar[set[str]] = {"parent", "children", "data_types", "reference"}
+    _share_fields_set: ClassVar[bool] = True
 
     def __deepcopy__(self, memo: dict[int, Any] | None = None) -> DataType:
         """Create a deep copy handling circular references in parent/children fields."""
@@ -482,6 +483,7 @@ class DataType(_BaseModel):
 
         constructor = getattr(cls, "model_construct" if is_pydantic_v2() else "construct")
         new_obj: DataType = constructor(**shallow_kwargs)
+        new_obj._use_shared_fields_set()
         memo[obj_id] = new_obj
 
         for field_name in model_fields:
@@ -994,6 +996,34 @@ class Types(Enum):
     any = auto()
 
 
+@lru_cache(maxsize=64)
+def create_context_data_type(  # noqa: PLR0913, PLR0917
+    model_name: str,
+    base: type[DataType],
+    python_version: PythonVersion,
+    use_standard_collections: bool,  # noqa: FBT001
+    use_generic_container: bool,  # noqa: FBT001
+    use_union_operator: bool,  # noqa: FBT001
+    treat_dot_as_module: bool | None,  # noqa: FBT001
+    use_serialize_as_any: bool,  # noqa: FBT001
+) -> type[DataType]:
+    """Create a DataType subclass with the manager options as field defaults.
+
+    Building a pydantic model is expensive, so every DataTypeManager with the same options
+    shares one class instead of creating it for each generation run.
+    """
+    return create_model(
+        model_name,
+        python_version=(PythonVersion, python_version),
+        use_standard_collections=(bool, use_standard_collections),
+        use_generic_container=(bool, use_generic_container),
+        use_union_operator=(bool, use_union_operator),
+        treat_dot_as_module=(bool, treat_dot_as_module),
+        use_serialize_as_any=(bool, use_serialize_as_any),
+        __base__=base,
+    )
+
+
 class DataTypeManager(ABC):
     """Abstract base class for managing type mappings in code generation.
 
@@ -1037,15 +1067,15 @@ class DataTypeManager(ABC):
         self.treat_dot_as_module: bool = treat_dot_as_module or False
         self.use_serialize_as_any: bool = use_serialize_as_any
 
-        self.data_type: type[DataType] = create_model(
+        self.data_type: type[DataType] = create_context_data_type(
             "ContextDataType",
-            python_version=(PythonVersion, python_version),
-            use_standard_collections=(bool, use_standard_collections),
-            use_generic_container=(bool, use_generic_container_types),
-            use_union_operator=(bool, use_union_operator),
-            treat_dot_as_module=(bool, treat_dot_as_module),
-            use_serialize_as_any=(bool, use_serialize_as_any),
-            __base__=DataType,
+            DataType,
+            python_version,
+            use_standard_collections,
+            use_generic_container_types,
+            use_union_operator,
+            treat_dot_as_module,
+            use_serialize_as_any,
         )
 
     @abstractmethod
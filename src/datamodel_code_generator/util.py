@@ -292,6 +292,11 @@ def camel_to_snake(string: str) -> str:
     return _UNDER_SCORE_2.sub(r"\1_\2", subbed).lower()
 
 
+def is_url(ref: str) -> bool:
+    """Check if a reference string is a URL (HTTP, HTTPS, or file scheme)."""
+    return ref.startswith(("https://", "http://", "file://"))
+
+
 def model_dump(obj: _BaseModel, **kwargs: Any) -> dict[str, Any]:  # ty: ignore
     """Version-compatible model serialization (dict/model_dump)."""
     if is_pydantic_v2():
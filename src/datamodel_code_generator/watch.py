@@ -29,6 +29,7 @@ def watch_and_regenerate(
 ) -> Exit:
     """Watch input files and regenerate on changes."""
     from datamodel_code_generator.__main__ import Exit, run_generate_from_config  # noqa: PLC0415
+    from datamodel_code_generator.cache import DocumentCache, use_document_cache  # noqa: PLC0415
 
     watchfiles = _get_watchfiles()
 
@@ -39,6 +40,11 @@ def watch_and_regenerate(
 
     print(f"Watching {watch_path} for changes... (Ctrl+C to stop)")  # noqa: T201
 
+    # Documents loaded through `$ref` survive between regenerations; only the changed ones are reloaded.
+    # Parsers are not kept: every regeneration parses the schema and resolves references in full, because
+    # parsing modifies references and models in place and they can not be invalidated one at a time.
+    document_cache = DocumentCache()
+
     try:
         for changes in watchfiles.watch(
             watch_path,
@@ -46,18 +52,20 @@ def watch_and_regenerate(
             recursive=watch_path.is_dir(),
         ):
             print(f"\nDetected changes: {changes}")  # noqa: T201
+            document_cache.invalidate(Path(path) for _, path in changes)
             print("Regenerating...")  # noqa: T201
             try:
-                run_generate_from_config(
-                    config=config,
-                    input_=config.input,  # ty: ignore
-                    output=config.output,
-                    extra_template_data=extra_template_data,
-                    aliases=aliases,
-                    command_line=None,
-                    custom_formatters_kwargs=custom_formatters_kwargs,
-                    default_value_overrides=default_value_overrides,
-                )
+                with use_document_cache(document_cache):
+                    run_generate_from_config(
+                        config=config,
+                        input_=config.input,  # ty: ignore
+                        output=config.output,
+                        extra_template_data=extra_template_data,
+                        aliases=aliases,
+                        command_line=None,
+                        custom_formatters_kwargs=custom_formatters_kwargs,
+                        default_value_overrides=default_value_overrides,
+                    )
                 print("Done.")  # noqa: T201
             except Exception as e:  # noqa: BLE001
                 print(f"Error: {e}", file=sys.stderr)  # noqa: T201
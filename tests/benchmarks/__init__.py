@@ -0,0 +1,5 @@
+"""Per-stage benchmarks of code generation on synthetic schemas.
+
+Run them with `python -m tests.benchmarks run` and compare the result against the recorded
+baseline with `python -m tests.benchmarks compare`. Everything runs offline.
+"""
@@ -0,0 +1,118 @@
+"""Run the stage benchmarks or compare results against the recorded baseline.
+
+Usage:
+    # Measure every input type at the default sizes and write the results
+    python -m tests.benchmarks run --output benchmark-results.json
+
+    # Measure every output model type too
+    python -m tests.benchmarks run --all-cases --output benchmark-results.json
+
+    # Fail when a stage got slower than the baseline by more than 25%, after scaling
+    # the results by the calibration times of both runs
+    python -m tests.benchmarks compare benchmark-results.json
+
+    # Compare two runs on this machine, for example before and after a change
+    python -m tests.benchmarks compare after.json --baseline before.json
+
+    # Record a new baseline
+    python -m tests.benchmarks run --output tests/benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from tests.benchmarks.runner import (
+    CASES,
+    DEFAULT_CASES,
+    DEFAULT_MIN_SECONDS,
+    DEFAULT_REPEAT,
+    DEFAULT_SIZES,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+def _run(args: argparse.Namespace) -> int:
+    available = CASES if args.all_cases or args.cases else DEFAULT_CASES
+    cases = [case for case in available if not args.cases or case.name in args.cases]
+    unknown = set(args.cases or ()) - {case.name for case in cases}
+    if unknown:
+        print(f"Unknown cases: {', '.join(sorted(unknown))}", file=sys.stderr)
+        print(f"Available: {', '.join(case.name for case in CASES)}", file=sys.stderr)
+        return 1
+    document = run_benchmarks(
+        cases, args.sizes, repeat=args.repeat, progress=lambda label: print(label, file=sys.stderr)
+    )
+    write_results(document, args.output)
+    print(f"Wrote {args.output}", file=sys.stderr)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = load_results(args.baseline)
+    results = load_results(args.results)
+    regressions = compare_results(baseline, results, threshold=args.threshold, min_seconds=args.min_seconds)
+    scale = baseline["calibration"] / results["calibration"]
+    print(f"Current times are scaled by {scale:.2f} to the machine that recorded {args.baseline}")
+    if not regressions:
+        print(f"No stage is more than {args.threshold:.0%} slower than {args.baseline}")
+        return 0
+    print(f"{len(regressions)} stage(s) are more than {args.threshold:.0%} slower than {args.baseline}:")
+    for regression in regressions:
+        print(
+            f"  {regression.case} x {regression.size}  {regression.stage}: "
+            f"{regression.baseline:.4f}s -> {regression.current:.4f}s "
+            f"(+{regression.current / regression.baseline - 1:.0%})"
+        )
+    return 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of `python -m tests.benchmarks`."""
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure the stages of every case")
+    run.add_argument("--output", type=Path, required=True, help="results file to write")
+    run.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="number of definitions of the synthetic inputs, for example 10 1000 10000 100000",
+    )
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="generations per case; the fastest counts")
+    run.add_argument("--cases", nargs="+", help="only run these cases, such as jsonschema-pydantic_v2.BaseModel")
+    run.add_argument(
+        "--all-cases", action="store_true", help="also render JSON Schema to every other output model type"
+    )
+    run.set_defaults(func=_run)
+
+    compare = commands.add_parser("compare", help="fail when stages regressed against the baseline")
+    compare.add_argument("results", type=Path, help="results file written by the run command")
+    compare.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline results file")
+    compare.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown as a fraction of the baseline"
+    )
+    compare.add_argument(
+        "--min-seconds",
+        type=float,
+        default=DEFAULT_MIN_SECONDS,
+        help="ignore stages that got slower by less than this many seconds",
+    )
+    compare.set_defaults(func=_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""Benchmark cases, the per-stage measurement and the comparison against a baseline.
+
+Stages are the phases recorded by `datamodel_code_generator.timings`: loading the input,
+`parse_raw`, reference resolution, every post-processing pass, `sort_data_models`,
+rendering and formatting. Each is reported under its path in the phase tree, such as
+`generate/parse_raw/resolve_ref`, with the fastest time seen over the repeats.
+
+Every run also times a fixed calibration workload that does not use the generator.
+Comparisons scale the current times by the ratio of the two calibration times, so a
+baseline recorded on a faster or slower machine still applies.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import math
+import platform
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from datamodel_code_generator import DataModelType, Formatter, InputFileType, generate
+from datamodel_code_generator.timings import Timings, record_timings
+from tests.benchmarks.synthetic import (
+    build_csv,
+    build_graphql,
+    build_json_data,
+    build_json_schema,
+    build_openapi,
+    build_yaml_data,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+RESULTS_FORMAT_VERSION = 2
+DEFAULT_SIZES: tuple[int, ...] = (10, 200)
+DEFAULT_REPEAT = 3
+CALIBRATION_REPEAT = 20
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One input type rendered to one output model type."""
+
+    input_file_type: InputFileType
+    output_model_type: DataModelType
+    build: Callable[[int], str]
+
+    @property
+    def name(self) -> str:
+        """Return the identifier of the case in results files."""
+        return f"{self.input_file_type.value}-{self.output_model_type.value}"
+
+
+_BUILDERS: dict[InputFileType, Callable[[int], str]] = {
+    InputFileType.JsonSchema: build_json_schema,
+    InputFileType.OpenAPI: build_openapi,
+    InputFileType.GraphQL: build_graphql,
+    InputFileType.Json: build_json_data,
+    InputFileType.Yaml: build_yaml_data,
+    InputFileType.CSV: build_csv,
+}
+
+# Every input type with the default output, plus every output type from JSON Schema.
+CASES: tuple[BenchmarkCase, ...] = (
+    *(
+        BenchmarkCase(input_file_type, DataModelType.PydanticV2BaseModel, build)
+        for input_file_type, build in _BUILDERS.items()
+    ),
+    *(
+        BenchmarkCase(InputFileType.JsonSchema, output_model_type, build_json_schema)
+        for output_model_type in DataModelType
+        if output_model_type != DataModelType.PydanticV2BaseModel
+    ),
+)
+
+
+# Every input type with the default output; the other output types run on request.
+DEFAULT_CASES: tuple[BenchmarkCase, ...] = tuple(
+    case for case in CASES if case.output_model_type == DataModelType.PydanticV2BaseModel
+)
+
+_CALIBRATION_SOURCE = "\n".join(
+    f"class Model{index}(BaseModel):\n    name: str | None = None\n    items: list[Model{index}] = []\n"
+    for index in range(300)
+)
+
+
+class Regression(NamedTuple):
+    """A stage that got slower than the baseline by more than the allowed threshold.
+
+    current is scaled to the machine the baseline was recorded on.
+    """
+
+    case: str
+    size: str
+    stage: str
+    baseline: float
+    current: float
+
+
+def _calibration_workload() -> None:
+    """Parse, walk and compile generated-looking code and round-trip a document through JSON."""
+    tree = ast.parse(_CALIBRATION_SOURCE)
+    names = sorted(node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
+    compile(tree, "<calibration>", "exec")
+    json.loads(json.dumps({name: {"lower": name.lower(), "fields": ["name", "items"]} for name in names}))
+
+
+def calibrate(*, repeat: int = CALIBRATION_REPEAT) -> float:
+    """Return the fastest time in seconds of the calibration workload over repeat runs."""
+    fastest = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        fastest = min(fastest, time.perf_counter() - start)
+    return fastest
+
+
+def measure(case: BenchmarkCase, size: int, *, repeat: int = DEFAULT_REPEAT) -> dict[str, float]:
+    """Return the fastest time in seconds of every stage over repeat generations of case at size."""
+    source = case.build(size)
+    fastest: dict[str, float] = {}
+    for _ in range(repeat):
+        timings = Timings()
+        with record_timings(timings, trace_memory=False), timings.phase("generate"):
+            generate(
+                source,
+                input_file_type=case.input_file_type,
+                output_model_type=case.output_model_type,
+                formatters=[Formatter.BLACK, Formatter.ISORT],
+                disable_timestamp=True,
+            )
+        for timing in timings.phases.values():
+            stage = "/".join(timing.path)
+            fastest[stage] = min(fastest.get(stage, math.inf), timing.seconds)
+    return fastest
+
+
+def run_benchmarks(
+    cases: Iterable[BenchmarkCase],
+    sizes: Iterable[int],
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Measure every case at every size and return the results document with the calibration time."""
+    calibration = calibrate()
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for case in cases:
+        for size in sizes:
+            if progress is not None:
+                progress(f"{case.name} x {size}")
+            results.setdefault(case.name, {})[str(size)] = measure(case, size, repeat=repeat)
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "calibration": calibration,
+        "results": results,
+    }
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """Read a results document, rejecting ones written in another format."""
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("version") != RESULTS_FORMAT_VERSION:
+        msg = f"{path} has results format {document.get('version')!r}, expected {RESULTS_FORMAT_VERSION}"
+        raise ValueError(msg)
+    return document
+
+
+def write_results(document: dict[str, Any], path: Path) -> None:
+    """Write a results document to path."""
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> list[Regression]:
+    """Return the stages measured in both documents that got slower than the baseline by more than threshold.
+
+    Current times are first multiplied by the baseline calibration time divided by the current one.
+    A stage must also be more than min_seconds slower in absolute terms; smaller differences are mostly noise.
+    """
+    scale = baseline["calibration"] / current["calibration"]
+    regressions: list[Regression] = []
+    for case, sizes in current["results"].items():
+        for size, stages in sizes.items():
+            baseline_stages = baseline["results"].get(case, {}).get(size, {})
+            for stage, seconds in stages.items():
+                expected = baseline_stages.get(stage)
+                scaled = seconds * scale
+                if expected is None or scaled - expected <= min_seconds:
+                    continue
+                if scaled > expected * (1 + threshold):
+                    regressions.append(Regression(case, size, stage, expected, scaled))
+    return regressions
+
+
+__all__ = [
+    "CALIBRATION_REPEAT",
+    "CASES",
+    "DEFAULT_CASES",
+    "DEFAULT_MIN_SECONDS",
+    "DEFAULT_REPEAT",
+    "DEFAULT_SIZES",
+    "DEFAULT_THRESHOLD",
+    "BenchmarkCase",
+    "Regression",
+    "calibrate",
+    "compare_results",
+    "load_results",
+    "measure",
+    "run_benchmarks",
+    "write_results",
+]
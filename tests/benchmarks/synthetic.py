@@ -0,0 +1,149 @@
+"""Synthetic inputs of configurable size for every supported input type.
+
+Each builder returns the source text of an input with size model definitions. The
+definitions mix scalar types, formats, constraints, enums, arrays, `$ref` chains, cycles
+and `allOf` inheritance, so that every parsing and post-processing pass has work to do.
+Builders are deterministic: the same size always yields the same text.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import yaml
+
+ENUM_EVERY = 10
+INHERIT_EVERY = 5
+
+
+def _model_name(index: int) -> str:
+    return f"Model{index}"
+
+
+def _json_schema_definitions(size: int, ref_prefix: str) -> dict[str, Any]:
+    definitions: dict[str, Any] = {}
+    for index in range(size):
+        properties: dict[str, Any] = {
+            "id": {"type": "integer", "minimum": 0},
+            "name": {"type": "string", "maxLength": 64},
+            "createdAt": {"type": "string", "format": "date-time"},
+            "score": {"type": ["number", "null"]},
+            "tags": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+            "metadata": {"type": "object", "additionalProperties": {"type": "string"}},
+        }
+        if index:
+            properties["parent"] = {"$ref": f"{ref_prefix}{_model_name(index - 1)}"}
+            properties["related"] = {"type": "array", "items": {"$ref": f"{ref_prefix}{_model_name(index * 7 % size)}"}}
+        if index % ENUM_EVERY == 0:
+            definitions[f"Status{index}"] = {"type": "string", "enum": ["active", "inactive", f"status-{index}"]}
+            properties["status"] = {"$ref": f"{ref_prefix}Status{index}"}
+        definition: dict[str, Any] = {"type": "object", "properties": properties, "required": ["id", "name"]}
+        if index and index % INHERIT_EVERY == 0:
+            definition = {"allOf": [{"$ref": f"{ref_prefix}{_model_name(index - INHERIT_EVERY)}"}, definition]}
+        definitions[_model_name(index)] = definition
+    return definitions
+
+
+def build_json_schema(size: int) -> str:
+    """Return a JSON Schema document with size object definitions under `$defs`."""
+    definitions = _json_schema_definitions(size, "#/$defs/")
+    return json.dumps({
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "title": "Root",
+        "type": "object",
+        "properties": {"items": {"type": "array", "items": {"$ref": f"#/$defs/{_model_name(size - 1)}"}}},
+        "$defs": definitions,
+    })
+
+
+def build_openapi(size: int) -> str:
+    """Return an OpenAPI 3.0 document with size component schemas and a path per ten of them."""
+    schemas = _json_schema_definitions(size, "#/components/schemas/")
+    for schema in schemas.values():
+        for property_ in schema.get("properties", {}).values():
+            if isinstance(property_.get("type"), list):
+                property_["type"] = "number"
+                property_["nullable"] = True
+    paths = {
+        f"/models/{index}": {
+            "get": {
+                "operationId": f"getModel{index}",
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {"schema": {"$ref": f"#/components/schemas/{_model_name(index)}"}}
+                        },
+                    }
+                },
+            }
+        }
+        for index in range(0, size, ENUM_EVERY)
+    }
+    return yaml.safe_dump(
+        {
+            "openapi": "3.0.3",
+            "info": {"title": "Synthetic", "version": "1.0.0"},
+            "paths": paths,
+            "components": {"schemas": schemas},
+        },
+        sort_keys=False,
+    )
+
+
+def build_graphql(size: int) -> str:
+    """Return a GraphQL SDL document with size object types, an enum per ten of them and a query type."""
+    lines: list[str] = []
+    for index in range(size):
+        name = _model_name(index)
+        fields = ["  id: ID!", "  name: String!", "  score: Float", "  tags: [String!]!"]
+        if index:
+            fields.extend((f"  parent: {_model_name(index - 1)}", f"  related: [{_model_name(index * 7 % size)}!]"))
+        if index % ENUM_EVERY == 0:
+            lines.extend((f"enum Status{index} {{", "  ACTIVE", "  INACTIVE", "}", ""))
+            fields.append(f"  status: Status{index}")
+        lines.extend((f"type {name} {{", *fields, "}", ""))
+    lines.extend(("type Query {", *(f"  model{index}: {_model_name(index)}" for index in range(size)), "}"))
+    return "\n".join(lines) + "\n"
+
+
+def _sample_data(size: int) -> dict[str, Any]:
+    return {
+        f"item{index}": {
+            "id": index,
+            "name": f"name-{index}",
+            "score": index / 3,
+            "active": index % 2 == 0,
+            "tags": ["a", "b"],
+            "detail": {"created": "2024-01-01T00:00:00Z", "count": index},
+        }
+        for index in range(size)
+    }
+
+
+def build_json_data(size: int) -> str:
+    """Return a JSON sample document with size nested objects to infer models from."""
+    return json.dumps(_sample_data(size))
+
+
+def build_yaml_data(size: int) -> str:
+    """Return the YAML equivalent of `build_json_data`."""
+    return yaml.safe_dump(_sample_data(size), sort_keys=False)
+
+
+def build_csv(size: int) -> str:
+    """Return a CSV document with size columns and a few rows."""
+    header = ",".join(f"column{index}" for index in range(size))
+    rows = [",".join(str(row * size + index) for index in range(size)) for row in range(3)]
+    return "\n".join((header, *rows)) + "\n"
+
+
+__all__ = [
+    "build_csv",
+    "build_graphql",
+    "build_json_data",
+    "build_json_schema",
+    "build_openapi",
+    "build_yaml_data",
+]
@@ -0,0 +1,103 @@
+"""Tests for the stage benchmarks, run on the smallest inputs so that they stay fast."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from datamodel_code_generator import DataModelType, InputFileType, generate
+from tests.benchmarks.__main__ import BASELINE_PATH, main
+from tests.benchmarks.runner import (
+    CASES,
+    DEFAULT_CASES,
+    DEFAULT_SIZES,
+    BenchmarkCase,
+    Regression,
+    calibrate,
+    compare_results,
+    load_results,
+    measure,
+    write_results,
+)
+from tests.benchmarks.synthetic import build_json_schema
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _results(seconds: dict[str, float], calibration: float = 1.0) -> dict[str, object]:
+    return {"version": 2, "calibration": calibration, "results": {"case": {"10": seconds}}}
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.name)
+def test_measure_records_every_stage(case: BenchmarkCase) -> None:
+    """Every case generates and reports parsing, rendering and formatting separately."""
+    stages = measure(case, 10, repeat=1)
+    assert {"generate", "generate/parse_raw", "generate/render", "generate/format"} <= stages.keys()
+    assert all(seconds >= 0 for seconds in stages.values())
+
+
+def test_synthetic_json_schema_has_requested_size() -> None:
+    """The synthetic JSON Schema yields one model per definition plus its enums and the root."""
+    result = generate(
+        build_json_schema(20),
+        input_file_type=InputFileType.JsonSchema,
+        output_model_type=DataModelType.PydanticV2BaseModel,
+        disable_timestamp=True,
+    )
+    assert isinstance(result, str)
+    assert result.count("\nclass Model") == 20
+    assert result.count("\nclass Status") == 2
+
+
+def test_compare_results_reports_slower_stages() -> None:
+    """Stages slower than the threshold are reported, small absolute differences and new stages are not."""
+    baseline = _results({"generate": 1.0, "generate/render": 0.5, "generate/tiny": 0.001, "generate/slow": 0.001})
+    current = _results({
+        "generate": 1.2,
+        "generate/render": 0.7,
+        "generate/tiny": 0.004,
+        "generate/slow": 0.5,
+        "generate/new": 9.0,
+    })
+    assert compare_results(baseline, current, threshold=0.25, min_seconds=0.05) == [
+        Regression("case", "10", "generate/render", 0.5, 0.7),
+        Regression("case", "10", "generate/slow", 0.001, 0.5),
+    ]
+
+
+def test_compare_results_scales_by_calibration() -> None:
+    """Results from a machine twice as slow are halved before they are compared."""
+    baseline = _results({"generate": 1.0, "generate/render": 0.5})
+    current = _results({"generate": 2.2, "generate/render": 1.4}, calibration=2.0)
+    assert compare_results(baseline, current, threshold=0.25, min_seconds=0.05) == [
+        Regression("case", "10", "generate/render", 0.5, 0.7),
+    ]
+
+
+def test_calibrate() -> None:
+    """The calibration workload takes a measurable time."""
+    assert 0 < calibrate(repeat=2) < 10
+
+
+def test_baseline_covers_default_cases() -> None:
+    """The recorded baseline has every default case at the default sizes, and its calibration time."""
+    baseline = load_results(BASELINE_PATH)
+    assert baseline["calibration"] > 0
+    assert {case.name: sorted(baseline["results"].get(case.name, {}), key=int) for case in DEFAULT_CASES} == {
+        case.name: [str(size) for size in DEFAULT_SIZES] for case in DEFAULT_CASES
+    }
+
+
+def test_compare_command_exit_code(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """The compare command fails only when a stage regressed."""
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    write_results(_results({"generate": 1.0}), baseline)
+    write_results(_results({"generate": 1.1}), current)
+    assert main(["compare", str(current), "--baseline", str(baseline)]) == 0
+
+    write_results(_results({"generate": 2.0}), current)
+    assert main(["compare", str(current), "--baseline", str(baseline)]) == 1
+    assert "case x 10  generate: 1.0000s -> 2.0000s (+100%)" in capsys.readouterr().out
@@ -139,6 +139,7 @@ class GenerateConfig(TypedDict, closed=True):
     disable_timestamp: NotRequired[bool]
     enable_version_header: NotRequired[bool]
     enable_command_header: NotRequired[bool]
+    enable_fingerprint_header: NotRequired[bool]
     command_line: NotRequired[str | None]
     allow_population_by_field_name: NotRequired[bool]
     allow_extra_fields: NotRequired[bool]
@@ -184,6 +185,7 @@ class GenerateConfig(TypedDict, closed=True):
     openapi_scopes: NotRequired[list[OpenAPIScope] | None]
     include_path_parameters: NotRequired[bool]
     openapi_include_paths: NotRequired[list[str] | None]
+    openapi_reachable_from: NotRequired[list[str] | None]
     graphql_scopes: NotRequired[list[GraphQLScope] | None]
     graphql_no_typename: NotRequired[bool]
     wrap_string_literal: NotRequired[bool | None]
@@ -197,6 +199,9 @@ class GenerateConfig(TypedDict, closed=True):
     http_headers: NotRequired[Sequence[tuple[str, str]] | None]
     http_ignore_tls: NotRequired[bool]
     http_timeout: NotRequired[float | None]
+    http_prefetch: NotRequired[bool]
+    http_cache_dir: NotRequired[str | None]
+    http_offline: NotRequired[bool]
     use_annotated: NotRequired[bool]
     use_serialize_as_any: NotRequired[bool]
     use_non_positive_negative_number_constrained_types: NotRequired[bool]
@@ -252,6 +257,10 @@ class GenerateConfig(TypedDict, closed=True):
     default_value_overrides: NotRequired[Mapping[str, Any] | None]
     schema_version: NotRequired[str | None]
     schema_version_mode: NotRequired[VersionMode | None]
+    cache_dir: NotRequired[str | None]
+    jobs: NotRequired[int]
+    lazy_definitions: NotRequired[bool]
+    timings: NotRequired[str | None]
 
 
 class ValidatorDefinition(TypedDict):
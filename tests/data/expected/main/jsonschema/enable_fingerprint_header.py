@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  external_parent_root.json
+#   dependency: external_child_root.json
+#   fingerprint: [FINGERPRINT]
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class ExternalChildRoot(BaseModel):
+    somefield: int | None = None
+
+
+class Object(BaseModel):
+    metadata: ExternalChildRoot
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  reachable_from.yaml
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class Animal(BaseModel):
+    kind: str
+
+
+class Dog(Animal):
+    barks: bool | None = None
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  reachable_from.yaml
+#   timestamp: 2019-07-26T00:00:00+00:00
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel, conint
+
+
+class Category(BaseModel):
+    name: str | None = None
+    parent: Category | None = None
+
+
+class Tag(Enum):
+    new = 'new'
+    sale = 'sale'
+
+
+class PageSize(BaseModel):
+    __root__: conint(le=100)
+
+
+class Error(BaseModel):
+    code: int
+    message: str | None = None
+
+
+class Pet(BaseModel):
+    id: int
+    name: str
+    category: Category | None = None
+    tags: list[Tag] | None = None
+
+
+Category.update_forward_refs()
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen
+
+from __future__ import annotations
+
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+class Kind(Enum):
+    ball = 'ball'
+    rope = 'rope'
+
+
+class Toy(BaseModel):
+    kind: Kind | None = None
+
+
+class Pet(BaseModel):
+    name: str | None = None
+    toys: list[Toy] | None = None
+
+
+class Friend(BaseModel):
+    name: str
+    pet: Pet | None = None
+
+
+class Person(BaseModel):
+    name: str
+    pet: Pet | None = None
+    friends: list[Friend] | None = None
@@ -930,3 +930,16 @@ def test_main_graphql_no_typename(output_file: Path) -> None:
         expected_file="no_typename.py",
         extra_args=["--graphql-no-typename"],
     )
+
+
+def test_main_graphql_introspection_result(output_file: Path) -> None:
+    """Test an introspection query result generates the same models as the SDL it was taken from."""
+    run_main_and_assert(
+        input_path=GRAPHQL_DATA_PATH / "simple-star-wars-introspection.json",
+        output_path=output_file,
+        input_file_type="graphql",
+        assert_func=assert_file_content,
+        expected_file="simple_star_wars.py",
+        extra_args=["--output-model-type", "pydantic.BaseModel"],
+        transform=lambda output: output.replace("simple-star-wars-introspection.json", "simple-star-wars.graphql"),
+    )
@@ -5020,6 +5020,84 @@ def test_main_openapi_include_paths_warning_without_paths_scope() -> None:
         )
 
 
+@pytest.mark.cli_doc(
+    options=["--openapi-reachable-from"],
+    option_description="""Generate only the components reachable from selected operations or schemas.
+
+The `--openapi-reachable-from` option takes root selectors: `path:PATTERN` (an fnmatch
+pattern like `--openapi-include-paths`), `operation:OPERATION_ID`, `tag:TAG` or
+`schema:NAME`. The transitive `$ref` closure of the roots is computed on the raw
+specification, including discriminator subtypes, and only the schemas in it are parsed.
+Large platform specifications can be reduced to the part a service actually uses. With
+`--openapi-scopes paths`, only the selected operations are generated.""",
+    input_schema="openapi/reachable_from.yaml",
+    cli_args=["--openapi-reachable-from", "operation:listPets"],
+    golden_output="openapi/openapi_reachable_from/list_pets.py",
+)
+def test_main_openapi_reachable_from(output_file: Path) -> None:
+    """Generate only the components reachable from selected operations or schemas.
+
+    The `--openapi-reachable-from` option takes root selectors: `path:PATTERN` (an fnmatch
+    pattern like `--openapi-include-paths`), `operation:OPERATION_ID`, `tag:TAG` or
+    `schema:NAME`. The transitive `$ref` closure of the roots is computed on the raw
+    specification, including discriminator subtypes, and only the schemas in it are parsed.
+    Large platform specifications can be reduced to the part a service actually uses. With
+    `--openapi-scopes paths`, only the selected operations are generated.
+    """
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "reachable_from.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "openapi_reachable_from" / "list_pets.py",
+        extra_args=["--openapi-reachable-from", "operation:listPets"],
+    )
+
+
+def test_main_openapi_reachable_from_selected_operations(output_file: Path) -> None:
+    """Test only the selected operations are generated with the paths scope."""
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "reachable_from.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "openapi_reachable_from" / "selected_operations.py",
+        extra_args=[
+            "--openapi-scopes",
+            "schemas",
+            "paths",
+            "--openapi-reachable-from",
+            "operation:listPets",
+            "tag:stores",
+        ],
+    )
+
+
+def test_main_openapi_reachable_from_discriminator_subtypes(output_file: Path) -> None:
+    """Test subtypes of a selected discriminator base schema are reachable from it."""
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "reachable_from.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_OPENAPI_PATH / "openapi_reachable_from" / "discriminator_subtypes.py",
+        extra_args=["--openapi-reachable-from", "schema:Animal"],
+    )
+
+
+def test_main_openapi_reachable_from_invalid_selector(capsys: pytest.CaptureFixture, output_file: Path) -> None:
+    """Test a selector without a known kind is rejected."""
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "reachable_from.yaml",
+        output_path=output_file,
+        input_file_type="openapi",
+        expected_exit=Exit.ERROR,
+        extra_args=["--openapi-reachable-from", "listPets"],
+        capsys=capsys,
+        expected_stderr_contains="Invalid --openapi-reachable-from selector 'listPets'.",
+    )
+
+
 @SKIP_PYDANTIC_V1
 def test_main_openapi_deprecated_field(output_file: Path) -> None:
     """Test OpenAPI generation with deprecated field property."""
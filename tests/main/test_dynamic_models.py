@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import ast
 import json
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -14,10 +16,15 @@ from inline_snapshot import external_file
 
 from datamodel_code_generator import (
     DataModelType,
+    DynamicModelsCache,
+    DynamicModelsCacheInfo,
     InputFileType,
+    InvalidClassNameError,
     clear_dynamic_models_cache,
+    dynamic_models_cache_info,
     generate,
     generate_dynamic_models,
+    generate_dynamic_models_batch,
 )
 from datamodel_code_generator.config import GenerateConfig
 from datamodel_code_generator.enums import ModuleSplitMode
@@ -28,6 +35,8 @@ from tests.conftest import assert_output
 if TYPE_CHECKING:
     from typing import Any
 
+    from pytest_mock import MockerFixture
+
 
 pytestmark = pytest.mark.skipif(pydantic.VERSION < "2.0.0", reason="generate_dynamic_models requires Pydantic v2")
 
@@ -298,47 +307,135 @@ def test_non_serializable_schema_skips_cache() -> None:
     assert _make_cache_key(schema, make_config()) is None
 
 
-def test_cache_hit_inside_lock() -> None:
-    """Test cache hit after acquiring lock (double-checked locking)."""
+def test_concurrent_same_schema_generates_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Concurrent calls for the same schema wait for a single generation."""
     from datamodel_code_generator import dynamic as dcg
-    from datamodel_code_generator.dynamic import _make_cache_key
 
+    original_generate_models = dcg._generate_models
+    calls: list[int] = []
+    release = threading.Event()
+
+    def generate_models(
+        input_: dict[str, Any], config: GenerateConfig, code_cache: dcg._CodeCache
+    ) -> tuple[dict[str, type], int]:
+        calls.append(1)
+        release.wait(timeout=5)
+        return original_generate_models(input_, config, code_cache)
+
+    monkeypatch.setattr(dcg, "_generate_models", generate_models)
     schema = make_object_schema({"name": {"type": "string"}})
-    original_lock = dcg._dynamic_models_lock
-    cached_models: dict[str, type] = {"Model": type("Model", (), {})}
-    cache_populated, lock_acquired = threading.Event(), threading.Event()
-    result_holder: list[dict[str, type]] = []
-    cache_key: str | None = None
+    cache = DynamicModelsCache()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.generate, schema) for _ in range(4)]
+        while cache.cache_info().hits < 3:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.cache_info()[:3] == (3, 1, 0)
 
-    class InstrumentedLock:
-        def __enter__(self) -> None:
-            lock_acquired.set()
-            cache_populated.wait(timeout=5)
-            original_lock.__enter__()
 
-        def __exit__(self, *args: object) -> None:
-            original_lock.__exit__(*args)
+def test_concurrent_different_schemas_do_not_block(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A slow generation does not hold up a generation for another schema."""
+    from datamodel_code_generator import dynamic as dcg
+
+    original_generate_models = dcg._generate_models
+    fast_done = threading.Event()
+    slow_schema = make_object_schema({"slow": {"type": "string"}})
+
+    def generate_models(
+        input_: dict[str, Any], config: GenerateConfig, code_cache: dcg._CodeCache
+    ) -> tuple[dict[str, type], int]:
+        if input_ is slow_schema:
+            assert fast_done.wait(timeout=5)
+        return original_generate_models(input_, config, code_cache)
+
+    monkeypatch.setattr(dcg, "_generate_models", generate_models)
+    cache = DynamicModelsCache()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        slow = executor.submit(cache.generate, slow_schema)
+        executor.submit(cache.generate, make_object_schema({"fast": {"type": "string"}})).result()
+        fast_done.set()
+        assert sorted(slow.result()["Model"].model_fields) == ["slow"]
+
+
+def test_failed_generation_is_not_cached() -> None:
+    """An error reaches the caller and the next call tries again."""
+    cache = DynamicModelsCache()
+    schema = make_object_schema({"name": {"type": "string"}})
+    with pytest.raises(InvalidClassNameError):
+        cache.generate(schema, config=make_config(class_name="not a class"))
+    assert cache.cache_info()[:5] == (0, 1, 0, 0, 0)
+    assert sorted(cache.generate(schema)) == ["Model"]
 
-    dcg._dynamic_models_lock = InstrumentedLock()  # type: ignore[assignment]
 
-    try:
-        thread = threading.Thread(target=lambda: result_holder.append(generate_dynamic_models(schema)))
-        thread.start()
-        lock_acquired.wait(timeout=5)
+def test_dynamic_models_cache_lru_eviction() -> None:
+    """The least recently used entry is evicted first and counted."""
+    cache = DynamicModelsCache(max_entries=2)
+    first, second, third = (make_object_schema({f"field{i}": {"type": "string"}}) for i in range(3))
+    first_models = cache.generate(first)
+    cache.generate(second)
+    assert cache.generate(first) is first_models
+    cache.generate(third)
 
-        cache_key = _make_cache_key(schema, make_config())
-        assert cache_key is not None
-        dcg._dynamic_models_cache[cache_key] = cached_models
+    assert cache.generate(first) is first_models
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.entries) == (2, 3, 1, 2)
 
-        cache_populated.set()
-        thread.join(timeout=10)
 
-        assert len(result_holder) == 1
-        assert result_holder[0] is cached_models
-    finally:
-        cache_populated.set()
-        dcg._dynamic_models_lock = original_lock
-        dcg._dynamic_models_cache.pop(cache_key, None)  # type: ignore[arg-type]
+def test_dynamic_models_cache_max_bytes() -> None:
+    """Entries are evicted to keep the generated code within max_bytes, and larger ones are not kept."""
+    schema = make_object_schema({"name": {"type": "string"}})
+    code = generate(schema, config=make_config())
+    assert isinstance(code, str)
+    size = len(code.encode())
+
+    cache = DynamicModelsCache(max_bytes=size)
+    cache.generate(schema)
+    assert cache.cache_info().size == size
+    cache.generate(make_object_schema({"code": {"type": "string"}}))
+    assert cache.cache_info()[2:5] == (1, 1, size)
+
+    cache = DynamicModelsCache(max_bytes=size - 1)
+    assert cache.generate(schema) is not cache.generate(schema)
+    assert cache.cache_info().entries == 0
+
+
+def test_dynamic_models_cache_info() -> None:
+    """The shared cache reports its statistics and clearing resets them."""
+    schema = make_object_schema({"name": {"type": "string"}})
+    generate_dynamic_models(schema)
+    generate_dynamic_models(schema)
+    info = dynamic_models_cache_info()
+    assert (info.hits, info.misses, info.entries, info.max_entries) == (1, 1, 1, 128)
+    assert info.size > 0
+
+    assert clear_dynamic_models_cache() == 1
+    assert dynamic_models_cache_info() == DynamicModelsCacheInfo(0, 0, 0, 0, 0, 128, None)
+
+
+def test_cache_size_does_not_change_shared_cache() -> None:
+    """cache_size bounds the shared cache for the call only."""
+    for i in range(3):
+        generate_dynamic_models(make_object_schema({f"field{i}": {"type": "string"}}), cache_size=2)
+    info = dynamic_models_cache_info()
+    assert (info.entries, info.max_entries) == (2, 128)
+
+
+def test_dynamic_models_cache_caller_key(mocker: MockerFixture) -> None:
+    """A caller-supplied key replaces hashing the schema and config."""
+    make_cache_key = mocker.patch("datamodel_code_generator.dynamic._make_cache_key")
+    cache = DynamicModelsCache()
+    schema = make_object_schema({"name": {"type": "string"}})
+
+    models = cache.generate(schema, key="user")
+    assert cache.generate(schema, key="user") is models
+    assert generate_dynamic_models(schema, cache=cache, key="user") is models
+    assert cache.generate(make_object_schema({"code": {"type": "string"}}), key="code") is not models
+    make_cache_key.assert_not_called()
+    assert cache.cache_info()[:2] == (2, 2)
 
 
 def test_multi_module_output() -> None:
@@ -409,7 +506,7 @@ def test_get_relative_imports_with_module_path() -> None:
     from datamodel_code_generator.dynamic import _get_relative_imports
 
     code = "from .user import User\nfrom .order import Order"
-    imports = _get_relative_imports(code)
+    imports = _get_relative_imports(ast.parse(code))
     assert imports == {"user", "order"}
 
 
@@ -418,19 +515,19 @@ def test_get_relative_imports_with_dotted_module() -> None:
     from datamodel_code_generator.dynamic import _get_relative_imports
 
     code = "from .models.user import User"
-    imports = _get_relative_imports(code)
+    imports = _get_relative_imports(ast.parse(code))
     assert imports == {"models"}
 
 
 def test_build_module_edges_no_matching_import() -> None:
     """Test _build_module_edges when import doesn't match any module."""
-    from datamodel_code_generator.dynamic import _build_module_edges
+    from datamodel_code_generator.dynamic import _build_module_edges, _code_cache
 
     modules = {
         ("user.py",): "class User: pass",
         ("order.py",): "from .nonexistent import Something\nclass Order: pass",
     }
-    edges = _build_module_edges(modules)
+    edges = _build_module_edges({path: _code_cache.compile(code, path[0]) for path, code in modules.items()})
     assert edges["user.py",] == set()
     assert edges["order.py",] == set()
 
@@ -502,3 +599,55 @@ def test_execute_multi_module_enum_only() -> None:
     models = _execute_multi_module(modules)
     assert "Status" in models
     assert models["Status"].ACTIVE.value == "active"
+
+
+def test_generate_dynamic_models_batch() -> None:
+    """Batch generation returns models per input in order and caches repeats."""
+    user = make_object_schema({"name": {"type": "string"}}, required=["name"])
+    item = make_object_schema({"price": {"type": "number"}})
+    cache = DynamicModelsCache()
+    results = generate_dynamic_models_batch([user, item, user], max_workers=2, cache=cache)
+
+    assert results[0]["Model"](name="Alice").name == "Alice"
+    assert results[1]["Model"](price=1.5).price == 1.5
+    assert results[2] is results[0]
+    assert cache.cache_info()[:4] == (1, 2, 0, 2)
+
+    assert cache.generate_batch([item], max_workers=1)[0] is results[1]
+    assert cache.cache_info().hits == 2
+
+
+def test_generate_dynamic_models_batch_without_cache() -> None:
+    """Batch generation with caching disabled still generates every input."""
+    schema = make_object_schema({"name": {"type": "string"}})
+    results = generate_dynamic_models_batch([schema, schema], max_workers=1, cache_size=0)
+    assert results[0] is not results[1]
+    assert dynamic_models_cache_info().entries == 0
+    assert generate_dynamic_models_batch([]) == []
+
+
+def test_code_cache_reuses_compiled_modules(tmp_path: Path) -> None:
+    """Compiled modules are cached in memory and marshalled to the code cache directory."""
+    from datamodel_code_generator.dynamic import _CodeCache
+
+    source = "from .user import User\nclass Order: pass"
+    code_cache = _CodeCache(directory=tmp_path)
+    compiled = code_cache.compile(source, "<order.py>")
+    assert code_cache.compile(source, "<order.py>") is compiled
+    assert compiled.relative_imports == {"user"}
+    assert len(list(tmp_path.rglob("*.marshal"))) == 1
+
+    loaded = _CodeCache(directory=tmp_path).compile(source, "<order.py>")
+    assert loaded is not compiled
+    assert loaded.code == compiled.code
+    assert loaded.relative_imports == {"user"}
+
+
+def test_dynamic_models_cache_code_cache_dir(tmp_path: Path) -> None:
+    """A DynamicModelsCache with code_cache_dir executes code loaded from the directory."""
+    schema = make_object_schema({"name": {"type": "string"}}, required=["name"])
+    DynamicModelsCache(code_cache_dir=tmp_path).generate(schema)
+    assert list(tmp_path.rglob("*.marshal"))
+
+    models = DynamicModelsCache(code_cache_dir=tmp_path).generate(schema)
+    assert models["Model"](name="Alice").name == "Alice"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import re
+import sys
 import warnings
 from argparse import ArgumentTypeError, Namespace
 from typing import TYPE_CHECKING
@@ -17,6 +20,7 @@ from datamodel_code_generator import (
     DataModelType,
     Error,
     GeneratedModules,
+    Generator,
     InputFileType,
     SchemaParseError,
     chdir,
@@ -26,8 +30,9 @@ from datamodel_code_generator import (
 from datamodel_code_generator.__main__ import Config, Exit
 from datamodel_code_generator.arguments import _dataclass_arguments
 from datamodel_code_generator.config import GenerateConfig
-from datamodel_code_generator.format import CodeFormatter, PythonVersion
+from datamodel_code_generator.format import CodeFormatter, Formatter, PythonVersion
 from datamodel_code_generator.model.pydantic_v2 import UnionMode
+from datamodel_code_generator.parser.jsonschema import JsonSchemaParser
 from datamodel_code_generator.parser.openapi import OpenAPIParser
 from datamodel_code_generator.util import is_pydantic_v2
 from tests.conftest import assert_output, create_assert_file_content, freeze_time
@@ -1060,6 +1065,198 @@ def test_check_with_invalid_file_format(tmp_path: Path) -> None:
     )
 
 
+def _mask_fingerprint(text: str) -> str:
+    return re.sub(r"#   fingerprint: [0-9a-f]{32}-[0-9a-f]{32}", "#   fingerprint: [FINGERPRINT]", text)
+
+
+@pytest.mark.cli_doc(
+    options=["--enable-fingerprint-header"],
+    option_description="""Stamp generated files with a fingerprint that lets `--check` skip generation.
+
+The `--enable-fingerprint-header` flag adds a fingerprint line to the header of every
+generated module, and a dependency line for every `$ref` document outside the input.
+The fingerprint covers the input, those documents, the options and the versions of
+datamodel-code-generator and the formatters, plus the text of the module itself.
+`--check` with the same options recomputes it from these files alone and reports the
+output as up to date without parsing or rendering anything. On any mismatch it falls
+back to generating the output and comparing it, so the diff is reported as usual.""",
+    input_schema="jsonschema/external_parent_root.json",
+    cli_args=["--disable-timestamp", "--enable-fingerprint-header"],
+    golden_output="jsonschema/enable_fingerprint_header.py",
+    related_options=["--check"],
+)
+def test_enable_fingerprint_header(output_file: Path, mocker: MockerFixture) -> None:
+    """Stamp generated files with a fingerprint that lets `--check` skip generation.
+
+    The `--enable-fingerprint-header` flag adds a fingerprint line to the header of every
+    generated module, and a dependency line for every `$ref` document outside the input.
+    The fingerprint covers the input, those documents, the options and the versions of
+    datamodel-code-generator and the formatters, plus the text of the module itself.
+    `--check` with the same options recomputes it from these files alone and reports the
+    output as up to date without parsing or rendering anything. On any mismatch it falls
+    back to generating the output and comparing it, so the diff is reported as usual.
+    """
+    extra_args = ["--disable-timestamp", "--enable-fingerprint-header"]
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "external_parent_root.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=extra_args,
+        assert_func=assert_file_content,
+        expected_file="jsonschema/enable_fingerprint_header.py",
+        transform=_mask_fingerprint,
+    )
+    parse = mocker.patch("datamodel_code_generator.parser.jsonschema.JsonSchemaParser.parse")
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "external_parent_root.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.OK,
+    )
+    parse.assert_not_called()
+
+
+def test_check_fingerprint_falls_back_on_dependency_change(tmp_path: Path) -> None:
+    """Test --check reports the diff when a $ref document changed after the output was stamped."""
+    schema = tmp_path / "schema.json"
+    schema.write_text('{"type": "object", "properties": {"pet": {"$ref": "defs/pet.json"}}}', encoding="utf-8")
+    pet = tmp_path / "defs" / "pet.json"
+    pet.parent.mkdir()
+    pet.write_text('{"type": "object", "properties": {"name": {"type": "string"}}}', encoding="utf-8")
+    output_path = tmp_path / "output.py"
+    extra_args = ["--disable-timestamp", "--enable-fingerprint-header"]
+    run_main_and_assert(input_path=schema, output_path=output_path, input_file_type="jsonschema", extra_args=extra_args)
+    assert "#   dependency: defs/pet.json\n" in output_path.read_text(encoding="utf-8")
+
+    pet.write_text('{"type": "object", "properties": {"name": {"type": "integer"}}}', encoding="utf-8")
+    run_main_and_assert(
+        input_path=schema,
+        output_path=output_path,
+        input_file_type="jsonschema",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.DIFF,
+    )
+
+    run_main_and_assert(input_path=schema, output_path=output_path, input_file_type="jsonschema", extra_args=extra_args)
+    run_main_and_assert(
+        input_path=schema,
+        output_path=output_path,
+        input_file_type="jsonschema",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.OK,
+    )
+
+
+def test_check_fingerprint_falls_back_on_formatter_settings_change(tmp_path: Path) -> None:
+    """Test --check reports the diff when the formatter settings changed after the output was stamped."""
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[tool.black]\nline-length = 88\n", encoding="utf-8")
+    output_path = tmp_path / "output.py"
+    extra_args = ["--disable-timestamp", "--enable-fingerprint-header"]
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_path,
+        input_file_type="jsonschema",
+        extra_args=extra_args,
+    )
+
+    pyproject.write_text("[tool.black]\nline-length = 40\n", encoding="utf-8")
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_path,
+        input_file_type="jsonschema",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.DIFF,
+    )
+
+
+def test_check_fingerprint_falls_back_on_edited_output(output_file: Path, mocker: MockerFixture) -> None:
+    """Test --check generates and compares the output when a stamped module was edited."""
+    extra_args = ["--disable-timestamp", "--enable-fingerprint-header"]
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=extra_args,
+    )
+    output_file.write_text(output_file.read_text(encoding="utf-8") + "# edited\n", encoding="utf-8")
+    parse = mocker.spy(JsonSchemaParser, "parse")
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.DIFF,
+    )
+    parse.assert_called_once()
+
+
+def test_check_fingerprint_directory(output_dir: Path, mocker: MockerFixture) -> None:
+    """Test stamped modular output is confirmed without generation until a module is missing."""
+    extra_args = ["--disable-timestamp", "--enable-fingerprint-header"]
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "modular.yaml",
+        output_path=output_dir,
+        input_file_type="openapi",
+        extra_args=extra_args,
+    )
+    assert all("#   fingerprint: " in path.read_text(encoding="utf-8") for path in output_dir.rglob("*.py"))
+
+    parse = mocker.patch.object(OpenAPIParser, "parse", side_effect=AssertionError)
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "modular.yaml",
+        output_path=output_dir,
+        input_file_type="openapi",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.OK,
+    )
+    parse.assert_not_called()
+
+    mocker.stopall()
+    (output_dir / "foo" / "__init__.py").unlink()
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "modular.yaml",
+        output_path=output_dir,
+        input_file_type="openapi",
+        extra_args=[*extra_args, "--check"],
+        expected_exit=Exit.DIFF,
+    )
+
+
+def test_enable_fingerprint_header_with_cached_result(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test a cached result is stamped with the same fingerprint and dependencies as a parsed one."""
+    cache_dir = tmp_path / "cache"
+    output_path = tmp_path / "output.py"
+    options = {
+        "input_file_type": InputFileType.JsonSchema,
+        "output": output_path,
+        "enable_fingerprint_header": True,
+        "cache_dir": cache_dir,
+    }
+    generate(JSON_SCHEMA_DATA_PATH / "external_parent_root.json", **options)
+    first = output_path.read_text(encoding="utf-8")
+    assert "#   dependency: external_child_root.json\n" in first
+
+    mocker.patch.object(JsonSchemaParser, "parse", side_effect=AssertionError)
+    generate(JSON_SCHEMA_DATA_PATH / "external_parent_root.json", **options)
+    assert output_path.read_text(encoding="utf-8").split("\n")[2:] == first.split("\n")[2:]
+
+
+def test_enable_fingerprint_header_ignored_with_custom_file_header(tmp_path: Path) -> None:
+    """Test the fingerprint is not written below a custom file header."""
+    output_path = tmp_path / "output.py"
+    with pytest.warns(UserWarning, match="--enable-fingerprint-header is ignored"):
+        generate(
+            JSON_SCHEMA_DATA_PATH / "person.json",
+            input_file_type=InputFileType.JsonSchema,
+            output=output_path,
+            custom_file_header="# custom header",
+            enable_fingerprint_header=True,
+        )
+    assert "fingerprint" not in output_path.read_text(encoding="utf-8")
+
+
 @pytest.mark.cli_doc(
     options=["--all-exports-scope"],
     option_description="""Generate __all__ exports for child modules in __init__.py files.
@@ -2340,3 +2537,406 @@ def test_import_generate_config_fails_on_v1() -> None:
     """GenerateConfig should not be importable from top-level in Pydantic v1."""
     with pytest.raises(ImportError, match="only available in Pydantic v2"):
         _ = datamodel_code_generator.GenerateConfig
+
+
+@pytest.mark.cli_doc(
+    options=["--cache-dir"],
+    option_description="""Reuse previous generation results from a persistent on-disk cache.
+
+The `--cache-dir` option stores the generated code in the given directory, keyed by the
+input content and location, every `$ref` document loaded while parsing, the effective
+options, the custom template directory, the formatter versions and settings, and the tool
+version. When nothing changed, the cached result is written without parsing the schema
+again, which makes no-op regenerations in CI cheap.
+Compiled templates are kept in its `templates` subdirectory, so runs that do generate
+skip compiling them.""",
+    input_schema="jsonschema/person.json",
+    cli_args=["--disable-timestamp", "--cache-dir", ".datamodel-codegen-cache"],
+    golden_output="person.py",
+)
+def test_cache_dir_reuses_result(output_file: Path, tmp_path: Path, mocker: MockerFixture) -> None:
+    """Reuse previous generation results from a persistent on-disk cache.
+
+    The `--cache-dir` option stores the generated code in the given directory, keyed by the
+    input content and location, every `$ref` document loaded while parsing, the effective
+    options, the custom template directory, the formatter versions and settings, and the tool
+    version. When nothing changed, the cached result is written without parsing the schema
+    again, which makes no-op regenerations in CI cheap.
+    Compiled templates are kept in its `templates` subdirectory, so runs that do generate
+    skip compiling them.
+    """
+    cache_dir = tmp_path / "cache"
+    extra_args = ["--disable-timestamp", "--cache-dir", str(cache_dir)]
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=extra_args,
+        assert_func=assert_file_content,
+        expected_file="person.py",
+    )
+    assert list(cache_dir.rglob("*.json"))
+
+    output_file.unlink()
+    parse = mocker.patch("datamodel_code_generator.parser.jsonschema.JsonSchemaParser.parse")
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=extra_args,
+        assert_func=assert_file_content,
+        expected_file="person.py",
+    )
+    parse.assert_not_called()
+
+
+def test_cache_dir_invalidated_by_ref_document_change(tmp_path: Path) -> None:
+    """Test a change in a $ref document invalidates the cached result."""
+    schema = tmp_path / "schema.json"
+    schema.write_text(
+        '{"type": "object", "properties": {"pet": {"$ref": "pet.json"}}}',
+        encoding="utf-8",
+    )
+    pet = tmp_path / "pet.json"
+    pet.write_text('{"type": "object", "properties": {"name": {"type": "string"}}}', encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    first = generate(schema, input_file_type=InputFileType.JsonSchema, cache_dir=cache_dir)
+    assert isinstance(first, str)
+    assert "age" not in first
+
+    pet.write_text(
+        '{"type": "object", "properties": {"name": {"type": "string"}, "age": {"type": "integer"}}}',
+        encoding="utf-8",
+    )
+    second = generate(schema, input_file_type=InputFileType.JsonSchema, cache_dir=cache_dir)
+    assert isinstance(second, str)
+    assert "age: int | None = None" in second
+
+
+def test_cache_dir_keyed_by_input_location(tmp_path: Path) -> None:
+    """Test identical inputs whose relative $refs resolve to different documents get their own entries."""
+    cache_dir = tmp_path / "cache"
+    results = []
+    for name, pet in (
+        ("first", '{"type": "object", "properties": {"name": {"type": "string"}}}'),
+        ("second", '{"type": "object", "properties": {"age": {"type": "integer"}}}'),
+    ):
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "schema.json").write_text(
+            '{"type": "object", "properties": {"pet": {"$ref": "pet.json"}}}', encoding="utf-8"
+        )
+        (directory / "pet.json").write_text(pet, encoding="utf-8")
+        results.append(
+            generate(directory / "schema.json", input_file_type=InputFileType.JsonSchema, cache_dir=cache_dir)
+        )
+    assert isinstance(results[1], str)
+    assert "age: int | None = None" in results[1]
+    assert "name: str" not in results[1]
+
+
+def test_cache_dir_invalidated_by_formatter_settings(tmp_path: Path) -> None:
+    """Test a change of the black settings in pyproject.toml invalidates the cached result."""
+    cache_dir = tmp_path / "cache"
+    output_path = tmp_path / "output.py"
+    options = {
+        "input_file_type": InputFileType.JsonSchema,
+        "output": output_path,
+        "formatters": [Formatter.BLACK],
+        "settings_path": tmp_path,
+        "cache_dir": cache_dir,
+    }
+    schema = '{"type": "object", "properties": {"name": {"type": "string", "default": "abc"}}}'
+    (tmp_path / "pyproject.toml").write_text("[tool.black]\nskip-string-normalization = true\n", encoding="utf-8")
+    generate(schema, **options)
+    assert "name: str | None = 'abc'\n" in output_path.read_text(encoding="utf-8")
+
+    (tmp_path / "pyproject.toml").write_text("[tool.black]\nskip-string-normalization = false\n", encoding="utf-8")
+    generate(schema, **options)
+    assert 'name: str | None = "abc"\n' in output_path.read_text(encoding="utf-8")
+
+
+def test_cache_dir_invalidated_by_custom_formatter_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an edit of a custom formatter module invalidates the cached result."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    formatter = tmp_path / "cached_comment_formatter.py"
+    source = (
+        "from datamodel_code_generator.format import CustomCodeFormatter\n\n\n"
+        "class CodeFormatter(CustomCodeFormatter):\n"
+        "    def apply(self, code: str) -> str:\n"
+        "        return {comment!r} + code\n"
+    )
+    options = {
+        "input_file_type": InputFileType.JsonSchema,
+        "custom_formatters": ["cached_comment_formatter"],
+        "cache_dir": tmp_path / "cache",
+    }
+    schema = '{"type": "object", "properties": {"name": {"type": "string"}}}'
+    formatter.write_text(source.format(comment="# first\n"), encoding="utf-8")
+    first = generate(schema, **options)
+    assert isinstance(first, str)
+    assert "\n# first\n" in first
+
+    formatter.write_text(source.format(comment="# second comment\n"), encoding="utf-8")
+    monkeypatch.delitem(sys.modules, "cached_comment_formatter")
+    second = generate(schema, **options)
+    assert isinstance(second, str)
+    assert "\n# second comment\n" in second
+
+
+def test_cache_dir_modular_output(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test cached results of modular output round-trip unchanged."""
+    cache_dir = tmp_path / "cache"
+    first = generate(
+        OPEN_API_DATA_PATH / "modular.yaml",
+        input_file_type=InputFileType.OpenAPI,
+        disable_timestamp=True,
+        cache_dir=cache_dir,
+    )
+    mocker.patch.object(OpenAPIParser, "parse", side_effect=AssertionError)
+    second = generate(
+        OPEN_API_DATA_PATH / "modular.yaml",
+        input_file_type=InputFileType.OpenAPI,
+        disable_timestamp=True,
+        cache_dir=cache_dir,
+    )
+    assert isinstance(first, dict)
+    assert second == first
+
+
+def test_cache_dir_reuses_compiled_templates(tmp_path: Path, mocker: MockerFixture) -> None:
+    """Test compiled templates are stored in the cache directory and loaded instead of compiled.
+
+    Runs without a cache directory use templates loaded without the bytecode cache.
+    """
+    from jinja2 import Environment
+
+    from datamodel_code_generator.model import base as model_base
+
+    cache_dir = tmp_path / "cache"
+    first = generate(JSON_SCHEMA_DATA_PATH / "person.json", input_file_type=InputFileType.JsonSchema)
+    cached = generate(
+        JSON_SCHEMA_DATA_PATH / "person.json", input_file_type=InputFileType.JsonSchema, cache_dir=cache_dir
+    )
+    assert cached == first
+    assert list((cache_dir / "templates").iterdir())
+
+    model_base._get_environment.cache_clear()
+    model_base._get_template_with_custom_dir.cache_clear()
+    model_base.get_template.cache_clear()
+    compile_ = mocker.spy(Environment, "compile")
+    second = generate(
+        '{"type": "object", "properties": {"name": {"type": "string"}}}',
+        input_file_type=InputFileType.JsonSchema,
+        cache_dir=cache_dir,
+    )
+    assert isinstance(second, str)
+    assert "name: str | None = None" in second
+    compile_.assert_not_called()
+
+    generate(JSON_SCHEMA_DATA_PATH / "person.json", input_file_type=InputFileType.JsonSchema)
+    compile_.assert_called()
+
+
+def test_cache_dir_skips_uncacheable_options(tmp_path: Path) -> None:
+    """Test options that can not be hashed, such as callables, bypass the cache."""
+    cache_dir = tmp_path / "cache"
+    result = generate(
+        '{"type": "object", "properties": {"name": {"type": "string"}}}',
+        input_file_type=InputFileType.JsonSchema,
+        custom_class_name_generator=lambda name: f"Custom{name}",
+        cache_dir=cache_dir,
+    )
+    assert isinstance(result, str)
+    assert "class CustomModel" in result
+    assert not list(cache_dir.rglob("*.json"))
+
+
+@pytest.mark.cli_doc(
+    options=["--jobs"],
+    option_description="""Decode input files and format generated modules in parallel worker processes.
+
+The `--jobs` option decodes the files of a directory or multi-file input in a pool of
+N worker processes before parsing them, renders every module in the main process and
+then formats the module bodies in the same number of worker processes. Only decoding
+and formatting run in the workers: parsing, `$ref` resolution, model building, naming,
+post-processing and rendering stay in one process in input order, so the output is
+identical to a serial run. It speeds up inputs made of many large files and modular
+outputs with many modules to format, not the parsing of the schemas themselves.
+The value must be at least 1.""",
+    input_schema="openapi/modular.yaml",
+    cli_args=["--all-exports-scope", "children", "--jobs", "2"],
+    golden_output="openapi/modular_all_exports_children",
+)
+def test_jobs_formats_modules_in_parallel(output_dir: Path) -> None:
+    """Decode input files and format generated modules in parallel worker processes.
+
+    The `--jobs` option decodes the files of a directory or multi-file input in a pool of
+    N worker processes before parsing them, renders every module in the main process and
+    then formats the module bodies in the same number of worker processes. Only decoding
+    and formatting run in the workers: parsing, `$ref` resolution, model building, naming,
+    post-processing and rendering stay in one process in input order, so the output is
+    identical to a serial run. It speeds up inputs made of many large files and modular
+    outputs with many modules to format, not the parsing of the schemas themselves.
+    The value must be at least 1.
+    """
+    run_main_and_assert(
+        input_path=OPEN_API_DATA_PATH / "modular.yaml",
+        output_path=output_dir,
+        input_file_type="openapi",
+        extra_args=["--disable-timestamp", "--all-exports-scope", "children", "--jobs", "2"],
+        expected_directory=EXPECTED_MAIN_PATH / "openapi" / "modular_all_exports_children",
+    )
+
+
+def test_jobs_emits_unformatted_output_on_format_error(mocker: MockerFixture) -> None:
+    """Test that a module failing to format in parallel mode is emitted unformatted with a warning."""
+    mocker.patch.object(
+        CodeFormatter, "format_codes", side_effect=lambda codes, _jobs: [ValueError("boom")] * len(codes)
+    )
+    with pytest.warns(UserWarning, match="Failed to format code"):
+        result = generate(
+            OPEN_API_DATA_PATH / "modular.yaml",
+            input_file_type=InputFileType.OpenAPI,
+            jobs=2,
+        )
+    assert isinstance(result, dict)
+    assert all(body for body in result.values())
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1"])
+def test_jobs_rejects_values_below_one(jobs: str, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that --jobs below 1 is rejected while the arguments are parsed."""
+    with pytest.raises(SystemExit) as exc_info:
+        run_main_with_args(["--input", str(JSON_SCHEMA_DATA_PATH / "person.json"), "--jobs", jobs])
+    assert exc_info.value.code == 2
+    assert f"argument --jobs: must be at least 1, got {jobs}" in capsys.readouterr().err
+
+
+def test_jobs_rejects_values_below_one_in_pyproject(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that jobs below 1 in pyproject.toml is rejected before generating anything."""
+    (tmp_path / "pyproject.toml").write_text("[tool.datamodel-codegen]\njobs = 0\n", encoding="utf-8")
+    with chdir(tmp_path):
+        run_main_with_args(
+            ["--input", str(JSON_SCHEMA_DATA_PATH / "person.json"), "--output", str(tmp_path / "output.py")],
+            expected_exit=Exit.ERROR,
+        )
+    assert "`--jobs` must be at least 1." in capsys.readouterr().err
+
+
+@pytest.mark.cli_doc(
+    options=["--lazy-definitions"],
+    option_description="""Keep definitions of large JSON schemas packed until they are used.
+
+The `--lazy-definitions` option keeps the entries of `definitions`, `$defs` and
+`components/schemas` in JSON inputs in a compact packed form and unpacks each entry when
+the parser first reads it. Every entry is still decoded from JSON once while the input is
+read, so invalid JSON is reported as usual. It saves memory for entries that are never read,
+such as the unused definitions of a large document referenced through `$ref`.
+YAML inputs are always loaded eagerly. The output is identical to a normal run.""",
+    input_schema="jsonschema/external_files_in_directory/person.json",
+    cli_args=["--lazy-definitions"],
+    golden_output="jsonschema/external_files_in_directory.py",
+)
+def test_lazy_definitions(output_file: Path) -> None:
+    """Keep definitions of large JSON schemas packed until they are used.
+
+    The `--lazy-definitions` option keeps the entries of `definitions`, `$defs` and
+    `components/schemas` in JSON inputs in a compact packed form and unpacks each entry when
+    the parser first reads it. Every entry is still decoded from JSON once while the input is
+    read, so invalid JSON is reported as usual. It saves memory for entries that are never read,
+    such as the unused definitions of a large document referenced through `$ref`.
+    YAML inputs are always loaded eagerly. The output is identical to a normal run.
+    """
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "external_files_in_directory" / "person.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        assert_func=assert_file_content,
+        expected_file=EXPECTED_MAIN_PATH / "jsonschema" / "external_files_in_directory.py",
+        extra_args=["--lazy-definitions"],
+    )
+
+
+@pytest.mark.cli_doc(
+    options=["--timings"],
+    option_description="""Report wall time and peak memory of every generation phase.
+
+The `--timings` option writes a JSON report to the given file and prints the same data
+as a table to stderr. It covers input loading, `parse_raw`, `$ref` resolution, each
+post-processing pass of the parser, `sort_data_models`, template rendering and
+formatting. Nested phases are indented under the phase that ran them. Memory is traced
+with tracemalloc, so the run is slower than usual while timings are recorded.""",
+    input_schema="jsonschema/person.json",
+    cli_args=["--disable-timestamp", "--timings", "timings.json"],
+    golden_output="person.py",
+)
+def test_timings_report(output_file: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Report wall time and peak memory of every generation phase.
+
+    The `--timings` option writes a JSON report to the given file and prints the same data
+    as a table to stderr. It covers input loading, `parse_raw`, `$ref` resolution, each
+    post-processing pass of the parser, `sort_data_models`, template rendering and
+    formatting. Nested phases are indented under the phase that ran them. Memory is traced
+    with tracemalloc, so the run is slower than usual while timings are recorded.
+    """
+    timings_file = tmp_path / "timings.json"
+    run_main_and_assert(
+        input_path=JSON_SCHEMA_DATA_PATH / "person.json",
+        output_path=output_file,
+        input_file_type="jsonschema",
+        extra_args=["--disable-timestamp", "--timings", str(timings_file)],
+        assert_func=assert_file_content,
+        expected_file="person.py",
+    )
+    report = json.loads(timings_file.read_text(encoding="utf-8"))
+    paths = [tuple(phase["path"]) for phase in report["phases"]]
+    assert paths[0] == ("generate",)
+    assert {
+        ("generate", "parse_raw"),
+        ("generate", "parse_raw", "load input"),
+        ("generate", "sort_data_models"),
+        ("generate", "_process_single_module", "__reuse_model"),
+        ("generate", "_process_single_module", "__collapse_root_models"),
+        ("generate", "_build_module_structure", "__resolve_circular_imports"),
+        ("generate", "render"),
+        ("generate", "format"),
+    } <= set(paths)
+    assert all(
+        phase["calls"] >= 1 and phase["seconds"] >= 0 and phase["peak_memory"] >= 0 for phase in report["phases"]
+    )
+    table = capsys.readouterr().err.splitlines()
+    assert table[0].split() == ["Phase", "Calls", "Time", "(s)", "Peak", "memory"]
+    assert any(line.startswith("    __reuse_model ") for line in table)
+
+
+@pytest.mark.skipif(not is_pydantic_v2(), reason="GenerateConfig requires Pydantic v2")
+def test_generator_generate_many(mocker: MockerFixture) -> None:
+    """Generator reuses one code formatter for every input and matches generate()."""
+    import pickle
+
+    from datamodel_code_generator import format as format_module
+
+    options = {
+        "input_file_type": InputFileType.JsonSchema,
+        "output_model_type": DataModelType.PydanticV2BaseModel,
+        "disable_timestamp": True,
+        "formatters": [Formatter.BLACK, Formatter.ISORT],
+    }
+    schemas = ['{"type": "object", "properties": {"a": {"type": "string"}}}', '{"type": "object", "title": "B"}']
+    expected = [generate(schema, **options) for schema in schemas]
+
+    code_formatter = mocker.spy(format_module, "CodeFormatter")
+    generator = Generator(**options)
+    assert generator.generate_many(schemas * 2) == expected * 2
+    assert code_formatter.call_count == 1
+    assert pickle.loads(pickle.dumps(generator)).generate(schemas[0]) == expected[0]
+
+
+@pytest.mark.skipif(not is_pydantic_v2(), reason="GenerateConfig requires Pydantic v2")
+def test_generator_rejects_config_and_options() -> None:
+    """Generator accepts either a config or keyword options, like generate()."""
+    with pytest.raises(ValueError, match="Cannot specify both"):
+        Generator(GenerateConfig(), class_name="Model")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -11,7 +12,7 @@ from datamodel_code_generator.__main__ import Exit
 from tests.main.conftest import JSON_SCHEMA_DATA_PATH, run_main_with_args
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Iterator
 
 
 @pytest.mark.cli_doc(
@@ -23,6 +24,10 @@ datamodel-codegen watches the input file or directory for changes and
 automatically regenerates the output whenever changes are detected.
 Press Ctrl+C to stop watching.
 
+Documents loaded through `$ref` are kept between regenerations, so only the files
+that changed are read and decoded again. Each regeneration still parses the schema
+and builds every model from scratch.
+
 !!! warning "Requires extra dependency"
 
     The watch feature requires the `watch` extra:
@@ -280,3 +285,97 @@ def test_watch_and_regenerate_handles_generation_error(capsys: pytest.CaptureFix
         assert result == Exit.OK
         captured = capsys.readouterr()
         assert "Generation failed" in captured.err
+
+
+def test_watch_and_regenerate_reloads_only_changed_ref_documents(tmp_path: Path) -> None:
+    """Test that watch mode keeps unchanged $ref documents loaded between regenerations."""
+    from datamodel_code_generator import load_data_from_path
+    from datamodel_code_generator.__main__ import Config
+    from datamodel_code_generator.watch import watch_and_regenerate
+
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    (schema_dir / "pet.json").write_text(
+        '{"type": "object", "properties": {"owner": {"$ref": "person.json"}, "tag": {"$ref": "tag.json"}}}',
+        encoding="utf-8",
+    )
+    person = schema_dir / "person.json"
+    person.write_text('{"type": "object", "properties": {"name": {"type": "string"}}}', encoding="utf-8")
+    tag = schema_dir / "tag.json"
+    tag.write_text('{"type": "object", "properties": {"label": {"type": "string"}}}', encoding="utf-8")
+    output_file = tmp_path / "output.py"
+
+    def changes() -> Iterator[set[tuple[str, str]]]:
+        yield {("modified", str(schema_dir / "pet.json"))}
+        person.write_text('{"type": "object", "properties": {"age": {"type": "integer"}}}', encoding="utf-8")
+        yield {("modified", str(person))}
+
+    mock_watchfiles = MagicMock()
+    mock_watchfiles.watch.return_value = changes()
+    config = Config(input=schema_dir / "pet.json", output=output_file, input_file_type="jsonschema")
+
+    with (
+        patch("datamodel_code_generator.watch._get_watchfiles", return_value=mock_watchfiles),
+        patch(
+            "datamodel_code_generator.parser.jsonschema.load_data_from_path", side_effect=load_data_from_path
+        ) as mock_load,
+    ):
+        result = watch_and_regenerate(config, None, None, None)
+
+    assert result == Exit.OK
+    loaded = sorted(Path(call.args[0]).name for call in mock_load.call_args_list)
+    assert loaded == ["person.json", "person.json", "tag.json"]
+    generated = output_file.read_text(encoding="utf-8")
+    assert "age: int | None = None" in generated
+    assert "name: str | None = None" not in generated
+
+
+def test_watch_and_regenerate_does_not_reuse_modified_ref_documents(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that changes a parser makes to a $ref document do not carry over to the next regeneration."""
+    from datamodel_code_generator.__main__ import Config
+    from datamodel_code_generator.watch import watch_and_regenerate
+
+    (tmp_path / "items.yaml").write_text(
+        """\
+openapi: 3.0.0
+info: {title: Items, version: "1"}
+paths:
+  /items/{id}:
+    parameters:
+      - {name: id, in: path, required: true, schema: {type: string}}
+    get:
+      responses:
+        "200": {description: OK}
+""",
+        encoding="utf-8",
+    )
+    api = tmp_path / "api.yaml"
+    api.write_text(
+        """\
+openapi: 3.0.0
+info: {title: API, version: "1"}
+paths:
+  /items/{id}:
+    $ref: 'items.yaml#/paths/~1items~1{id}'
+""",
+        encoding="utf-8",
+    )
+    output_file = tmp_path / "output.py"
+    mock_watchfiles = MagicMock()
+    mock_watchfiles.watch.return_value = iter([{("modified", str(api))}, {("modified", str(api))}])
+    config = Config(
+        input=api,
+        output=output_file,
+        input_file_type="openapi",
+        openapi_scopes=["paths", "parameters"],
+        include_path_parameters=True,
+    )
+
+    with patch("datamodel_code_generator.watch._get_watchfiles", return_value=mock_watchfiles):
+        result = watch_and_regenerate(config, None, None, None)
+
+    assert result == Exit.OK
+    assert capsys.readouterr().out.count("Done.") == 2
+    assert "class ItemsIdGetParameters(BaseModel):\n    id: str\n" in output_file.read_text(encoding="utf-8")
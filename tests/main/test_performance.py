@@ -14,6 +14,8 @@ Core tests are also marked with @pytest.mark.benchmark for CodSpeed integration.
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -22,6 +24,54 @@ from datamodel_code_generator import DataModelType, InputFileType, generate
 
 PERFORMANCE_DATA_PATH: Path = Path(__file__).parent.parent / "data" / "performance"
 
+# Modules only needed once generation actually runs; importing the CLI must not load them.
+STARTUP_DEFERRED_MODULES: tuple[str, ...] = (
+    "black",
+    "datamodel_code_generator.cli_options",
+    "datamodel_code_generator.model",
+    "datamodel_code_generator.parser.base",
+    "datamodel_code_generator.prompt_data",
+    "datamodel_code_generator._types",
+    "datamodel_code_generator.reference",
+    "datamodel_code_generator.timings",
+    "datamodel_code_generator.types",
+    "genson",
+    "inflect",
+    "isort",
+    "jinja2",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of every module loaded by importing module.
+
+    Runs in a fresh interpreter so modules already imported by the test session do not hide anything.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_startup_defers_heavy_imports() -> None:
+    """Importing the CLI entry point does not load formatters, templates or the model layer."""
+    loaded = _import_times("datamodel_code_generator.__main__")
+    assert "datamodel_code_generator.__main__" in loaded
+    assert (
+        sorted(name for name in loaded if any(name == m or name.startswith(f"{m}.") for m in STARTUP_DEFERRED_MODULES))
+        == []
+    )
+
 
 @pytest.mark.perf
 def test_perf_large_models(tmp_path: Path) -> None:
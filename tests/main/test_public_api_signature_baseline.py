@@ -81,6 +81,7 @@ def _baseline_generate(
     disable_timestamp: bool = False,
     enable_version_header: bool = False,
     enable_command_header: bool = False,
+    enable_fingerprint_header: bool = False,
     command_line: str | None = None,
     allow_population_by_field_name: bool = False,
     allow_extra_fields: bool = False,
@@ -126,6 +127,7 @@ def _baseline_generate(
     openapi_scopes: list[OpenAPIScope] | None = None,
     include_path_parameters: bool = False,
     openapi_include_paths: list[str] | None = None,
+    openapi_reachable_from: list[str] | None = None,
     graphql_scopes: list[GraphQLScope] | None = None,
     graphql_no_typename: bool = False,
     wrap_string_literal: bool | None = None,
@@ -139,6 +141,9 @@ def _baseline_generate(
     http_headers: Sequence[tuple[str, str]] | None = None,
     http_ignore_tls: bool = False,
     http_timeout: float | None = None,
+    http_prefetch: bool = False,
+    http_cache_dir: Path | None = None,
+    http_offline: bool = False,
     use_annotated: bool = False,
     use_serialize_as_any: bool = False,
     use_non_positive_negative_number_constrained_types: bool = False,
@@ -191,6 +196,10 @@ def _baseline_generate(
     module_split_mode: ModuleSplitMode | None = None,
     schema_version: str | None = None,
     schema_version_mode: VersionMode | None = None,
+    cache_dir: Path | None = None,
+    jobs: int = 1,
+    lazy_definitions: bool = False,
+    timings: Path | None = None,
 ) -> str | object | None:
     raise NotImplementedError
 
@@ -271,6 +280,9 @@ class _BaselineParser:
         http_headers: Sequence[tuple[str, str]] | None = None,
         http_ignore_tls: bool = False,
         http_timeout: float | None = None,
+        http_prefetch: bool = False,
+        http_cache_dir: Path | None = None,
+        http_offline: bool = False,
         use_annotated: bool = False,
         use_serialize_as_any: bool = False,
         use_non_positive_negative_number_constrained_types: bool = False,
@@ -318,6 +330,8 @@ class _BaselineParser:
         read_only_write_only_model_type: ReadOnlyWriteOnlyModelType | None = None,
         field_type_collision_strategy: FieldTypeCollisionStrategy | None = None,
         target_pydantic_version: TargetPydanticVersion | None = None,
+        jobs: int = 1,
+        lazy_definitions: bool = False,
     ) -> None:
         raise NotImplementedError
 
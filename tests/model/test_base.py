@@ -16,6 +16,7 @@ from datamodel_code_generator.model.base import (
     get_module_path,
     sanitize_module_name,
 )
+from datamodel_code_generator.model.pydantic import BaseModel, DataModelField
 from datamodel_code_generator.reference import Reference
 from datamodel_code_generator.types import DataType, Types
 
@@ -99,6 +100,26 @@ def test_data_model() -> None:
     assert data_model.render() == "@validate\n@dataclass\nclass test_model:\n    a: str"
 
 
+def test_dedup_key_is_invalidated_when_a_reference_is_replaced() -> None:
+    """Test replace_children_in_models drops the cached dedup key of the models it changes only."""
+    references = {name: Reference(path=name, original_name=name, name=name) for name in ("X", "Y", "A", "B")}
+    duplicate = BaseModel(fields=[], reference=references["X"])
+    holder, other = (
+        BaseModel(
+            fields=[DataModelField(name="value", data_type=DataType(reference=references[target]))],
+            reference=references[name],
+        )
+        for name, target in (("A", "X"), ("B", "Y"))
+    )
+    holder_key, other_key = holder.get_dedup_key(), other.get_dedup_key()
+    assert holder_key != other_key
+
+    duplicate.replace_children_in_models([holder, other], references["Y"])
+
+    assert holder.get_dedup_key() == other_key
+    assert other.get_dedup_key() is other_key
+
+
 def test_data_model_exception() -> None:
     """Test DataModel raises exception when TEMPLATE_FILE_PATH is undefined."""
     field = DataModelFieldBase(name="a", data_type=DataType(type="str"), default="abc", required=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
@@ -145,6 +146,41 @@ def test_sort_data_models() -> None:
     assert require_update_action_models == ["B", "A"]
 
 
+def test_sort_data_models_orders_by_pass_and_position() -> None:
+    """Test models are ordered as if the list was scanned pass after pass."""
+    references = {name: Reference(path=name, original_name=name, name=name) for name in "ABCD"}
+    dependencies = {"A": "B", "B": "C", "C": None, "D": "A"}
+    models = [
+        BaseModel(
+            fields=[DataModelField(data_type=DataType(reference=references[dependency]))] if dependency else [],
+            reference=references[name],
+        )
+        for name, dependency in dependencies.items()
+    ]
+
+    unresolved, resolved, require_update_action_models = sort_data_models(models)
+
+    assert list(resolved) == ["C", "B", "A", "D"]
+    assert unresolved == []
+    assert require_update_action_models == []
+
+
+def test_sort_data_models_long_reference_chain() -> None:
+    """Test a chain where every model references the next one needs one pass per model."""
+    references = [Reference(path=f"M{i}", original_name=f"M{i}", name=f"M{i}") for i in range(3000)]
+    models = [
+        BaseModel(fields=[DataModelField(data_type=DataType(reference=next_reference))], reference=reference)
+        for reference, next_reference in itertools.pairwise(references)
+    ]
+    models.append(BaseModel(fields=[], reference=references[-1]))
+
+    unresolved, resolved, require_update_action_models = sort_data_models(models, recursion_count=len(models))
+
+    assert list(resolved) == [reference.path for reference in reversed(references)]
+    assert unresolved == []
+    assert require_update_action_models == []
+
+
 def test_sort_data_models_unresolved() -> None:
     """Test sorting data models with unresolved references."""
     reference_a = Reference(path="A", original_name="A", name="A")
@@ -6,8 +6,9 @@ from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from datamodel_code_generator import Error
 from datamodel_code_generator.model.dataclass import DataClass
-from datamodel_code_generator.parser.graphql import GraphQLParser
+from datamodel_code_generator.parser.graphql import GraphQLParser, build_graphql_schema
 from datamodel_code_generator.reference import Reference
 from tests.conftest import create_assert_file_content
 from tests.main.conftest import GRAPHQL_DATA_PATH, run_main_and_assert
@@ -174,3 +175,18 @@ def test_graphql_schema_features() -> None:
             dynamic_ref=True,
         )
     )
+
+
+def test_build_graphql_schema_reuses_schemas_built_from_the_same_sdl() -> None:
+    """Test the same SDL is built once and different SDL is built again."""
+    sdl = "type Query { id: ID }\ntype Droid { name: String }"
+    schema = build_graphql_schema(sdl)
+    assert build_graphql_schema(sdl) is schema
+    assert build_graphql_schema(f"{sdl}\n") is not schema
+
+
+def test_graphql_introspection_result_without_schema() -> None:
+    """Test JSON input that is not an introspection result is rejected."""
+    parser = GraphQLParser(source='{"data": {"types": []}}')
+    with pytest.raises(Error, match="introspection result"):
+        parser.parse()
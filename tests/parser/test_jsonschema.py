@@ -16,6 +16,7 @@ from datamodel_code_generator.imports import Import
 from datamodel_code_generator.model import DataModelFieldBase
 from datamodel_code_generator.model.dataclass import DataClass
 from datamodel_code_generator.model.pydantic.base_model import BaseModel
+from datamodel_code_generator.parser._lazy_json import _Packed, load_json_lazily
 from datamodel_code_generator.parser.base import Parser, dump_templates
 from datamodel_code_generator.parser.jsonschema import (
     JsonSchemaObject,
@@ -25,7 +26,7 @@ from datamodel_code_generator.parser.jsonschema import (
 )
 from datamodel_code_generator.reference import SPECIAL_PATH_MARKER, Reference
 from datamodel_code_generator.types import DataType
-from datamodel_code_generator.util import model_dump, model_validate
+from datamodel_code_generator.util import model_copy, model_dump, model_validate
 from tests.conftest import assert_output
 
 if TYPE_CHECKING:
@@ -875,6 +876,41 @@ def test_get_ref_body_from_url_file_local_path(mocker: MockerFixture) -> None:
     assert called_path.parts[-4:] == ("home", "user", "schemas", "pet.json")
 
 
+def test_source_documents_are_read_and_decoded_once(tmp_path: Path) -> None:
+    """Test every phase of a directory input reuses the sources read and decoded the first time."""
+    (tmp_path / "a.json").write_text(
+        json.dumps({
+            "title": "A",
+            "type": "object",
+            "properties": {
+                "b": {"$ref": "b.json#/properties/nested"},
+                "c": {"$ref": "#/properties/x/properties/y"},
+                "x": {"type": "object", "properties": {"y": {"type": "object"}}},
+            },
+        }),
+        encoding="utf-8",
+    )
+    (tmp_path / "b.json").write_text(
+        json.dumps({
+            "title": "B",
+            "type": "object",
+            "properties": {"nested": {"type": "object"}, "d": {"$ref": "#/properties/nested"}},
+        }),
+        encoding="utf-8",
+    )
+    parser = JsonSchemaParser(tmp_path)
+    parser.parse_raw()
+
+    assert parser.reserved_refs == {
+        ("a.json",): {"a.json#/properties/x/properties/y"},
+        ("b.json",): {"b.json#/properties/nested"},
+    }
+    assert parser.source_documents.read_count == 1
+    # Each file is decoded once for parsing and once more for the `$ref`s into it.
+    assert parser.source_documents.load_counts == {Path("a.json"): 2, Path("b.json"): 2}
+    assert {result.class_name for result in parser.results} >= {"A", "B", "Nested", "Y"}
+
+
 def test_merge_ref_with_schema_no_ref() -> None:
     """Test _merge_ref_with_schema returns object unchanged when no $ref is present."""
     parser = JsonSchemaParser("")
@@ -1310,3 +1346,86 @@ def test_resolve_type_import_from_defs_exception_handling() -> None:
 
     result = parser._resolve_type_import_from_defs("SomeType")
     assert result is None
+
+
+def test_get_schema_object_shares_validated_schemas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Raw schemas with the same content, or a $ref into them, are validated once and frozen while parsing."""
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}, "items": [{"type": "integer"}]}
+    document = {"definitions": {"A": schema}}
+    parser = JsonSchemaParser(json.dumps(document))
+    parser.raw_obj = document
+
+    shared = parser._get_schema_object(schema)
+    assert parser._get_schema_object(schema) is shared
+    assert parser._get_schema_object(json.loads(json.dumps(schema))) is shared
+    assert parser._load_ref_schema_object("#/definitions/A") is shared
+    assert parser._load_ref_schema_object("#/definitions/A/properties/a") is shared.properties["a"]
+    assert parser._load_ref_schema_object("#/definitions/A/items/0") is shared.items[0]
+    reordered = {"properties": schema["properties"], "type": "object", "items": schema["items"]}
+    assert parser._get_schema_object(reordered) is not shared
+    shared.description = "not frozen outside the parser"
+    with parser.shared_schema_objects_context():
+        with pytest.raises(TypeError, match="is shared between schemas"):
+            shared.type = "array"
+        with pytest.raises(TypeError, match="is shared between schemas"):
+            shared.properties["a"].type = "integer"
+        assert model_copy(shared, update={"type": "array"}).type == "array"
+    with JsonSchemaParser("").shared_schema_objects_context():
+        shared.type = "array"
+    assert shared.type == "array"
+
+    monkeypatch.setattr(JsonSchemaParser, "SCHEMA_OBJECT_CACHE_SIZE", 1)
+    parser = JsonSchemaParser("")
+    parser._get_schema_object(schema)
+    parser._get_schema_object({"type": "integer"})
+    assert len(parser._schema_object_cache) == 1
+    assert len(parser._schema_object_keys) == 1
+
+
+def test_get_schema_object_keeps_lazy_entries_packed() -> None:
+    """Digesting a document with lazily loaded definitions does not unpack them."""
+    document = load_json_lazily(json.dumps({"definitions": {"A": {"type": "string"}, "B": {"type": "integer"}}}))
+    parser = JsonSchemaParser("")
+
+    parser._get_schema_object(document)
+
+    assert all(type(value) is _Packed for value in dict.values(document["definitions"]))
+    assert parser._get_schema_object(document) is parser._get_schema_object(document.copy())
+
+
+def test_is_ref_circular_classifies_reachable_refs_once(mocker: MockerFixture) -> None:
+    """Every $ref target reachable from the first query is classified by one walk of the $ref graph."""
+    parser = JsonSchemaParser("")
+    parser.raw_obj = {
+        "definitions": {
+            "A": {"properties": {"b": {"$ref": "#/definitions/B"}, "e": {"$ref": "#/definitions/E"}}},
+            "B": {"items": [{"$ref": "#/definitions/A"}]},
+            "C": {"allOf": [{"$ref": "#/definitions/A"}, {"$ref": "#/definitions/D"}]},
+            "D": {"properties": {"child": {"$ref": "#/definitions/D"}}},
+            "E": {"type": "string"},
+        }
+    }
+    get_ref_targets = mocker.spy(parser, "_get_ref_targets")
+    refs = {name: parser.model_resolver.resolve_ref(f"#/definitions/{name}") for name in "ABCDE"}
+
+    assert parser._is_ref_circular(refs["C"]) is False
+    assert get_ref_targets.call_count == 5
+    assert {name: parser._is_ref_circular(ref) for name, ref in refs.items()} == {
+        "A": True,
+        "B": True,
+        "C": False,
+        "D": True,
+        "E": False,
+    }
+    assert get_ref_targets.call_count == 5
+
+
+@pytest.mark.filterwarnings("ignore:.* is empty or not a dict")
+@pytest.mark.parametrize("directory", ["external_files_in_directory", "multiple_files", "non_dict_files"])
+def test_decode_sources_in_parallel_keeps_output(directory: str) -> None:
+    """Test decoding directory inputs in worker processes yields the same modules as decoding them in order."""
+    sequential = JsonSchemaParser(DATA_PATH / directory)
+    expected = sequential.parse()
+    parser = JsonSchemaParser(DATA_PATH / directory, jobs=2)
+    assert parser.parse() == expected
+    assert parser.source_documents.load_counts == sequential.source_documents.load_counts
@@ -0,0 +1,118 @@
+"""Unit tests for the lazy JSON loader module."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from datamodel_code_generator import load_data
+from datamodel_code_generator.parser import _lazy_json
+from datamodel_code_generator.parser._lazy_json import LazyJsonObject, _Packed, load_json_lazily
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+TEXT = """{
+    "title": "Root",
+    "definitions": {"Pet": {"type": "object", "properties": {"name": {"type": "string"}}}, "Id": {"type": "integer"}},
+    "$defs": {},
+    "components": {"schemas": {"User": {"$ref": "#/definitions/Pet"}}, "parameters": {"p": {"in": "query"}}},
+    "properties": {"definitions": {"type": "string"}}
+}"""
+
+
+def test_load_json_lazily_matches_json_loads() -> None:
+    """Lazy containers compare, dump, copy and pickle like the eagerly decoded document."""
+    expected = json.loads(TEXT)
+    result = load_json_lazily(TEXT)
+
+    assert result == expected
+    assert json.dumps(result, sort_keys=True) == json.dumps(expected, sort_keys=True)
+    assert copy.deepcopy(result) == expected
+    assert pickle.loads(pickle.dumps(result)) == expected
+    assert {**result["definitions"]} == expected["definitions"]
+
+
+def test_load_json_lazily_indexes_only_definition_containers() -> None:
+    """Only definitions, $defs and components/schemas are lazy."""
+    result = load_json_lazily(TEXT)
+
+    assert isinstance(result["definitions"], LazyJsonObject)
+    assert isinstance(result["$defs"], LazyJsonObject)
+    assert isinstance(result["components"]["schemas"], LazyJsonObject)
+    assert type(result["components"]["parameters"]) is dict
+    assert type(result["properties"]["definitions"]) is dict
+
+
+def test_lazy_json_object_decodes_each_entry_once() -> None:
+    """Decoded values are kept, and stored values are returned as is."""
+    definitions = load_json_lazily(TEXT)["definitions"]
+
+    assert list(definitions) == ["Pet", "Id"]
+    assert len(definitions) == 2
+    assert definitions["Pet"] == {"type": "object", "properties": {"name": {"type": "string"}}}
+    assert definitions["Pet"] is definitions.get("Pet")
+    assert definitions.get("Missing") is None
+
+    definitions["Id"] = stored = {"type": "string"}
+    assert definitions["Id"] is stored
+    assert definitions.pop("Pet") == {"type": "object", "properties": {"name": {"type": "string"}}}
+    assert dict(definitions.items()) == {"Id": {"type": "string"}}
+
+
+def test_lazy_json_object_unpacks_entries_on_access() -> None:
+    """Entries stay packed until they are read, and the source text is not kept."""
+    result = load_json_lazily(TEXT)
+    definitions = result["definitions"]
+
+    assert [type(value) for value in dict.values(definitions)] == [_Packed, _Packed]
+    definitions["Pet"]
+    assert [type(value) for value in dict.values(definitions)] == [dict, _Packed]
+    assert not any(value is TEXT for value in dict.values(definitions))
+
+    definitions = load_json_lazily(TEXT)["definitions"]
+    definitions["Pet"] = {}
+    assert definitions.popitem() == ("Id", {"type": "integer"})
+    assert dict(definitions) == {"Pet": {}}
+
+
+def test_load_json_lazily_decodes_each_entry_once(mocker: MockerFixture) -> None:
+    """Entries are decoded from JSON while the document is read and only unpacked on access."""
+    raw_decode = mocker.spy(_lazy_json._DECODER, "raw_decode")
+    definitions = load_json_lazily(TEXT)["definitions"]
+    calls = raw_decode.call_count
+
+    assert definitions["Pet"] == {"type": "object", "properties": {"name": {"type": "string"}}}
+    assert definitions["Id"] == {"type": "integer"}
+    assert raw_decode.call_count == calls
+
+
+def test_lazy_json_object_deepcopy_keeps_entries_packed() -> None:
+    """A deep copy shares the packed entries and copies the unpacked ones."""
+    definitions = load_json_lazily(TEXT)["definitions"]
+    pet = definitions["Pet"]
+
+    copied = copy.deepcopy(definitions)
+    assert isinstance(copied, LazyJsonObject)
+    assert [type(value) for value in dict.values(copied)] == [dict, _Packed]
+    assert copied["Pet"] == pet
+    assert copied["Pet"] is not pet
+    assert copied["Id"] == {"type": "integer"}
+
+
+@pytest.mark.parametrize("text", ["[]", '{"a": 1} {}', '{"definitions": {"a": }}', '{"a" 1}'])
+def test_load_json_lazily_rejects_invalid_documents(text: str) -> None:
+    """Anything but a single valid JSON object raises JSONDecodeError."""
+    with pytest.raises(json.JSONDecodeError):
+        load_json_lazily(text)
+
+
+def test_load_data_lazy_falls_back_to_yaml() -> None:
+    """YAML input is loaded eagerly when lazy loading is requested."""
+    assert load_data("definitions:\n  Pet:\n    type: object\n", lazy=True) == {
+        "definitions": {"Pet": {"type": "object"}}
+    }
@@ -755,6 +755,47 @@ def test_parse_all_parameters_duplicate_names_exception() -> None:
     assert "Parameter name 'duplicate_param' is used more than once." in str(exc_info.value)
 
 
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_openapi_parser_directory_ref_to_input_path_item(tmp_path: Path, jobs: int) -> None:
+    """Test a $ref to a path item of another input file does not see changes made while parsing that file."""
+    (tmp_path / "a.yaml").write_text(
+        """\
+openapi: 3.0.0
+info: {title: A, version: "1"}
+paths:
+  /items/{id}:
+    parameters:
+      - {name: id, in: path, required: true, schema: {type: string}}
+    get:
+      operationId: getItem
+      responses:
+        "200": {description: OK}
+""",
+        encoding="utf-8",
+    )
+    (tmp_path / "b.yaml").write_text(
+        """\
+openapi: 3.0.0
+info: {title: B, version: "1"}
+paths:
+  /items/{id}:
+    $ref: 'a.yaml#/paths/~1items~1{id}'
+""",
+        encoding="utf-8",
+    )
+    parser = OpenAPIParser(
+        tmp_path,
+        openapi_scopes=[OpenAPIScope.Paths, OpenAPIScope.Parameters],
+        include_path_parameters=True,
+        jobs=jobs,
+    )
+
+    assert parser.parse() == (
+        "from __future__ import annotations\n\nfrom pydantic import BaseModel\n\n\n"
+        "class ItemsIdGetParameters(BaseModel):\n    id: str\n"
+    )
+
+
 @pytest.mark.skipif(
     version.parse(pydantic.VERSION) < version.parse("2.9.0"),
     reason="Require Pydantic version 2.0.0 or later ",
@@ -1037,3 +1078,21 @@ def test_openapi_parser_with_request_bodies_scope_body_ref() -> None:
     result = parser.parse()
     assert "CreatePet" in result or "BasePet" in result
     assert "name: Optional[str]" in result
+
+
+def test_openapi_parser_reachable_from_skips_unreachable_schemas() -> None:
+    """Test only components reachable from the selected roots are collected and parsed."""
+    parser = OpenAPIParser(
+        source=Path(DATA_PATH / "reachable_from.yaml"),
+        openapi_scopes=[OpenAPIScope.Schemas, OpenAPIScope.RequestBodies],
+        openapi_reachable_from=["path:/users", "schema:Animal"],
+    )
+    parser.parse_raw()
+    assert parser._collect_reachable_components(parser.raw_obj) == {
+        ("requestBodies", "NewUser"),
+        ("schemas", "Address"),
+        ("schemas", "Animal"),
+        ("schemas", "Dog"),
+        ("schemas", "User"),
+    }
+    assert {result.class_name for result in parser.results} == {"Address", "Animal", "Dog", "NewUser", "User"}
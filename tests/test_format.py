@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import subprocess
 import sys
 import warnings
 from pathlib import Path
@@ -11,7 +12,8 @@ import pytest
 
 from datamodel_code_generator.format import CodeFormatter, Formatter, PythonVersion, PythonVersionMin
 
-EXAMPLE_LICENSE_FILE = str(Path(__file__).parent / "data/python/custom_formatters/license_example.txt")
+DATA_PATH = Path(__file__).parent / "data"
+EXAMPLE_LICENSE_FILE = str(DATA_PATH / "python/custom_formatters/license_example.txt")
 
 UN_EXIST_FORMATTER = "tests.data.python.custom_formatters.un_exist"
 WRONG_FORMATTER = "tests.data.python.custom_formatters.wrong"
@@ -378,3 +380,47 @@ def test_code_formatter_no_warning_when_formatters_empty(tmp_path: Path, monkeyp
     with warnings.catch_warnings():
         warnings.simplefilter("error")
         CodeFormatter(PythonVersionMin, formatters=[])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_format_codes_keeps_order_and_reports_failures(
+    jobs: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that format_codes returns results in input order and exceptions for invalid code."""
+    monkeypatch.chdir(tmp_path)
+    formatter = CodeFormatter(PythonVersionMin, formatters=[Formatter.BLACK])
+
+    results = formatter.format_codes(["a  =  1", "def (:", "b  =  'c'"], jobs)
+
+    assert results[0] == "a = 1\n"
+    assert isinstance(results[1], Exception)
+    assert results[2] == "b = 'c'\n"
+
+
+def test_format_codes_runs_ruff_once_for_all_codes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that format_codes formats every code string with a single ruff check and ruff format run."""
+    monkeypatch.chdir(tmp_path)
+    formatter = CodeFormatter(PythonVersionMin, formatters=[Formatter.RUFF_CHECK, Formatter.RUFF_FORMAT])
+
+    with mock.patch("datamodel_code_generator.format.subprocess.run", wraps=subprocess.run) as mock_run:
+        results = formatter.format_codes(["import os\nx  =  1", "y = {'a':1}", "z = ( 2 )"])
+
+    assert results == ["x = 1\n", 'y = {"a": 1}\n', "z = 2\n"]
+    assert mock_run.call_count == 2
+
+
+def test_generate_in_memory_modules_with_batched_ruff() -> None:
+    """Test that generate formats in-memory modular output with one ruff invocation per formatter."""
+    from datamodel_code_generator import InputFileType, generate
+
+    with mock.patch("datamodel_code_generator.format.subprocess.run", wraps=subprocess.run) as mock_run:
+        result = generate(
+            input_=DATA_PATH / "openapi" / "modular.yaml",
+            input_file_type=InputFileType.OpenAPI,
+            formatters=[Formatter.RUFF_CHECK, Formatter.RUFF_FORMAT],
+            disable_timestamp=True,
+        )
+
+    assert isinstance(result, dict)
+    assert len(result) > 2
+    assert mock_run.call_count == 2
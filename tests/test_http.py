@@ -0,0 +1,85 @@
+"""Tests for the on-disk HTTP cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from datamodel_code_generator import Error
+from datamodel_code_generator.http import HTTPCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+URL = "https://schemas.example.com/pet.json"
+
+
+def test_http_cache_revalidates_with_validators(tmp_path: Path) -> None:
+    """Stored validators are sent back, and a 304 response reuses the stored document."""
+    cache = HTTPCache(tmp_path)
+    sent: list[list[tuple[str, str]]] = []
+
+    def respond(status_code: int, text: str = "") -> Callable[[list[tuple[str, str]]], httpx.Response]:
+        def send_request(extra_headers: list[tuple[str, str]]) -> httpx.Response:
+            sent.append(extra_headers)
+            return httpx.Response(
+                status_code, text=text, headers={"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 00:00:00 GMT"}
+            )
+
+        return send_request
+
+    assert cache.fetch(URL, None, None, respond(200, '{"title": "Pet"}')) == '{"title": "Pet"}'
+    assert cache.fetch(URL, None, None, respond(304)) == '{"title": "Pet"}'
+    assert sent == [
+        [],
+        [("If-None-Match", '"v1"'), ("If-Modified-Since", "Mon, 05 Oct 2026 00:00:00 GMT")],
+    ]
+
+
+def test_http_cache_serves_stale_document_when_unreachable(tmp_path: Path) -> None:
+    """A cached document is used when the host can not be reached; without one the error is raised."""
+    cache = HTTPCache(tmp_path)
+
+    def unreachable(_extra_headers: list[tuple[str, str]]) -> httpx.Response:
+        msg = "unreachable"
+        raise httpx.ConnectError(msg)
+
+    with pytest.raises(httpx.ConnectError):
+        cache.fetch(URL, None, None, unreachable)
+
+    cache.fetch(URL, None, None, lambda _: httpx.Response(200, text="cached"))
+    assert cache.fetch(URL, None, None, unreachable) == "cached"
+
+
+def test_http_cache_keys_include_headers_and_query_parameters(tmp_path: Path) -> None:
+    """Requests with other headers or query parameters do not share entries."""
+    cache = HTTPCache(tmp_path)
+    cache.fetch(URL, [("Authorization", "Bearer a")], None, lambda _: httpx.Response(200, text="a"))
+
+    assert cache.fetch(URL, [("Authorization", "Bearer b")], None, lambda _: httpx.Response(200, text="b")) == "b"
+    assert cache.fetch(URL, None, [("version", "2")], lambda _: httpx.Response(200, text="v2")) == "v2"
+    assert cache.load(HTTPCache.make_key(URL, [("Authorization", "Bearer a")]))["text"] == "a"
+
+
+def test_http_cache_does_not_store_failed_responses(tmp_path: Path) -> None:
+    """Only successful responses are stored."""
+    cache = HTTPCache(tmp_path)
+
+    assert cache.fetch(URL, None, None, lambda _: httpx.Response(404, text="missing")) == "missing"
+    assert cache.load(HTTPCache.make_key(URL)) is None
+
+
+def test_http_cache_offline(tmp_path: Path) -> None:
+    """Offline mode never sends a request and fails for documents that were never fetched."""
+    HTTPCache(tmp_path).fetch(URL, None, None, lambda _: httpx.Response(200, text="cached"))
+    cache = HTTPCache(tmp_path, offline=True)
+
+    def no_request(_extra_headers: list[tuple[str, str]]) -> httpx.Response:
+        pytest.fail("offline mode sent a request")
+
+    assert cache.fetch(URL, None, None, no_request) == "cached"
+    with pytest.raises(Error, match="is not in the HTTP cache"):
+        cache.fetch("https://schemas.example.com/owner.json", None, None, no_request)
@@ -2,23 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import socket
+import threading
 from argparse import Namespace
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
+from urllib.parse import urlparse
 
 import black
 import pydantic
 import pytest
 from packaging import version
 
-from datamodel_code_generator import MIN_VERSION, chdir, inferred_message
+from datamodel_code_generator import MIN_VERSION, Error, InputFileType, chdir, generate, inferred_message
 from datamodel_code_generator.__main__ import Exit, main
 from datamodel_code_generator.arguments import arg_parser
+from datamodel_code_generator.http import get_bodies
 from tests.conftest import assert_error_message, create_assert_file_content, freeze_time
 from tests.main.conftest import run_main_and_assert, run_main_with_args
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from pytest_mock import MockerFixture
 
 DATA_PATH: Path = Path(__file__).parent / "data"
@@ -1804,6 +1812,190 @@ def test_http_timeout(output_file: Path) -> None:
         assert call_kwargs.get("timeout") == 60.0
 
 
+@pytest.fixture
+def schema_server() -> Iterator[tuple[str, list[tuple[str, int]]]]:
+    """Serve the http_prefetch schemas over HTTP, yielding the base URL and the (path, status) of each request."""
+    requested: list[tuple[str, int]] = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_request(self, code: int | str = "-", size: int | str = "-") -> None:  # noqa: ARG002
+            requested.append((self.path, int(code)))
+
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(Handler, directory=str(JSON_SCHEMA_DATA_PATH / "http_prefetch"))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", requested
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.mark.cli_doc(
+    options=["--http-prefetch"],
+    option_description="""Fetch remote $ref documents concurrently before parsing.
+
+The `--http-prefetch` flag scans the `$ref` values of the input for remote documents,
+fetches them concurrently over a shared pool of connections, then repeats with the
+documents it fetched until no new one turns up. Parsing then reads them from memory
+instead of fetching each one serially when it is first referenced.""",
+    input_schema="jsonschema/http_prefetch/person.json",
+    cli_args=["--url", "https://schemas.example.com/person.json", "--http-prefetch"],
+    golden_output="main_kr/http_prefetch/output.py",
+)
+def test_http_prefetch(output_file: Path, schema_server: tuple[str, list[tuple[str, int]]]) -> None:
+    """Fetch remote $ref documents concurrently before parsing.
+
+    The `--http-prefetch` flag scans the `$ref` values of the input for remote documents,
+    fetches them concurrently over a shared pool of connections, then repeats with the
+    documents it fetched until no new one turns up. Parsing then reads them from memory
+    instead of fetching each one serially when it is first referenced.
+    """
+    base_url, requested = schema_server
+    return_code = main([
+        "--url",
+        f"{base_url}/person.json",
+        "--output",
+        str(output_file),
+        "--input-file-type",
+        "jsonschema",
+        "--custom-file-header",
+        "# generated by datamodel-codegen",
+        "--http-prefetch",
+    ])
+    assert return_code == Exit.OK
+    assert_file_content(output_file, "http_prefetch/output.py")
+    assert sorted(requested) == [
+        ("/definitions/friend.json", 200),
+        ("/definitions/pet.json", 200),
+        ("/definitions/toy/toy.json", 200),
+        ("/person.json", 200),
+    ]
+
+
+def _http_cache_args(base_url: str, output_file: Path, cache_dir: Path) -> list[str]:
+    return [
+        "--url",
+        f"{base_url}/person.json",
+        "--output",
+        str(output_file),
+        "--input-file-type",
+        "jsonschema",
+        "--custom-file-header",
+        "# generated by datamodel-codegen",
+        "--http-cache-dir",
+        str(cache_dir),
+    ]
+
+
+@pytest.mark.cli_doc(
+    options=["--http-cache-dir"],
+    option_description="""Cache remote documents on disk and revalidate them.
+
+The `--http-cache-dir` option stores every document fetched over HTTP(S) in the given
+directory, keyed by URL, `--http-headers` and `--http-query-parameters`. Later runs send
+the stored ETag and Last-Modified values as a conditional request and reuse the stored
+document when the server answers 304 Not Modified or can not be reached.""",
+    input_schema="jsonschema/http_prefetch/person.json",
+    cli_args=["--url", "https://schemas.example.com/person.json", "--http-cache-dir", ".http-cache"],
+    golden_output="main_kr/http_prefetch/output.py",
+)
+def test_http_cache_dir(output_file: Path, tmp_path: Path, schema_server: tuple[str, list[tuple[str, int]]]) -> None:
+    """Cache remote documents on disk and revalidate them.
+
+    The `--http-cache-dir` option stores every document fetched over HTTP(S) in the given
+    directory, keyed by URL, `--http-headers` and `--http-query-parameters`. Later runs send
+    the stored ETag and Last-Modified values as a conditional request and reuse the stored
+    document when the server answers 304 Not Modified or can not be reached.
+    """
+    base_url, requested = schema_server
+    args = _http_cache_args(base_url, output_file, tmp_path / "http-cache")
+    documents = ["/definitions/friend.json", "/definitions/pet.json", "/definitions/toy/toy.json", "/person.json"]
+
+    assert main(args) == Exit.OK
+    assert sorted(requested) == [(path, 200) for path in documents]
+
+    requested.clear()
+    assert main(args) == Exit.OK
+    assert sorted(requested) == [(path, 304) for path in documents]
+    assert_file_content(output_file, "http_prefetch/output.py")
+
+
+@pytest.mark.cli_doc(
+    options=["--http-offline"],
+    option_description="""Serve remote documents only from the HTTP cache.
+
+The `--http-offline` flag requires `--http-cache-dir`. Remote documents are served
+from the cache only, however old they are, and a document that was never fetched
+is an error. Useful on runners without network access.""",
+    input_schema="jsonschema/http_prefetch/person.json",
+    cli_args=[
+        "--url",
+        "https://schemas.example.com/person.json",
+        "--http-cache-dir",
+        ".http-cache",
+        "--http-offline",
+    ],
+    golden_output="main_kr/http_prefetch/output.py",
+)
+def test_http_offline(output_file: Path, tmp_path: Path, schema_server: tuple[str, list[tuple[str, int]]]) -> None:
+    """Serve remote documents only from the HTTP cache.
+
+    The `--http-offline` flag requires `--http-cache-dir`. Remote documents are served
+    from the cache only, however old they are, and a document that was never fetched
+    is an error. Useful on runners without network access.
+    """
+    base_url, requested = schema_server
+    args = _http_cache_args(base_url, output_file, tmp_path / "http-cache")
+    assert main(args) == Exit.OK
+    output_file.unlink()
+
+    requested.clear()
+    assert main([*args, "--http-offline"]) == Exit.OK
+    assert not requested
+    assert_file_content(output_file, "http_prefetch/output.py")
+
+    other_output = tmp_path / "other.py"
+    assert main([*_http_cache_args(base_url, other_output, tmp_path / "empty-cache"), "--http-offline"]) == Exit.ERROR
+    assert not requested
+
+
+def test_http_offline_requires_http_cache_dir(output_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """--http-offline has nothing to serve from without --http-cache-dir."""
+    return_code = main([
+        "--url",
+        "https://schemas.example.com/person.json",
+        "--output",
+        str(output_file),
+        "--http-offline",
+    ])
+    assert return_code == Exit.ERROR
+    assert "http_offline can not be used without http_cache_dir." in capsys.readouterr().err
+
+
+def test_generate_http_offline_requires_http_cache_dir() -> None:
+    """generate() rejects offline mode without a cache instead of ignoring it."""
+    url = urlparse("https://schemas.example.com/person.json")
+    with pytest.raises(Error, match="http_offline can not be used without http_cache_dir"):
+        generate(url, input_file_type=InputFileType.JsonSchema, http_offline=True)
+
+
+def test_get_bodies_skips_failed_requests(schema_server: tuple[str, list[tuple[str, int]]]) -> None:
+    """URLs that cannot be fetched are left out of the result."""
+    base_url, _ = schema_server
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        closed_url = f"http://127.0.0.1:{sock.getsockname()[1]}/person.json"
+
+    bodies = get_bodies([f"{base_url}/definitions/pet.json", closed_url])
+
+    assert list(bodies) == [f"{base_url}/definitions/pet.json"]
+    assert '"title": "Pet"' in bodies[f"{base_url}/definitions/pet.json"]
+
+
 @pytest.mark.cli_doc(
     options=["--ignore-pyproject"],
     option_description="""Ignore pyproject.toml configuration file.
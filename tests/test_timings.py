@@ -0,0 +1,79 @@
+"""Tests for the per-phase timings recorder."""
+
+from __future__ import annotations
+
+import tracemalloc
+
+from datamodel_code_generator.timings import Timings, format_timings_report, record_timings, timed, timed_phase
+
+
+@timed()
+def _countdown(n: int) -> int:
+    with timed_phase("step"):
+        return n if n == 0 else _countdown(n - 1)
+
+
+def test_timed_phases_nest_and_count_recursion_once() -> None:
+    """Nested phases are recorded under their parent and recursive calls only at the outermost one."""
+    timings = Timings()
+    with record_timings(timings), timings.phase("run"):
+        _countdown(3)
+        _countdown(1)
+
+    assert [(timing.path, timing.calls) for timing in timings.phases.values()] == [
+        (("run",), 1),
+        (("run", "_countdown"), 2),
+        (("run", "_countdown", "step"), 2),
+    ]
+    assert not tracemalloc.is_tracing()
+
+
+def test_timed_is_a_no_op_without_active_recorder() -> None:
+    """Without record_timings nothing is measured."""
+    assert _countdown(2) == 0
+
+
+def test_peak_memory_is_propagated_to_parent_phases() -> None:
+    """A parent phase reports at least the peak of its children."""
+    timings = Timings()
+    with record_timings(timings), timings.phase("outer"):
+        with timings.phase("allocate"):
+            data = bytearray(4 * 1024 * 1024)
+            del data
+        with timings.phase("idle"):
+            pass
+
+    outer, allocate, idle = timings.phases.values()
+    assert allocate.peak_memory >= 4 * 1024 * 1024
+    assert outer.peak_memory >= allocate.peak_memory
+    assert idle.peak_memory < allocate.peak_memory
+
+
+def test_format_timings_report() -> None:
+    """The table indents children under their parent phase."""
+    report = {
+        "version": 1,
+        "phases": [
+            {"name": "generate", "path": ["generate"], "calls": 1, "seconds": 1.5, "peak_memory": 3 * 1024 * 1024},
+            {"name": "render", "path": ["generate", "render"], "calls": 2, "seconds": 0.25, "peak_memory": 512},
+        ],
+    }
+    assert format_timings_report(report) == (
+        "Phase     Calls  Time (s)  Peak memory\n"
+        "--------  -----  --------  -----------\n"
+        "generate      1     1.500      3.0 MiB\n"
+        "  render      2     0.250      512.0 B"
+    )
+
+
+def test_record_timings_without_memory_tracing() -> None:
+    """With trace_memory=False phases are timed but no memory is traced."""
+    timings = Timings()
+    with record_timings(timings, trace_memory=False), timings.phase("run"):
+        assert not tracemalloc.is_tracing()
+        data = bytearray(1024 * 1024)
+        del data
+
+    (run,) = timings.phases.values()
+    assert run.calls == 1
+    assert run.peak_memory == 0
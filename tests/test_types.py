@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from datamodel_code_generator.types import (
@@ -11,6 +14,7 @@ from datamodel_code_generator.types import (
     get_subscript_args,
     get_type_base_name,
 )
+from datamodel_code_generator.util import is_pydantic_v2
 
 
 @pytest.mark.parametrize(
@@ -281,6 +285,39 @@ def test_datatype_deepcopy_memo_cache_hit() -> None:
     assert copied2 is copied1  # Same object from memo
 
 
+@pytest.mark.skipif(not is_pydantic_v2(), reason="model_fields_set and model_dump require pydantic v2")
+def test_datatype_tracks_fields_set() -> None:
+    """DataType records explicitly set fields in a shared set, so dumping with exclude_unset keeps them."""
+    from datamodel_code_generator.model.base import DataModelFieldBase  # noqa: F401
+    from datamodel_code_generator.reference import _SharedFieldsSet
+    from datamodel_code_generator.types import DataType
+
+    data_type = DataType(type="TestType", is_optional=True)
+    other = DataType(type="OtherType", is_optional=False)
+    assert type(data_type.model_fields_set) is _SharedFieldsSet
+    assert data_type.model_fields_set is other.model_fields_set
+
+    data_type.is_list = True
+
+    assert data_type.model_fields_set == {"type", "is_optional", "is_list"}
+    assert other.model_fields_set == {"type", "is_optional"}
+    assert data_type.model_dump(exclude_unset=True, exclude={"parent", "children"}) == {
+        "type": "TestType",
+        "is_optional": True,
+        "is_list": True,
+    }
+    with pytest.raises(TypeError, match="shared fields set"):
+        data_type.model_fields_set.update({"is_dict"})
+
+    for copied in (copy.copy(data_type), copy.deepcopy(data_type), pickle.loads(pickle.dumps(data_type))):
+        assert "is_list" in copied.model_fields_set
+    copied = data_type.model_copy(update={"is_dict": True})
+    assert copied.model_fields_set >= {"type", "is_optional", "is_list", "is_dict"}
+    assert data_type.model_fields_set == {"type", "is_optional", "is_list"}
+    assert copy.deepcopy(data_type).model_fields_set >= {"type", "is_optional", "is_list"}
+    assert pickle.loads(pickle.dumps(data_type)).model_fields_set == data_type.model_fields_set
+
+
 @pytest.mark.parametrize(
     ("type_str", "expected"),
     [